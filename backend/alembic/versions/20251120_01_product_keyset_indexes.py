@@ -0,0 +1,46 @@
+"""product keyset pagination indexes
+
+Revision ID: 20251120_01
+Revises: 20251119_01
+Create Date: 2025-11-20 09:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20251120_01"
+down_revision = "20251119_01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Her index, crud.product.get_multi içindeki bir sıralamanın (kolon, id) ORDER BY'ı ile birebir eşleşir
+    op.create_index(
+        "ix_products_created_at_id",
+        "products",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "ix_products_price_asc_id",
+        "products",
+        [sa.text("price ASC NULLS LAST"), sa.text("id ASC")],
+    )
+    op.create_index(
+        "ix_products_price_desc_id",
+        "products",
+        [sa.text("price DESC NULLS LAST"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "ix_products_rating_desc_id",
+        "products",
+        [sa.text("average_rating DESC NULLS LAST"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_products_rating_desc_id", table_name="products")
+    op.drop_index("ix_products_price_desc_id", table_name="products")
+    op.drop_index("ix_products_price_asc_id", table_name="products")
+    op.drop_index("ix_products_created_at_id", table_name="products")
@@ -0,0 +1,70 @@
+"""product full-text and trigram search
+
+Revision ID: 20251121_01
+Revises: 20251120_01
+Create Date: 2025-11-21 09:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "20251121_01"
+down_revision = "20251120_01"
+branch_labels = None
+depends_on = None
+
+# app.services.search.fold ile aynı eşleme; IMMUTABLE olduğu için üretilmiş kolonlarda ve index'lerde kullanılabilir
+FOLD_FUNCTION = """
+CREATE OR REPLACE FUNCTION yorumator_fold(text) RETURNS text
+LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE
+AS $$ SELECT lower(translate($1, 'ıİşŞğĞçÇöÖüÜ', 'iIsSgGcCoOuU')) $$
+"""
+
+SEARCH_TEXT_SQL = "yorumator_fold(brand || ' ' || model || ' ' || coalesce(sku, ''))"
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple'::regconfig, yorumator_fold(brand || ' ' || model)), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, yorumator_fold(coalesce(sku, ''))), 'B') || "
+    "setweight(to_tsvector('simple'::regconfig, yorumator_fold(coalesce(specs::text, ''))), 'C')"
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(FOLD_FUNCTION)
+
+    op.add_column(
+        "products",
+        sa.Column("search_text", sa.Text(), sa.Computed(SEARCH_TEXT_SQL, persisted=True), nullable=True),
+    )
+    op.add_column(
+        "products",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_SQL, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_products_search_vector",
+        "products",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_products_search_text_trgm",
+        "products",
+        ["search_text"],
+        postgresql_using="gin",
+        postgresql_ops={"search_text": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_products_search_text_trgm", table_name="products")
+    op.drop_index("ix_products_search_vector", table_name="products")
+    op.drop_column("products", "search_vector")
+    op.drop_column("products", "search_text")
+    op.execute("DROP FUNCTION IF EXISTS yorumator_fold(text)")
@@ -0,0 +1,59 @@
+"""incremental product rating aggregates
+
+Revision ID: 20251122_01
+Revises: 20251121_01
+Create Date: 2025-11-22 09:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20251122_01"
+down_revision = "20251121_01"
+branch_labels = None
+depends_on = None
+
+AGGREGATE_COLUMNS = ["rating_sum", *[f"rating_{star}_count" for star in range(1, 6)]]
+
+
+def upgrade() -> None:
+    for name in AGGREGATE_COLUMNS:
+        op.add_column(
+            "products",
+            sa.Column(name, sa.Integer(), nullable=False, server_default=sa.text("0")),
+        )
+
+    # Mevcut onaylı yorumlardan başlangıç değerlerini doldur
+    op.execute(
+        """
+        UPDATE products AS p
+        SET review_count = agg.review_count,
+            rating_sum = agg.rating_sum,
+            rating_1_count = agg.r1,
+            rating_2_count = agg.r2,
+            rating_3_count = agg.r3,
+            rating_4_count = agg.r4,
+            rating_5_count = agg.r5,
+            average_rating = round(agg.rating_sum::numeric / agg.review_count, 2)
+        FROM (
+            SELECT product_id,
+                   count(*) AS review_count,
+                   sum(rating) AS rating_sum,
+                   count(*) FILTER (WHERE rating = 1) AS r1,
+                   count(*) FILTER (WHERE rating = 2) AS r2,
+                   count(*) FILTER (WHERE rating = 3) AS r3,
+                   count(*) FILTER (WHERE rating = 4) AS r4,
+                   count(*) FILTER (WHERE rating = 5) AS r5
+            FROM reviews
+            WHERE status = 'approved'
+            GROUP BY product_id
+        ) AS agg
+        WHERE p.id = agg.product_id
+        """
+    )
+
+
+def downgrade() -> None:
+    for name in reversed(AGGREGATE_COLUMNS):
+        op.drop_column("products", name)
@@ -0,0 +1,28 @@
+"""favorite products keyset index
+
+Revision ID: 20251123_01
+Revises: 20251122_01
+Create Date: 2025-11-23 09:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20251123_01"
+down_revision = "20251122_01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # /users/me/favorites: user_id eşitliği + (created_at, id) DESC keyset
+    op.create_index(
+        "ix_favorite_products_user_created_id",
+        "favorite_products",
+        ["user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_favorite_products_user_created_id", table_name="favorite_products")
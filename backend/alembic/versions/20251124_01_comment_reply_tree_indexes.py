@@ -0,0 +1,32 @@
+"""comment reply tree indexes
+
+Revision ID: 20251124_01
+Revises: 20251123_01
+Create Date: 2025-11-24 09:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20251124_01"
+down_revision = "20251123_01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Recursive CTE'nin her adımı parent_reply_id üzerinden çocukları arar
+    op.create_index("ix_comment_replies_parent", "comment_replies", ["parent_reply_id"])
+    # En üst seviye başlıkların (created_at, id) keyset sayfalaması
+    op.create_index(
+        "ix_comment_replies_review_roots",
+        "comment_replies",
+        ["review_id", "created_at", "id"],
+        postgresql_where=sa.text("parent_reply_id IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_comment_replies_review_roots", table_name="comment_replies")
+    op.drop_index("ix_comment_replies_parent", table_name="comment_replies")
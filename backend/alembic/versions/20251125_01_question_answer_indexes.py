@@ -0,0 +1,35 @@
+"""question and answer listing indexes
+
+Revision ID: 20251125_01
+Revises: 20251124_01
+Create Date: 2025-11-25 09:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20251125_01"
+down_revision = "20251124_01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Ürün soruları: product_id eşitliği + (created_at, id) DESC keyset
+    op.create_index(
+        "ix_questions_product_created_id",
+        "questions",
+        ["product_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    # Soru başına en faydalı cevaplar (row_number penceresi bu sırayla hesaplanır)
+    op.create_index(
+        "ix_answers_question_helpful",
+        "answers",
+        ["question_id", sa.text("helpful_count DESC"), "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_answers_question_helpful", table_name="answers")
+    op.drop_index("ix_questions_product_created_id", table_name="questions")
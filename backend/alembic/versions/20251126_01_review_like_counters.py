@@ -0,0 +1,41 @@
+"""denormalized review like counters
+
+Revision ID: 20251126_01
+Revises: 20251125_01
+Create Date: 2025-11-26 09:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20251126_01"
+down_revision = "20251125_01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("reviews", sa.Column("like_count", sa.Integer(), nullable=False, server_default=sa.text("0")))
+    op.add_column("reviews", sa.Column("dislike_count", sa.Integer(), nullable=False, server_default=sa.text("0")))
+
+    op.execute(
+        """
+        UPDATE reviews AS r
+        SET like_count = agg.like_count,
+            dislike_count = agg.dislike_count
+        FROM (
+            SELECT review_id,
+                   count(*) FILTER (WHERE is_like) AS like_count,
+                   count(*) FILTER (WHERE NOT is_like) AS dislike_count
+            FROM review_likes
+            GROUP BY review_id
+        ) AS agg
+        WHERE r.id = agg.review_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("reviews", "dislike_count")
+    op.drop_column("reviews", "like_count")
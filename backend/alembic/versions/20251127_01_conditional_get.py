@@ -0,0 +1,38 @@
+"""conditional GET validators: categories.updated_at and version indexes
+
+Revision ID: 20251127_01
+Revises: 20251126_01
+Create Date: 2025-11-27 09:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20251127_01"
+down_revision = "20251126_01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "categories",
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.text("(now() AT TIME ZONE 'utc')")),
+    )
+    # /products/brands/ doğrulayıcısı: max(updated_at) tek index adımıyla okunur
+    op.create_index("ix_products_updated_at", "products", ["updated_at"])
+    # Ürün yorum listesi (product_id, status, created_at DESC) ile sıralanır; updated_at INCLUDE edilerek
+    # sürüm sorgusu (count, max(updated_at)) index-only taramayla karşılanır
+    op.create_index(
+        "ix_reviews_product_status_created",
+        "reviews",
+        ["product_id", "status", sa.text("created_at DESC")],
+        postgresql_include=["updated_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reviews_product_status_created", table_name="reviews")
+    op.drop_index("ix_products_updated_at", table_name="products")
+    op.drop_column("categories", "updated_at")
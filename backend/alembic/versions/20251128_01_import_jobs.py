@@ -0,0 +1,66 @@
+"""import_jobs table for background catalog imports
+
+Revision ID: 20251128_01
+Revises: 20251127_01
+Create Date: 2025-11-28 09:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "20251128_01"
+down_revision = "20251127_01"
+branch_labels = None
+depends_on = None
+
+
+import_job_status_enum = postgresql.ENUM(
+    "queued",
+    "running",
+    "completed",
+    "failed",
+    name="importjobstatusenum",
+    create_type=False,
+)
+
+
+def upgrade() -> None:
+    import_job_status_enum.create(op.get_bind(), checkfirst=True)
+    op.create_table(
+        "import_jobs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("source", sa.String(length=120), nullable=True),
+        sa.Column("format", sa.String(length=10), nullable=False),
+        sa.Column("filename", sa.String(length=255), nullable=True),
+        sa.Column("file_path", sa.Text(), nullable=False),
+        sa.Column("total_bytes", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("status", import_job_status_enum, nullable=False, server_default=sa.text("'queued'")),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("checkpoint_offset", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("checkpoint_line", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("total_rows", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("imported", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("failed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("errors", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("errors_truncated", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("run_started_at", sa.DateTime(), nullable=True),
+        sa.Column("run_start_offset", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("run_start_rows", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(["created_by"], ["users.id"], ondelete="SET NULL"),
+    )
+    # Yarıda kalan işler başlangıçta status üzerinden bulunur
+    op.create_index("ix_import_jobs_status", "import_jobs", ["status"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_import_jobs_status", table_name="import_jobs")
+    op.drop_table("import_jobs")
+    import_job_status_enum.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,103 @@
+"""product fingerprint for duplicate detection and import upserts
+
+Revision ID: 20251129_01
+Revises: 20251128_01
+Create Date: 2025-11-29 09:00:00
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20251129_01"
+down_revision = "20251128_01"
+branch_labels = None
+depends_on = None
+
+_BATCH_SIZE = 1000
+
+# app.services.fingerprint'in bu migrasyon yazıldığı andaki kopyası: uygulama kodu sonradan değişse de
+# migrasyon yeniden çalıştırıldığında aynı parmak izlerini üretir
+_TURKISH_FOLD = str.maketrans("ıİşŞğĞçÇöÖüÜ", "iIsSgGcCoOuU")
+
+
+def _text(value):
+    return " ".join(str(value).translate(_TURKISH_FOLD).lower().split())
+
+
+def _normalize(value):
+    if isinstance(value, dict):
+        return {_text(key): _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    if isinstance(value, str):
+        return _text(value)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _fingerprint(brand, model, specs) -> str:
+    payload = json.dumps(
+        [_text(brand), _text(model), _normalize(specs or {})],
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def upgrade() -> None:
+    op.add_column("products", sa.Column("fingerprint", sa.String(length=40), nullable=True))
+    op.add_column("import_jobs", sa.Column("updated", sa.Integer(), nullable=False, server_default="0"))
+
+    # Eski kopyalardan yalnızca en eskisi parmak izini alır; diğerleri NULL kalır ve unique index'e takılmaz
+    bind = op.get_bind()
+    products = sa.table(
+        "products",
+        sa.column("id"),
+        sa.column("brand"),
+        sa.column("model"),
+        sa.column("specs"),
+        sa.column("created_at"),
+        sa.column("fingerprint"),
+    )
+    oldest: dict[str, tuple] = {}
+    last_id = None
+    while True:
+        # id üzerinden keyset ile gruplar halinde oku; tablo belleğe tek seferde alınmaz
+        query = sa.select(
+            products.c.id, products.c.brand, products.c.model, products.c.specs, products.c.created_at
+        ).order_by(products.c.id).limit(_BATCH_SIZE)
+        if last_id is not None:
+            query = query.where(products.c.id > last_id)
+        rows = bind.execute(query).all()
+        if not rows:
+            break
+        for product_id, brand, model, specs, created_at in rows:
+            value = _fingerprint(brand, model, specs)
+            key = (created_at is None, created_at, str(product_id))
+            if value not in oldest or key < oldest[value][0]:
+                oldest[value] = (key, product_id)
+        last_id = rows[-1][0]
+
+    update = (
+        products.update()
+        .where(products.c.id == sa.bindparam("product_id"))
+        .values(fingerprint=sa.bindparam("value"))
+    )
+    pending = [{"product_id": product_id, "value": value} for value, (_, product_id) in oldest.items()]
+    for start in range(0, len(pending), _BATCH_SIZE):
+        bind.execute(update, pending[start:start + _BATCH_SIZE])
+
+    op.create_index("ix_products_fingerprint", "products", ["fingerprint"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_products_fingerprint", table_name="products")
+    op.drop_column("import_jobs", "updated")
+    op.drop_column("products", "fingerprint")
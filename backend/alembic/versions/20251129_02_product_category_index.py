@@ -0,0 +1,29 @@
+"""product category listing index
+
+Revision ID: 20251129_02
+Revises: 20251129_01
+Create Date: 2025-11-29 12:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20251129_02"
+down_revision = "20251129_01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # category_id = X ve alt ağaç için category_id IN (...) filtreleri; tek kategoride varsayılan
+    # (created_at, id) sıralaması da index sırasından okunur
+    op.create_index(
+        "ix_products_category_created_at_id",
+        "products",
+        ["category_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_products_category_created_at_id", table_name="products")
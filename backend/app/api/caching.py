@@ -0,0 +1,95 @@
+"""HTTP koşullu GET (ETag / Last-Modified) yardımcıları ve merkezi Cache-Control politikaları.
+
+Route'lar gövdeyi kurmadan önce ucuz bir doğrulayıcı (``updated_at``, sayaçlar) hesaplar; istemcinin
+elindeki sürüm hâlâ geçerliyse gövde okunmadan/serileştirilmeden 304 döner.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response, status
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# Route şablonu -> Cache-Control. CachePolicyMiddleware, GET/HEAD 200 ve 304 yanıtlarına uygular.
+CACHE_POLICIES = {
+    f"{settings.api_v1_str}/products/{{product_id}}": "public, max-age=60",
+    f"{settings.api_v1_str}/products/brands/": "public, max-age=300",
+    f"{settings.api_v1_str}/categories/": "public, max-age=300",
+    # Yeni yorumlar hemen görünmeli: her seferinde doğrula (ucuz 304)
+    f"{settings.api_v1_str}/products/{{product_id}}/reviews": "public, no-cache",
+}
+
+
+def make_etag(*parts) -> str:
+    """Doğrulayıcı parçalarından zayıf bir ETag üret (gövde baytlarına değil, sürüme dayanır)."""
+    digest = hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Modellerdeki zaman damgaları naive UTC (datetime.utcnow) olarak tutuluyor
+    value = value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+    return value.replace(microsecond=0)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # Zayıf karşılaştırma: W/ öneki yok sayılır
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def is_not_modified(request: Request, etag: str, last_modified: datetime | None = None) -> bool:
+    """If-None-Match varsa yalnızca ona, yoksa If-Modified-Since'e bakılır (RFC 9110 13.2.2)."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            return False
+        return _as_utc(last_modified) <= since.astimezone(timezone.utc)
+    return False
+
+
+def set_validators(response: Response, etag: str, last_modified: datetime | None = None) -> Response:
+    response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    return response
+
+
+def not_modified(etag: str, last_modified: datetime | None = None) -> Response:
+    return set_validators(Response(status_code=status.HTTP_304_NOT_MODIFIED), etag, last_modified)
+
+
+class CachePolicyMiddleware:
+    """CACHE_POLICIES'teki route'ların başarılı GET yanıtlarına Cache-Control ekler."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and message["status"] in (200, 304):
+                route = scope.get("route")
+                policy = CACHE_POLICIES.get(getattr(route, "path", None))
+                if policy:
+                    headers = [(k, v) for k, v in message.get("headers", []) if k.lower() != b"cache-control"]
+                    headers.append((b"cache-control", policy.encode("latin-1")))
+                    message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,13 +1,19 @@
-from typing import Generator
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncGenerator, Generator
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.cache import TTLCache
 from app.core.config import get_settings
 from app.core.security import verify_totp
-from app.db.session import get_db
+from app.db import replicas
+from app.db.session import get_async_db, get_db
 from app.models.user import User
 
 settings = get_settings()
@@ -15,31 +21,144 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.api_v1_str}/auth/login
 oauth2_scheme_optional = OAuth2PasswordBearer(tokenUrl=f"{settings.api_v1_str}/auth/login", auto_error=False)
 
 
+@dataclass(frozen=True)
+class CurrentUser:
+    """Kimliği doğrulanmış kullanıcının önbelleğe alınan, salt okunur görüntüsü.
+
+    Yalnızca yetkilendirme kararları için gereken alanları tutar; profil verisi (e-posta, ad, zaman
+    damgaları) önbelleğe alınmaz. Profil döndüren endpoint'ler ``get_current_user_profile`` ile güncel
+    satırı yükler. Kullanıcı satırını değiştiren endpoint'ler ardından ``invalidate_cached_user`` çağırır.
+    """
+
+    id: uuid.UUID
+    is_active: bool
+    is_superuser: bool
+    two_factor_enabled: bool
+    deleted_at: datetime | None
+
+    @classmethod
+    def from_model(cls, user: User) -> "CurrentUser":
+        return cls(
+            id=user.id,
+            is_active=bool(user.is_active),
+            is_superuser=bool(user.is_superuser),
+            two_factor_enabled=bool(user.two_factor_enabled),
+            deleted_at=user.deleted_at,
+        )
+
+
+user_cache = TTLCache(maxsize=settings.auth_user_cache_size, ttl=settings.auth_user_cache_ttl_seconds)
+
+
 def get_db_session() -> Generator[Session, None, None]:
     yield from get_db()
 
 
-def get_current_user(
-    db: Session = Depends(get_db_session),
-    token: str = Depends(oauth2_scheme),
-) -> User:
-    credentials_exception = HTTPException(
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    async for db in get_async_db():
+        yield db
+
+
+def get_read_db_session(request: Request) -> Generator[Session, None, None]:
+    """Salt okunur GET endpoint'leri için oturum: uygun bir replika, yoksa (veya istemci yeni yazdıysa) primary."""
+    db = replicas.read_session(replicas.is_pinned(request))
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    db = await replicas.async_read_session(replicas.is_pinned(request))
+    async with db:
+        yield db
+
+
+def _access_token_subject(token: str) -> str | None:
+    """Geçerli bir access token'ın ``sub`` değerini döndür; aksi halde None."""
+    try:
+        payload = jwt.decode(token, settings.secret_key, algorithms=["HS256"])
+    except JWTError:
+        return None
+    if payload.get("type") != "access":
+        return None
+    return payload.get("sub")
+
+
+def _cache_user(user_id: str, user: User | None) -> CurrentUser | None:
+    if not user:
+        return None
+    current_user = CurrentUser.from_model(user)
+    user_cache.set(user_id, current_user)
+    return current_user
+
+
+def _resolve_user(db: Session, user_id: str) -> CurrentUser | None:
+    cached = user_cache.get(user_id)
+    if cached is not None:
+        return cached
+    try:
+        user_uuid = uuid.UUID(user_id)
+    except ValueError:
+        return None
+    return _cache_user(user_id, db.get(User, user_uuid))
+
+
+async def _resolve_user_async(db: AsyncSession, user_id: str) -> CurrentUser | None:
+    cached = user_cache.get(user_id)
+    if cached is not None:
+        return cached
+    try:
+        user_uuid = uuid.UUID(user_id)
+    except ValueError:
+        return None
+    return _cache_user(user_id, await db.get(User, user_uuid))
+
+
+def invalidate_cached_user(user_id) -> None:
+    """Kimlikle ilgili alanlar (aktiflik, yetki, silinme, 2FA) değiştiğinde çağrılmalıdır."""
+    user_cache.invalidate(str(user_id))
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=["HS256"])
-        user_id: str | None = payload.get("sub")
-        token_type: str | None = payload.get("type")
-        if user_id is None or token_type != "access":
-            raise credentials_exception
-    except JWTError as exc:  # pragma: no cover
-        raise credentials_exception from exc
-
-    user = db.get(User, user_id)
+
+
+def get_current_user(
+    db: Session = Depends(get_db_session),
+    token: str = Depends(oauth2_scheme),
+) -> CurrentUser:
+    user_id = _access_token_subject(token)
+    user = _resolve_user(db, user_id) if user_id else None
+    if not user:
+        raise _credentials_exception()
+    return user
+
+
+def get_current_user_profile(
+    current_user: CurrentUser = Depends(get_current_user),
+    db: Session = Depends(get_db_session),
+) -> User:
+    """Profil alanları (e-posta, ad, zaman damgaları) gereken endpoint'ler için kullanıcının güncel satırı."""
+    user = db.get(User, current_user.id)
+    if not user:
+        raise _credentials_exception()
+    return user
+
+
+async def get_current_user_async(
+    db: AsyncSession = Depends(get_async_db_session),
+    token: str = Depends(oauth2_scheme),
+) -> CurrentUser:
+    """get_current_user'ın async route'lar için karşılığı; önbellek ıskasında AsyncSession kullanır."""
+    user_id = _access_token_subject(token)
+    user = await _resolve_user_async(db, user_id) if user_id else None
     if not user:
-        raise credentials_exception
+        raise _credentials_exception()
     return user
 
 
@@ -52,19 +171,23 @@ def enforce_totp(user: User, otp: str | None) -> None:
 def get_current_user_optional(
     db: Session = Depends(get_db_session),
     token: str | None = Depends(oauth2_scheme_optional),
-) -> User | None:
+) -> CurrentUser | None:
     """Opsiyonel JWT token kontrolü - token varsa kullanıcıyı döndürür, yoksa None döndürür."""
     if not token:
         return None
-    
-    try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=["HS256"])
-        user_id: str | None = payload.get("sub")
-        token_type: str | None = payload.get("type")
-        if user_id is None or token_type != "access":
-            return None
-    except JWTError:
+    user_id = _access_token_subject(token)
+    if user_id is None:
         return None
+    return _resolve_user(db, user_id)
+
 
-    user = db.get(User, user_id)
-    return user if user else None
+async def get_current_user_optional_async(
+    db: AsyncSession = Depends(get_async_db_session),
+    token: str | None = Depends(oauth2_scheme_optional),
+) -> CurrentUser | None:
+    if not token:
+        return None
+    user_id = _access_token_subject(token)
+    if user_id is None:
+        return None
+    return await _resolve_user_async(db, user_id)
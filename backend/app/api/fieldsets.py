@@ -0,0 +1,32 @@
+"""``fields=`` ile seyrek alan seçimi (sparse fieldsets).
+
+Liste route'ları istenen alanları hem SELECT'e (``load_only``) hem de çıktıya yansıtır; böylece ızgara
+görünümü gibi istemciler ``specs`` gibi büyük kolonları ne veritabanından çeker ne de serileştirir.
+"""
+from typing import Any, Callable, Iterable, Mapping
+
+# Her zaman döner: istemcinin detay sayfasına bağlanabilmesi için gerekli
+ALWAYS_INCLUDED = ("id",)
+
+
+def parse_fields(raw: str | None, allowed: Iterable[str]) -> tuple[str, ...] | None:
+    """``"brand,model,price"`` -> ("id", "brand", "model", "price"); parametre yoksa None (tüm alanlar).
+
+    Bilinmeyen alan adlarında ValueError fırlatır.
+    """
+    if raw is None or not raw.strip():
+        return None
+    allowed = tuple(allowed)
+    requested = [name.strip() for name in raw.split(",") if name.strip()]
+    unknown = sorted(set(requested) - set(allowed))
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(allowed)}")
+    fields = [name for name in ALWAYS_INCLUDED if name in allowed]
+    fields += [name for name in requested if name not in fields]
+    return tuple(fields)
+
+
+def project(obj: Any, fields: Iterable[str], getters: Mapping[str, Callable[[Any], Any]] | None = None) -> dict:
+    """Nesneden yalnızca istenen alanları içeren bir sözlük kur; hesaplanan alanlar ``getters`` ile verilir."""
+    getters = getters or {}
+    return {name: getters[name](obj) if name in getters else getattr(obj, name) for name in fields}
@@ -1,28 +1,32 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from jose import JWTError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.api import deps
 from app.core.security import (
     create_access_token,
+    PasswordHashingBusy,
     create_refresh_token,
     decode_token,
     generate_2fa_secret,
     get_totp_uri,
 )
 from app.crud import user as user_crud
+from app.models.user import User
 from app.schemas import auth as auth_schema
 from app.schemas.user import UserRead, UserCreate
 
 router = APIRouter()
 
 
+# login/register async: Argon2 parola havuzunda await edilir, istek threadpool'undan thread tutulmaz
 @router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
-def register(payload: auth_schema.RegisterRequest, db: Session = Depends(deps.get_db_session)):
+async def register(payload: auth_schema.RegisterRequest, db: AsyncSession = Depends(deps.get_async_db_session)):
     try:
         # Email kontrolü
-        existing_user = user_crud.get_by_email(db, payload.email)
+        existing_user = await user_crud.get_by_email_async(db, payload.email)
         if existing_user:
             raise HTTPException(status_code=400, detail="Email already registered")
 
@@ -35,7 +39,7 @@ def register(payload: auth_schema.RegisterRequest, db: Session = Depends(deps.ge
         )
         
         # Kullanıcı oluştur
-        user = user_crud.create(db, user_in=user_in)
+        user = await user_crud.create_async(db, user_in=user_in)
         
         # UUID'yi string'e çevirerek UserRead oluştur
         user_read = UserRead(
@@ -50,7 +54,7 @@ def register(payload: auth_schema.RegisterRequest, db: Session = Depends(deps.ge
         )
         
         return user_read
-    except HTTPException:
+    except (HTTPException, PasswordHashingBusy):
         raise
     except Exception as e:
         import traceback
@@ -66,8 +70,10 @@ def register(payload: auth_schema.RegisterRequest, db: Session = Depends(deps.ge
 
 
 @router.post("/login", response_model=auth_schema.Token)
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(deps.get_db_session)):
-    user = user_crud.authenticate(db, email=form_data.username, password=form_data.password)
+async def login(
+    form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(deps.get_async_db_session)
+):
+    user = await user_crud.authenticate_async(db, email=form_data.username, password=form_data.password)
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Incorrect credentials")
 
@@ -100,9 +106,11 @@ def refresh(payload: auth_schema.RefreshRequest):
 
 @router.post("/2fa/setup", response_model=auth_schema.TwoFactorSetupResponse)
 def setup_2fa(current_user=Depends(deps.get_current_user), db: Session = Depends(deps.get_db_session)):
-    secret = generate_2fa_secret(current_user.email)
-    current_user.two_factor_secret = secret
-    current_user.two_factor_enabled = True
-    db.add(current_user)
+    user = db.get(User, current_user.id)
+    secret = generate_2fa_secret(user.email)
+    user.two_factor_secret = secret
+    user.two_factor_enabled = True
+    db.add(user)
     db.commit()
-    return auth_schema.TwoFactorSetupResponse(secret=secret, provisioning_uri=get_totp_uri(secret, current_user.email))
+    deps.invalidate_cached_user(user.id)
+    return auth_schema.TwoFactorSetupResponse(secret=secret, provisioning_uri=get_totp_uri(secret, user.email))
@@ -1,20 +1,39 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.orm import Session
 
-from app.api import deps
+from app.api import caching, deps
+from app.core.responses import FastJSONResponse
 from app.crud import category as category_crud
-from app.schemas.category import CategoryRead
+from app.schemas.category import CategoryRead, CategoryTreeNode
+from app.services import category_tree
 
 router = APIRouter()
 
 
 @router.get("/", response_model=list[CategoryRead])
 def list_categories(
-    db: Session = Depends(deps.get_db_session),
+    request: Request,
+    db: Session = Depends(deps.get_read_db_session),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
 ):
     """Tüm kategorileri listele"""
+    count, last_modified = category_crud.get_version(db)
+    etag = caching.make_etag("categories", count, last_modified, skip, limit)
+    if caching.is_not_modified(request, etag, last_modified):
+        return caching.not_modified(etag, last_modified)
     categories = category_crud.get_all(db, skip=skip, limit=limit)
-    return [CategoryRead.model_validate(cat) for cat in categories]
+    return caching.set_validators(
+        FastJSONResponse([CategoryRead.model_validate(cat) for cat in categories]), etag, last_modified
+    )
 
+
+@router.get("/tree", response_model=list[CategoryTreeNode])
+def get_category_tree(request: Request, db: Session = Depends(deps.get_read_db_session)):
+    """Kategori hiyerarşisi (iç içe); bellekteki sürümlü ağaçtan sunulur"""
+    tree = category_tree.get_tree(db)
+    _, last_modified = tree.version
+    etag = caching.make_etag("category-tree", *tree.version)
+    if caching.is_not_modified(request, etag, last_modified):
+        return caching.not_modified(etag, last_modified)
+    return caching.set_validators(FastJSONResponse(tree.roots), etag, last_modified)
@@ -1,11 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 from uuid import UUID
 
 from app.api import deps
+from app.core.config import get_settings
+from app.core.pagination import NEXT_CURSOR_HEADER
 from app.crud import comment_reply as reply_crud
 from app.schemas.comment_reply import CommentReplyCreate, CommentReplyRead
 
+settings = get_settings()
 router = APIRouter()
 
 
@@ -13,7 +16,7 @@ router = APIRouter()
 def create_reply(
     review_id: str,
     reply_data: CommentReplyCreate,
-    current_user=Depends(deps.get_current_user),
+    current_user=Depends(deps.get_current_user_profile),
     db: Session = Depends(deps.get_db_session),
 ):
     parent_id = UUID(reply_data.parent_reply_id) if reply_data.parent_reply_id else None
@@ -44,33 +47,39 @@ def create_reply(
 @router.get("/reviews/{review_id}/replies")
 def get_replies(
     review_id: str,
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description="En üst seviye yanıtlar için keyset cursor'ı"),
+    depth: int = Query(settings.reply_tree_max_depth, ge=1, le=settings.reply_tree_max_depth),
     db: Session = Depends(deps.get_db_session),
 ):
-    replies = reply_crud.get_replies_for_review(db, UUID(review_id), skip, limit)
-    result = []
-    for reply in replies:
-        # Get child replies
-        children = reply_crud.get_reply_children(db, reply.id)
-        child_data = []
-        for child in children:
-            child_data.append({
-                "id": str(child.id),
-                "body": child.body,
-                "author": {"id": str(child.user_id)},
-                "created_at": child.created_at.isoformat(),
-            })
-        
-        result.append({
-            "id": str(reply.id),
-            "review_id": str(reply.review_id),
-            "user_id": str(reply.user_id),
-            "body": reply.body,
-            "created_at": reply.created_at.isoformat(),
-            "updated_at": reply.updated_at.isoformat(),
-            "author": {"id": str(reply.user_id)},
-            "child_replies": child_data,
-        })
+    try:
+        replies = reply_crud.get_reply_tree(
+            db, UUID(review_id), max_depth=depth, skip=skip, limit=limit, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    result = reply_crud.build_reply_tree(replies, _serialize_reply)
+    if len(result) == limit:
+        # Liste derinliğe göre sıralı: ilk len(result) eleman en üst seviye yanıtlardır
+        response.headers[NEXT_CURSOR_HEADER] = reply_crud.build_cursor(replies[len(result) - 1])
     return result
 
+
+def _serialize_reply(reply) -> dict:
+    return {
+        "id": str(reply.id),
+        "review_id": str(reply.review_id),
+        "user_id": str(reply.user_id),
+        "parent_reply_id": str(reply.parent_reply_id) if reply.parent_reply_id else None,
+        "body": reply.body,
+        "created_at": reply.created_at.isoformat(),
+        "updated_at": reply.updated_at.isoformat(),
+        "author": {
+            "id": str(reply.user_id),
+            "email": reply.author.email if reply.author else None,
+            "full_name": reply.author.full_name if reply.author else None,
+        },
+    }
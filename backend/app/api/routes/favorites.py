@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 from uuid import UUID
 
 from app.api import deps
+from app.core.pagination import NEXT_CURSOR_HEADER
 from app.crud import favorite as favorite_crud
 from app.crud import product as product_crud
 from app.schemas.favorite import FavoriteRead
@@ -23,9 +24,8 @@ def add_favorite(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not found")
     
     try:
-        favorite = favorite_crud.add_favorite(db, current_user.id, UUID(product_id))
-        product = product_crud.get(db, product_id)
-        product_dict = ProductRead.model_validate(product).model_dump() if product else {}
+        favorite = favorite_crud.add_favorite(db, current_user.id, product.id)
+        product_dict = ProductRead.model_validate(product).model_dump()
         return FavoriteRead(
             id=str(favorite.id),
             product_id=str(favorite.product_id),
@@ -60,22 +60,27 @@ def check_favorite(
 
 @router.get("/users/me/favorites")
 def get_my_favorites(
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=100),
+    cursor: str | None = None,
     current_user=Depends(deps.get_current_user),
     db: Session = Depends(deps.get_db_session),
 ):
-    favorites = favorite_crud.get_user_favorites(db, current_user.id, skip, limit)
-    result = []
-    for fav in favorites:
-        product = product_crud.get(db, str(fav.product_id))
-        if product:
-            product_dict = ProductRead.model_validate(product).model_dump()
-            result.append(FavoriteRead(
-                id=str(fav.id),
-                product_id=str(fav.product_id),
-                created_at=fav.created_at,
-                product=product_dict
-            ))
-    return result
+    try:
+        favorites = favorite_crud.get_user_favorites(db, current_user.id, skip, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if len(favorites) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = favorite_crud.build_cursor(favorites[-1])
+    return [
+        FavoriteRead(
+            id=str(fav.id),
+            product_id=str(fav.product_id),
+            created_at=fav.created_at,
+            product=ProductRead.model_validate(fav.product).model_dump(),
+        )
+        for fav in favorites
+    ]
 
@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 
 from app.api import deps
 from app.models.review import Review
+from app.models.user import User
 from app.schemas.common import Message
 
 router = APIRouter()
@@ -12,7 +13,7 @@ router = APIRouter()
 
 @router.get("/export", response_model=Message)
 def export_user_data(
-    current_user=Depends(deps.get_current_user),
+    current_user=Depends(deps.get_current_user_profile),
     db: Session = Depends(deps.get_db_session),
 ):
     reviews = db.query(Review).filter(Review.user_id == current_user.id).all()
@@ -43,7 +44,9 @@ def erase_user_data(
     current_user=Depends(deps.get_current_user),
     db: Session = Depends(deps.get_db_session),
 ):
-    current_user.deleted_at = current_user.deleted_at or datetime.utcnow()
-    db.add(current_user)
+    user = db.get(User, current_user.id)
+    user.deleted_at = user.deleted_at or datetime.utcnow()
+    db.add(user)
     db.commit()
+    deps.invalidate_cached_user(user.id)
     return Message(message="erase-requested", detail="Records queued for anonymization")
@@ -1,17 +1,117 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
+import os
+import shutil
+import uuid
 
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, status
+from sqlalchemy.orm import Session
+
+from app import worker
 from app.api import deps
-from app.schemas.common import Message
+from app.core.config import get_settings
+from app.crud import import_job as import_job_crud
+from app.models.import_job import ImportJob, ImportJobStatusEnum
+from app.schemas.ingest import ImportJobRead
+from app.services import importer
 
 router = APIRouter()
+settings = get_settings()
+
+
+def _require_admin(current_user) -> None:
+    if not current_user.is_superuser:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only admins can import products")
 
 
-@router.post("/import", response_model=Message)
+def _job_read(job: ImportJob) -> ImportJobRead:
+    return ImportJobRead(
+        id=str(job.id),
+        status=job.status.value,
+        format=job.format,
+        filename=job.filename,
+        source=job.source,
+        total_bytes=job.total_bytes,
+        processed_bytes=job.checkpoint_offset,
+        total_rows=job.total_rows,
+        imported=job.imported,
+        updated=job.updated,
+        failed=job.failed,
+        errors=job.errors or [],
+        errors_truncated=job.errors_truncated,
+        error=job.error,
+        attempts=job.attempts,
+        created_at=job.created_at,
+        started_at=job.run_started_at,
+        finished_at=job.finished_at,
+        **import_job_crud.progress(job),
+    )
+
+
+@router.post("/import", response_model=ImportJobRead, status_code=status.HTTP_202_ACCEPTED)
 def import_products(
     file: UploadFile,
+    format: str | None = Query(None, description="csv veya jsonl; verilmezse dosya uzantısından belirlenir"),
+    source: str | None = Query(None, description="Kayıtta kaynak yoksa kullanılacak import_source değeri"),
     current_user=Depends(deps.get_current_user),
+    db: Session = Depends(deps.get_db_session),
 ):
-    if not current_user.is_superuser:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only admins can import products")
-    # TODO: Parse CSV/JSON and create ImportJob entries
-    return Message(message="import-received", detail=file.filename)
+    """
+    Partner kataloğunu (CSV veya JSON Lines) arka planda içe aktarmak üzere kuyruğa alır.
+
+    CSV zorunlu sütunları: brand, model, category (UUID, slug veya ad); opsiyonel: sku, price, currency,
+    specs_json. JSON Lines satırları `{"product": {...}, "source": ...}` biçimindedir. İlerleme
+    `GET /ingest/jobs/{job_id}` ile izlenir; hatalı satırlar satır numarasıyla raporlanır.
+    """
+    _require_admin(current_user)
+    try:
+        fmt = importer.detect_format(file.filename, format)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    os.makedirs(settings.import_storage_dir, exist_ok=True)
+    file_path = os.path.join(settings.import_storage_dir, f"{uuid.uuid4()}.{fmt}")
+    with open(file_path, "wb") as target:
+        shutil.copyfileobj(file.file, target, length=1024 * 1024)
+
+    job = import_job_crud.create(
+        db,
+        created_by=current_user.id,
+        fmt=fmt,
+        filename=file.filename,
+        file_path=file_path,
+        total_bytes=os.path.getsize(file_path),
+        source=source,
+    )
+    worker.enqueue_import(job.id)
+    return _job_read(job)
+
+
+@router.get("/jobs/{job_id}", response_model=ImportJobRead)
+def get_import_job(
+    job_id: str,
+    current_user=Depends(deps.get_current_user),
+    db: Session = Depends(deps.get_db_session),
+):
+    """İçe aktarım ilerlemesi: işlenen bayt/satır, satır/saniye, tahmini kalan süre ve satır hataları."""
+    _require_admin(current_user)
+    job = import_job_crud.get(db, job_id)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Import job not found")
+    return _job_read(job)
+
+
+@router.post("/jobs/{job_id}/resume", response_model=ImportJobRead, status_code=status.HTTP_202_ACCEPTED)
+def resume_import_job(
+    job_id: str,
+    current_user=Depends(deps.get_current_user),
+    db: Session = Depends(deps.get_db_session),
+):
+    """Başarısız olmuş (veya kuyrukta kaybolmuş) bir işi son commit edilen gruptan itibaren yeniden kuyruğa al."""
+    _require_admin(current_user)
+    job = import_job_crud.get(db, job_id)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Import job not found")
+    if job.status not in (ImportJobStatusEnum.failed, ImportJobStatusEnum.queued):
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Import job is {job.status.value}")
+    import_job_crud.requeue(db, job)
+    worker.enqueue_import(job.id)
+    return _job_read(job)
@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.api import deps
+from app.db import pool_metrics, replicas
+
+router = APIRouter()
+
+
+@router.get("/auth-cache")
+def auth_cache_stats(current_user=Depends(deps.get_current_user)):
+    """get_current_user önbelleğinin isabet/ıska istatistikleri (bu süreç için)."""
+    if not current_user.is_superuser:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only admins can view metrics")
+    return deps.user_cache.stats()
+
+
+@router.get("/db-pool")
+def db_pool_stats(current_user=Depends(deps.get_current_user)):
+    """Bu süreçteki her bağlantı havuzunun doluluğu ve checkout bekleme dağılımı."""
+    if not current_user.is_superuser:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only admins can view metrics")
+    return pool_metrics.snapshot()
+
+
+@router.get("/db-replicas")
+def db_replica_status(current_user=Depends(deps.get_current_user)):
+    """Okuma replikalarının son ölçülen gecikmesi ve rotasyonda olup olmadıkları."""
+    if not current_user.is_superuser:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only admins can view metrics")
+    return replicas.status()
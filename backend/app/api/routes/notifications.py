@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from uuid import UUID
 
@@ -24,11 +25,11 @@ def get_notifications(
 
 
 @router.get("/notifications/unread-count")
-def get_unread_count(
-    current_user=Depends(deps.get_current_user),
-    db: Session = Depends(deps.get_db_session),
+async def get_unread_count(
+    current_user=Depends(deps.get_current_user_async),
+    db: AsyncSession = Depends(deps.get_async_db_session),
 ):
-    count = notification_crud.get_unread_count(db, current_user.id)
+    count = await notification_crud.get_unread_count_async(db, current_user.id)
     return {"count": count}
 
 
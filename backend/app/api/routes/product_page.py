@@ -0,0 +1,116 @@
+import asyncio
+import uuid
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+
+from app.api import deps, fieldsets
+from app.api.routes.questions import question_read
+from app.api.routes.reviews import review_public
+from app.core.responses import FastJSONResponse
+from app.crud import favorite as favorite_crud
+from app.crud import product as product_crud
+from app.crud import question as question_crud
+from app.crud import review as review_crud
+from app.crud import review_like as like_crud
+from app.db import replicas
+from app.schemas.product import ProductDetail
+from app.schemas.product_page import ProductPage
+from app.schemas.review_like import ReviewLikeBatchItem
+
+router = APIRouter()
+
+PAGE_SECTIONS = ("reviews", "review_likes", "questions", "favorite")
+
+
+async def _skipped(result=None):
+    return result
+
+
+async def _with_read_session(request: Request, loader):
+    """Bölümü ayrı bir AsyncSession'da yükle: tek bir oturum eşzamanlı sorgu çalıştıramaz."""
+    db = await replicas.async_read_session(replicas.is_pinned(request))
+    async with db:
+        return await loader(db)
+
+
+@router.get("/{product_id}/page", response_model=ProductPage)
+async def get_product_page(
+    product_id: str,
+    request: Request,
+    include: str | None = Query(
+        None, description=f"Virgülle ayrılmış bölümler: {', '.join(PAGE_SECTIONS)}; verilmezse hepsi"
+    ),
+    reviews_limit: int = Query(10, ge=1, le=100),
+    questions_limit: int = Query(5, ge=1, le=100),
+    answers_limit: int = Query(3, ge=0, le=20, description="Soru başına döndürülen en faydalı cevap sayısı"),
+    current_user: deps.CurrentUser | None = Depends(deps.get_current_user_optional_async),
+):
+    """
+    Ürün detay ekranının ihtiyaç duyduğu ürün, yorumlar, yorum beğenileri, sorular ve favori durumunu
+    tek istekte döndürür. Sorgu sayısı sabittir (en fazla 6). Önce ürün yüklenir; bulunamazsa bölümler hiç
+    sorgulanmaz. Ardından yorumlar (+favori) ürünün oturumunda, sorular ikinci bir oturumda eşzamanlı
+    yüklenir: istek başına en fazla iki okuma bağlantısı (oturum açmış kullanıcı için ayrıca kimlik doğrulama).
+    """
+    try:
+        product_uuid = uuid.UUID(product_id)
+        sections = set(fieldsets.parse_fields(include, PAGE_SECTIONS) or PAGE_SECTIONS)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    user_id = current_user.id if current_user else None
+
+    async def load_reviews(db):
+        reviews = await review_crud.get_product_reviews_paginated_async(db, product_uuid, limit=reviews_limit)
+        if "review_likes" not in sections:
+            return reviews, None
+        if user_id is None:
+            # Sayaçlar yorum satırında tutuluyor; kendi oyu olmayan ziyaretçi için ek sorgu gerekmez
+            stats = {
+                review.id: {
+                    "like_count": review.like_count,
+                    "dislike_count": review.dislike_count,
+                    "user_like_status": None,
+                }
+                for review in reviews
+            }
+        else:
+            stats = await like_crud.get_like_stats_batch_async(db, [review.id for review in reviews], user_id)
+        return reviews, stats
+
+    async def load_questions(db):
+        return await question_crud.get_product_questions_async(
+            db, product_uuid, limit=questions_limit, answers_per_question=answers_limit
+        )
+
+    wants_reviews = bool(sections & {"reviews", "review_likes"})
+    wants_favorite = "favorite" in sections and user_id is not None
+
+    async def load_with_product(db):
+        # Favori tek satırlık bir kontrol; ayrı bağlantı açmak yerine yorumların ardından aynı oturumda çalışır
+        reviews, like_stats = await load_reviews(db) if wants_reviews else (None, None)
+        is_favorite = await favorite_crud.is_favorite_async(db, user_id, product_uuid) if wants_favorite else None
+        return reviews, like_stats, is_favorite
+
+    db = await replicas.async_read_session(replicas.is_pinned(request))
+    async with db:
+        product = await product_crud.get_async(db, product_uuid)
+        if not product:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not found")
+        (reviews, like_stats, is_favorite), questions = await asyncio.gather(
+            load_with_product(db),
+            _with_read_session(request, load_questions) if "questions" in sections else _skipped(),
+        )
+
+    page = ProductPage(product=ProductDetail.model_validate(product))
+    if "reviews" in sections:
+        page.reviews = [review_public(review) for review in reviews]
+    if like_stats is not None:
+        page.review_likes = [
+            ReviewLikeBatchItem(review_id=str(review.id), **like_stats[review.id])
+            for review in reviews
+            if review.id in like_stats
+        ]
+    if questions is not None:
+        page.questions = [question_read(q) for q in questions]
+    if wants_favorite:
+        page.is_favorite = is_favorite
+    return FastJSONResponse(page)
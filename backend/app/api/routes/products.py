@@ -1,26 +1,44 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+import uuid
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.api import deps
+from app.api import caching, deps, fieldsets
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.responses import FastJSONResponse
 from app.crud import product as product_crud
-from app.schemas.product import ProductCreate, ProductDetail, ProductRead, ProductSummary
+from app.schemas.product import BrandCount, ProductBatch, ProductCreate, ProductDetail, ProductRead, ProductSummary
+from app.services import brand_registry, category_tree
 
 router = APIRouter()
 
 
 @router.get("/", response_model=list[ProductSummary])
-def list_products(
-    db: Session = Depends(deps.get_db_session),
+async def list_products(
+    db: AsyncSession = Depends(deps.get_async_read_db_session),
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     brand: str | None = Query(None, description="Marka filtrelemesi"),
     category_id: str | None = Query(None, description="Kategori ID filtresi"),
-    search: str | None = Query(None, description="Arama terimi (marka veya model)"),
+    include_descendants: bool = Query(False, description="category_id ile birlikte alt kategorilerdeki ürünler de listelenir"),
+    search: str | None = Query(None, description="Arama terimi (marka, model, SKU veya teknik özellik)"),
     sort_by: str | None = Query(
         None, 
-        description="Sıralama kriteri: price_asc (fiyat artan), price_desc (fiyat azalan), rating_desc (puan azalan)"
+        description=(
+            "Sıralama kriteri: price_asc (fiyat artan), price_desc (fiyat azalan), rating_desc (puan azalan), "
+            "relevance (alaka düzeyi; arama yapılırken varsayılan)"
+        )
     ),
     min_rating: float | None = Query(None, ge=0.0, le=5.0, description="Minimum ortalama puan filtresi"),
+    cursor: str | None = Query(
+        None,
+        description=f"Keyset sayfalama cursor'ı; önceki yanıttaki {NEXT_CURSOR_HEADER} başlığından alınır (skip yok sayılır)",
+    ),
+    fields: str | None = Query(
+        None,
+        description="Virgülle ayrılmış alan listesi (ör. brand,model,price,average_rating); id her zaman döner",
+    ),
 ):
     import logging
     logger = logging.getLogger(__name__)
@@ -31,38 +49,154 @@ def list_products(
     if min_rating is not None:
         logger.info(f"Min rating filter: {min_rating}")
     
-    products = product_crud.get_multi(
-        db,
-        skip=skip,
-        limit=limit,
-        brand=brand,
-        category_id=category_id,
-        search=search,
-        sort_by=sort_by,
-        min_rating=min_rating,
-    )
+    try:
+        selected = fieldsets.parse_fields(fields, ProductSummary.model_fields)
+        category_ids = None
+        if category_id and include_descendants:
+            tree = await category_tree.get_tree_async(db)
+            category_ids = tree.subtree_ids(uuid.UUID(category_id))
+            category_id = None
+        products = await product_crud.get_multi_async(
+            db,
+            skip=skip,
+            limit=limit,
+            brand=brand,
+            category_id=category_id,
+            category_ids=category_ids,
+            search=search,
+            sort_by=sort_by,
+            min_rating=min_rating,
+            cursor=cursor,
+            columns=selected,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     if search:
         logger.info(f"Search results: {len(products)} products found")
-    return [ProductSummary.model_validate(prod) for prod in products]
+    headers = {}
+    if len(products) == limit:
+        next_cursor = product_crud.build_cursor(products[-1], product_crud.resolve_sort(sort_by, search))
+        if next_cursor:
+            headers[NEXT_CURSOR_HEADER] = next_cursor
+    if selected is not None:
+        return FastJSONResponse([fieldsets.project(prod, selected) for prod in products], headers=headers)
+    # Modeller burada kuruldu; response_model ile yeniden doğrulamaya gerek yok
+    return FastJSONResponse([ProductSummary.model_validate(prod) for prod in products], headers=headers)
+
+
+BATCH_MAX_IDS = 100
+
+
+@router.get("/batch", response_model=ProductBatch)
+async def get_products_batch(
+    ids: list[str] = Query(
+        ...,
+        description=f"Ürün ID'leri; virgülle ayrılmış veya tekrarlanan parametre (en fazla {BATCH_MAX_IDS})",
+    ),
+    db: AsyncSession = Depends(deps.get_async_read_db_session),
+):
+    """
+    Favoriler ve karşılaştırma görünümleri için birden fazla ürünü tek sorguda getirir.
+    Ürünler istenen sırayla döner; bulunamayan veya geçersiz ID'ler `missing` alanında listelenir.
+    """
+    requested = list(dict.fromkeys(part.strip() for value in ids for part in value.split(",") if part.strip()))
+    if len(requested) > BATCH_MAX_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {BATCH_MAX_IDS} ids can be requested at once")
+
+    parsed: dict[str, uuid.UUID | None] = {}
+    for product_id in requested:
+        try:
+            parsed[product_id] = uuid.UUID(product_id)
+        except ValueError:
+            parsed[product_id] = None
+    found = await product_crud.get_many_async(db, {value for value in parsed.values() if value is not None})
+
+    items, missing = [], []
+    for product_id, product_uuid in parsed.items():
+        product = found.get(product_uuid)
+        if product is None:
+            missing.append(product_id)
+        else:
+            items.append(ProductDetail.model_validate(product))
+    return FastJSONResponse(ProductBatch(items=items, missing=missing))
 
 
 @router.get("/{product_id}", response_model=ProductDetail)
-def get_product(product_id: str, db: Session = Depends(deps.get_db_session)):
-    product = product_crud.get(db, product_id=product_id)
+async def get_product(
+    product_id: str,
+    request: Request,
+    db: AsyncSession = Depends(deps.get_async_read_db_session),
+):
+    try:
+        product = await product_crud.get_async(db, product_id=product_id)
+    except ValueError:
+        product = None
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
-    return ProductDetail.model_validate(product)
+
+    # Puan özeti güncellemeleri de updated_at'i ilerletir; sayaçlar ek güvence
+    etag = caching.make_etag(product.id, product.updated_at, product.review_count, product.average_rating)
+    if caching.is_not_modified(request, etag, product.updated_at):
+        return caching.not_modified(etag, product.updated_at)
+    return caching.set_validators(
+        FastJSONResponse(ProductDetail.model_validate(product)), etag, product.updated_at
+    )
+
+
+def _brand_scope(db: Session, category_id: str | None, include_descendants: bool):
+    """Marka listesinin kategori kapsamı: (kategori id'leri veya None, ETag parçaları)."""
+    if not category_id:
+        return None, ()
+    try:
+        category_uuid = uuid.UUID(category_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid category_id format: {category_id}")
+    if not include_descendants:
+        return (category_uuid,), (category_uuid,)
+    tree = category_tree.get_tree(db)
+    return tree.subtree_ids(category_uuid), (category_uuid, tree.version)
+
+
+def _brands_response(request: Request, db: Session, name: str, category_id, include_descendants, render):
+    registry = brand_registry.get_registry(db)
+    category_ids, scope = _brand_scope(db, category_id, include_descendants)
+    _, last_modified = registry.version
+    etag = caching.make_etag(name, *registry.version, *scope)
+    if caching.is_not_modified(request, etag, last_modified):
+        return caching.not_modified(etag, last_modified)
+    return caching.set_validators(FastJSONResponse(render(registry, category_ids)), etag, last_modified)
 
 
 @router.get("/brands/", response_model=list[str])
-def list_brands(db: Session = Depends(deps.get_db_session)):
+def list_brands(
+    request: Request,
+    db: Session = Depends(deps.get_read_db_session),
+    category_id: str | None = Query(None, description="Yalnızca bu kategorideki ürünlerin markaları"),
+    include_descendants: bool = Query(False, description="category_id ile birlikte alt kategoriler de dahil edilir"),
+):
     """
     Veritabanındaki tüm ürünlerin tekilleştirilmiş markalarını listeler.
-    Markalar alfabetik olarak sıralanır.
+    Markalar alfabetik olarak sıralanır; liste bellekteki marka kaydından sunulur.
     """
-    brands = product_crud.get_distinct_brands(db)
-    return brands
+    return _brands_response(
+        request, db, "brands", category_id, include_descendants,
+        lambda registry, category_ids: registry.brand_names(category_ids),
+    )
+
+
+@router.get("/brands/counts", response_model=list[BrandCount])
+def list_brand_counts(
+    request: Request,
+    db: Session = Depends(deps.get_read_db_session),
+    category_id: str | None = Query(None, description="Yalnızca bu kategorideki ürünler sayılır"),
+    include_descendants: bool = Query(False, description="category_id ile birlikte alt kategoriler de dahil edilir"),
+):
+    """Filtre ekranı için marka başına ürün sayıları (alfabetik)."""
+    return _brands_response(
+        request, db, "brand-counts", category_id, include_descendants,
+        lambda registry, category_ids: registry.brand_counts(category_ids),
+    )
 
 
 @router.post("/", response_model=ProductRead, status_code=201)
@@ -84,10 +218,14 @@ def create_product(
     - price: Ürün fiyatı
     - currency: Para birimi (varsayılan: TRY)
     - specs: Teknik özellikler (JSON objesi)
+
+    Aynı marka + model + özelliklere sahip ürün zaten varsa 409 ve mevcut ürünün id'si döner.
     """
     try:
         product = product_crud.create(db, product_in=payload)
         return ProductRead.model_validate(product)
+    except product_crud.DuplicateProductError as e:
+        raise HTTPException(status_code=409, detail={"message": "Product already exists", "product_id": str(e.product_id)})
     except ValueError as e:
         error_message = str(e)
         if "not found" in error_message.lower():
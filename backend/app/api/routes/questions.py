@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from uuid import UUID
 
 from app.api import deps
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.responses import FastJSONResponse
 from app.crud import question as question_crud
 from app.crud import product as product_crud
+from app.models.question import Question
 from app.schemas.question import QuestionCreate, QuestionRead, AnswerCreate, AnswerRead
 
 router = APIRouter()
@@ -14,7 +17,7 @@ router = APIRouter()
 def create_question(
     product_id: str,
     question_data: QuestionCreate,
-    current_user=Depends(deps.get_current_user),
+    current_user=Depends(deps.get_current_user_profile),
     db: Session = Depends(deps.get_db_session),
 ):
     # Check if product exists
@@ -46,54 +49,67 @@ def create_question(
     )
 
 
+def _author(user_id, user) -> dict:
+    return {
+        "id": str(user_id),
+        "email": user.email if user else None,
+        "full_name": user.full_name if user else None,
+    }
+
+
+def question_read(q: Question) -> QuestionRead:
+    """Soruyu yazarı ve önceden yüklenmiş cevaplarıyla birlikte yanıt modeline çevir."""
+    answers_data = [
+        {
+            "id": str(ans.id),
+            "answer_text": ans.answer_text,
+            "author": _author(ans.user_id, ans.author),
+            "created_at": ans.created_at.isoformat(),
+        }
+        for ans in q.answers
+    ]
+    return QuestionRead(
+        id=str(q.id),
+        product_id=str(q.product_id),
+        user_id=str(q.user_id),
+        question_text=q.question_text,
+        is_answered=q.is_answered,
+        answer_count=q.answer_count,
+        created_at=q.created_at,
+        updated_at=q.updated_at,
+        author=_author(q.user_id, q.author),
+        answers=answers_data
+    )
+
+
 @router.get("/products/{product_id}/questions", response_model=list[QuestionRead])
 def get_product_questions(
     product_id: str,
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(deps.get_db_session),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=100),
+    cursor: str | None = None,
+    answers_limit: int = Query(3, ge=0, le=20, description="Soru başına döndürülen en faydalı cevap sayısı"),
+    db: Session = Depends(deps.get_read_db_session),
 ):
-    questions = question_crud.get_product_questions(db, UUID(product_id), skip, limit)
-    result = []
-    for q in questions:
-        author_data = {
-            "id": str(q.user_id),
-            "email": q.author.email if q.author else None,
-            "full_name": q.author.full_name if q.author else None,
-        }
-        answers_data = []
-        for ans in q.answers:
-            answers_data.append({
-                "id": str(ans.id),
-                "answer_text": ans.answer_text,
-                "author": {
-                    "id": str(ans.user_id),
-                    "email": ans.author.email if ans.author else None,
-                    "full_name": ans.author.full_name if ans.author else None,
-                },
-                "created_at": ans.created_at.isoformat(),
-            })
-        
-        result.append(QuestionRead(
-            id=str(q.id),
-            product_id=str(q.product_id),
-            user_id=str(q.user_id),
-            question_text=q.question_text,
-            is_answered=q.is_answered,
-            answer_count=q.answer_count,
-            created_at=q.created_at,
-            updated_at=q.updated_at,
-            author=author_data,
-            answers=answers_data
-        ))
-    return result
+    try:
+        questions = question_crud.get_product_questions(
+            db, UUID(product_id), skip, limit, cursor=cursor, answers_per_question=answers_limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    headers = {}
+    if len(questions) == limit:
+        headers[NEXT_CURSOR_HEADER] = question_crud.build_cursor(questions[-1])
+    result = [question_read(q) for q in questions]
+    return FastJSONResponse(result, headers=headers)
 
 
 @router.post("/questions/{question_id}/answers", response_model=AnswerRead)
 def create_answer(
     question_id: str,
     answer_data: AnswerCreate,
-    current_user=Depends(deps.get_current_user),
+    current_user=Depends(deps.get_current_user_profile),
     db: Session = Depends(deps.get_db_session),
 ):
     answer = question_crud.create_answer(
@@ -4,7 +4,12 @@ from uuid import UUID
 
 from app.api import deps
 from app.crud import review_like as like_crud
-from app.schemas.review_like import ReviewLikeCreate, ReviewLikeStats
+from app.schemas.review_like import (
+    ReviewLikeBatchItem,
+    ReviewLikeBatchRequest,
+    ReviewLikeCreate,
+    ReviewLikeStats,
+)
 
 router = APIRouter()
 
@@ -33,3 +38,26 @@ def get_like_stats(
     stats = like_crud.get_like_stats(db, UUID(review_id), user_id)
     return ReviewLikeStats(**stats)
 
+
+@router.post("/reviews/likes/batch", response_model=list[ReviewLikeBatchItem])
+def get_like_stats_batch(
+    payload: ReviewLikeBatchRequest,
+    current_user=Depends(deps.get_current_user_optional),
+    db: Session = Depends(deps.get_db_session),
+):
+    """En fazla 100 yorumun beğeni sayaçlarını ve çağıranın kendi oyunu tek sorguda döndür.
+
+    Var olmayan yorum id'leri yanıtta yer almaz; sıra istekteki sırayla aynıdır.
+    """
+    try:
+        review_ids = list(dict.fromkeys(UUID(review_id) for review_id in payload.review_ids))
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid review ID format")
+
+    user_id = current_user.id if current_user else None
+    stats = like_crud.get_like_stats_batch(db, review_ids, user_id)
+    return [
+        ReviewLikeBatchItem(review_id=str(review_id), **stats[review_id])
+        for review_id in review_ids
+        if review_id in stats
+    ]
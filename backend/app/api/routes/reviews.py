@@ -1,9 +1,14 @@
 import uuid
+from functools import lru_cache
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.api import deps
+from app.api import caching, deps, fieldsets
+from app.core.responses import FastJSONResponse
+from app.core.security import get_password_hash
 from app.crud import product as product_crud
 from app.crud import review as review_crud
 from app.models.product import Product
@@ -15,6 +20,7 @@ from app.schemas.review import (
     ReviewCreatePublic,
     ReviewPublic,
     ReviewRead,
+    ReviewStatusUpdate,
     ReviewWithProduct,
 )
 
@@ -22,13 +28,44 @@ router = APIRouter()
 public_router = APIRouter()
 
 
+@lru_cache(maxsize=1)
+def _anonymous_password_hash() -> str:
+    # Anonim hesapların parolası sabit; her yeni anonim kullanıcı için Argon2 çalıştırmaya gerek yok
+    return get_password_hash("anon_password_123")
+
+
 def _anonymize_user(user: User | None) -> str:
     if not user:
         return "Anonim Kullanıcı"
-    prefix = str(user.id).replace("-", "").upper()[:6]
+    return _alias_for(user.id)
+
+
+def _alias_for(user_id) -> str:
+    prefix = str(user_id).replace("-", "").upper()[:6]
     return f"Anonim Kullanıcı {prefix}"
 
 
+def review_public(review: Review) -> ReviewPublic:
+    """Onaylı yorumun herkese açık, yazarı anonimleştirilmiş görünümü (``author`` yüklenmiş olmalı)."""
+    return ReviewPublic(
+        id=str(review.id),
+        product_id=str(review.product_id),
+        rating=review.rating,
+        title=review.title,
+        body=review.body,
+        pros=review.pros or [],
+        cons=review.cons or [],
+        created_at=review.created_at,
+        author_alias=_anonymize_user(review.author),
+    )
+
+
+# fields= seçimi için: alias, yazar join'i yerine user_id kolonundan türetilir
+_REVIEW_FIELD_COLUMNS = {name: (name,) for name in ReviewPublic.model_fields}
+_REVIEW_FIELD_COLUMNS["author_alias"] = ("user_id",)
+_REVIEW_FIELD_GETTERS = {"author_alias": lambda review: _alias_for(review.user_id)}
+
+
 @router.post("/", response_model=ReviewRead, status_code=status.HTTP_201_CREATED)
 def create_review(
     payload: ReviewCreate,
@@ -40,44 +77,74 @@ def create_review(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not found")
 
     review = review_crud.create(db, review_in=payload, user_id=str(current_user.id))
-    product_crud.refresh_rating_cache(db, payload.product_id)
     return ReviewRead.model_validate(review)
 
 
+@router.patch("/{review_id}/status", response_model=Message)
+def update_review_status(
+    review_id: str,
+    payload: ReviewStatusUpdate,
+    current_user=Depends(deps.get_current_user),
+    db: Session = Depends(deps.get_db_session),
+):
+    if not current_user.is_superuser:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only admins can moderate reviews")
+    try:
+        review_uuid = uuid.UUID(review_id)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid review ID format")
+
+    review = review_crud.get(db, review_uuid)
+    if not review:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Review not found")
+
+    review = review_crud.set_status(db, review, ReviewStatusEnum(payload.status))
+    return Message(message="review-status-updated", detail={"id": str(review.id), "status": review.status.value})
+
+
 @public_router.get(
     "/products/{product_id}/reviews",
     response_model=list[ReviewPublic],
     status_code=status.HTTP_200_OK,
 )
-def list_product_reviews(
+async def list_product_reviews(
     product_id: str,
-    db: Session = Depends(deps.get_db_session),
+    request: Request,
+    db: AsyncSession = Depends(deps.get_async_read_db_session),
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    fields: str | None = Query(
+        None, description="Virgülle ayrılmış alan listesi (ör. rating,title,created_at); id her zaman döner"
+    ),
 ):
-    product_exists = db.query(Product.id).filter(Product.id == product_id).first()
+    try:
+        product_uuid = uuid.UUID(product_id)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not found")
+    try:
+        selected = fieldsets.parse_fields(fields, ReviewPublic.model_fields)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    product_exists = await db.scalar(select(Product.id).where(Product.id == product_uuid))
     if not product_exists:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not found")
 
-    reviews = review_crud.get_product_reviews_paginated(
-        db, product_id=product_id, skip=skip, limit=limit
+    count, last_modified = await review_crud.get_product_reviews_version_async(db, product_uuid)
+    etag = caching.make_etag(product_uuid, count, last_modified, skip, limit, selected)
+    if caching.is_not_modified(request, etag, last_modified):
+        return caching.not_modified(etag, last_modified)
+
+    columns = None if selected is None else {c for name in selected for c in _REVIEW_FIELD_COLUMNS[name]}
+    reviews = await review_crud.get_product_reviews_paginated_async(
+        db, product_id=product_uuid, skip=skip, limit=limit, columns=columns
     )
-    result: list[ReviewPublic] = []
-    for review in reviews:
-        result.append(
-            ReviewPublic(
-                id=str(review.id),
-                product_id=str(review.product_id),
-                rating=review.rating,
-                title=review.title,
-                body=review.body,
-                pros=review.pros or [],
-                cons=review.cons or [],
-                created_at=review.created_at,
-                author_alias=_anonymize_user(review.author),
-            )
-        )
-    return result
+    if selected is not None:
+        page = [fieldsets.project(review, selected, _REVIEW_FIELD_GETTERS) for review in reviews]
+        return caching.set_validators(FastJSONResponse(page), etag, last_modified)
+
+    result = [review_public(review) for review in reviews]
+    return caching.set_validators(FastJSONResponse(result), etag, last_modified)
 
 
 @public_router.post(
@@ -88,7 +155,7 @@ def list_product_reviews(
 def create_product_review_public(
     product_id: str,
     payload: ReviewCreatePublic,
-    current_user: User | None = Depends(deps.get_current_user_optional),
+    current_user: deps.CurrentUser | None = Depends(deps.get_current_user_optional),
     db: Session = Depends(deps.get_db_session),
 ):
     # UUID'ye çevir
@@ -104,8 +171,9 @@ def create_product_review_public(
     # JWT token varsa gerçek kullanıcıyı kullan, yoksa anonim kullanıcı oluştur
     if current_user:
         # JWT ile giriş yapılmış - gerçek kullanıcıyı kullan
-        review_user = current_user
-        author_alias = current_user.full_name or current_user.email.split('@')[0]
+        # Önbellekteki kimlik profil alanı taşımaz; takma ad güncel satırdan türetilir
+        review_user = db.get(User, current_user.id)
+        author_alias = review_user.full_name or review_user.email.split('@')[0]
     else:
         # Anonim kullanıcı için username zorunlu
         if not payload.username:
@@ -119,10 +187,9 @@ def create_product_review_public(
         review_user = db.query(User).filter(User.email == anon_email).first()
         
         if not review_user:
-            from app.core.security import get_password_hash
             review_user = User(
                 email=anon_email,
-                password_hash=get_password_hash("anon_password_123"),
+                password_hash=_anonymous_password_hash(),
                 full_name=payload.username,
                 is_active=True,
             )
@@ -143,11 +210,11 @@ def create_product_review_public(
         status=ReviewStatusEnum.approved,  # Public yorumlar otomatik onaylanır
     )
     db.add(db_obj)
+    # Onaylı yorum: ürün puan özeti aynı transaction'da artımlı güncellenir
+    product_crud.apply_rating_delta(db, product_uuid, payload.rating, 1)
     db.commit()
     db.refresh(db_obj)
     
-    product_crud.refresh_rating_cache(db, str(product_uuid))
-    
     review_public = ReviewPublic(
         id=str(db_obj.id),
         product_id=str(db_obj.product_id),
@@ -9,6 +9,6 @@ router = APIRouter()
 
 @router.get("/me", response_model=UserRead)
 def read_current_user(
-    current_user=Depends(deps.get_current_user),
+    current_user=Depends(deps.get_current_user_profile),
 ):
     return UserRead.model_validate(current_user)
@@ -0,0 +1,97 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable
+
+
+class TTLCache:
+    """Thread-safe, boyutu sınırlı LRU önbellek; her kayıt ``ttl`` saniye sonra geçersiz olur.
+
+    Süreç içi çalışır: birden çok worker/replika arasında paylaşılmaz, bu yüzden
+    açık invalidation yalnızca yerel kopyayı temizler ve TTL diğerleri için üst sınırdır.
+    """
+
+    def __init__(self, *, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            }
+
+
+class VersionedValue:
+    """Süreç içi tek değerlik önbellek (ör. kategori ağacı, marka listesi).
+
+    Değer, kaynağın sürümüyle (ör. en son güncelleme zamanı) birlikte saklanır. Sürüm en fazla
+    ``check_interval`` saniyede bir kontrol edilir; arada değer sorgusuz döner. ``invalidate`` yalnızca
+    yerel kopyayı temizler, diğer worker'lar değişikliği bir sonraki sürüm kontrolünde görür.
+    """
+
+    def __init__(self, *, check_interval: float):
+        self.check_interval = check_interval
+        # (değer, sürüm, son kontrol); tek atama ile değiştirildiği için kilit gerekmez
+        self._state: tuple[Any, Any, float] = (None, None, 0.0)
+
+    def fresh(self) -> Any:
+        """Son sürüm kontrolü ``check_interval`` içindeyse değer, değilse None."""
+        value, _, checked_at = self._state
+        if value is not None and time.monotonic() - checked_at < self.check_interval:
+            return value
+        return None
+
+    def current(self, version: Hashable) -> Any:
+        """Saklanan değer verilen sürüme aitse değer, değilse None."""
+        value, stored_version, _ = self._state
+        return value if value is not None and stored_version == version else None
+
+    def store(self, value: Any, version: Hashable) -> Any:
+        self._state = (value, version, time.monotonic())
+        return value
+
+    def invalidate(self) -> None:
+        self._state = (None, None, 0.0)
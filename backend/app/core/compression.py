@@ -0,0 +1,175 @@
+"""gzip / brotli yanıt sıkıştırması.
+
+Starlette'in GZipMiddleware'inden farkı: brotli desteği (``brotli`` paketi kuruluysa), içerik türü filtresi
+ve ``Accept-Encoding`` q-değerlerine göre seçim. Eşikten küçük gövdeler (health, sayaçlar) CPU harcamamak
+için olduğu gibi gönderilir.
+"""
+import zlib
+from typing import Iterable
+
+try:  # opsiyonel bağımlılık: pip install ".[compression]"
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+
+def parse_accept_encoding(header: str) -> dict[str, float]:
+    """``"gzip;q=0.8, br"`` -> {"gzip": 0.8, "br": 1.0}"""
+    encodings: dict[str, float] = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        encodings[name] = quality
+    return encodings
+
+
+def add_vary(headers: list[tuple[bytes, bytes]], field: bytes) -> None:
+    """Var olan ``Vary`` başlığına ``field`` ekle (yoksa oluştur); ikinci bir Vary satırı yazılmaz."""
+    for index, (key, value) in enumerate(headers):
+        if key.lower() != b"vary":
+            continue
+        tokens = [token.strip().lower() for token in value.split(b",")]
+        if b"*" not in tokens and field.lower() not in tokens:
+            headers[index] = (key, value + b", " + field)
+        return
+    headers.append((b"vary", field))
+
+
+class _GzipEncoder:
+    name = "gzip"
+
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31: gzip başlığı
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliEncoder:
+    name = "br"
+
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality, mode=brotli.MODE_TEXT)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app,
+        *,
+        minimum_size: int = 1024,
+        content_types: Iterable[str] = ("application/json",),
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.content_types = tuple(content_type.lower() for content_type in content_types)
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def _choose_encoder(self, accept_encoding: str):
+        accepted = parse_accept_encoding(accept_encoding)
+        wildcard = accepted.get("*", 0.0)
+        br_quality = accepted.get("br", wildcard) if brotli is not None else 0.0
+        gzip_quality = accepted.get("gzip", wildcard)
+        if br_quality > 0 and br_quality >= gzip_quality:
+            return _BrotliEncoder(self.brotli_quality)
+        if gzip_quality > 0:
+            return _GzipEncoder(self.gzip_level)
+        return None
+
+    def _compressible(self, headers: list[tuple[bytes, bytes]]) -> bool:
+        content_type = b""
+        for key, value in headers:
+            lowered = key.lower()
+            if lowered == b"content-encoding":
+                return False
+            if lowered == b"content-type":
+                content_type = value
+        media_type = content_type.decode("latin-1").split(";")[0].strip().lower()
+        return media_type.startswith(self.content_types)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept_encoding = ""
+        for key, value in scope["headers"]:
+            if key == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+        encoder = self._choose_encoder(accept_encoding) if accept_encoding else None
+        if encoder is None:
+            await self.app(scope, receive, send)
+            return
+
+        pending_start = None  # sıkıştırılabilir yanıtın başlığı, ilk gövde parçası gelene kadar bekletilir
+        compressing = False
+
+        async def send_wrapper(message):
+            nonlocal pending_start, compressing
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                if message["status"] < 200 or message["status"] in (204, 304) or not self._compressible(headers):
+                    await send(message)
+                else:
+                    pending_start = {**message, "headers": headers}
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressing:
+                chunk = encoder.compress(body)
+                if not more_body:
+                    chunk += encoder.flush()
+                await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+                return
+            if pending_start is None:
+                await send(message)
+                return
+
+            start, pending_start = pending_start, None
+            headers = start["headers"]
+            add_vary(headers, b"Accept-Encoding")
+            if not more_body and len(body) < self.minimum_size:
+                await send(start)
+                await send(message)
+                return
+
+            headers[:] = [(key, value) for key, value in headers if key.lower() != b"content-length"]
+            headers.append((b"content-encoding", encoder.name.encode("latin-1")))
+            if more_body:
+                # Boyutu bilinmeyen akış: parça parça sıkıştır
+                compressing = True
+                await send(start)
+                await send({"type": "http.response.body", "body": encoder.compress(body), "more_body": True})
+                return
+            compressed = encoder.compress(body) + encoder.flush()
+            headers.append((b"content-length", str(len(compressed)).encode("latin-1")))
+            await send(start)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
@@ -21,6 +21,21 @@ class Settings(BaseSettings):
     postgres_user: str
     postgres_password: str
 
+    # Bağlantı havuzu (her engine için ayrı; replika/worker başına boyutlandırın)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout_seconds: float = 30.0
+    db_pool_recycle_seconds: int = 1800
+    db_pool_pre_ping: bool = True
+    db_pool_use_lifo: bool = False  # LIFO: boşta kalan fazla bağlantılar recycle ile kapanabilir
+
+    # Okuma replikaları (tam SQLAlchemy URL'leri); boşsa tüm okumalar primary'den yapılır
+    db_replica_urls: List[str] = []
+    db_replica_max_lag_seconds: float = 5.0
+    db_replica_lag_check_interval_seconds: float = 5.0
+    db_read_your_writes_seconds: int = 10
+    db_read_your_writes_max_users: int = 100_000  # süreç içi sabitlenmiş kullanıcı tablosunun üst sınırı
+
     redis_url: str = "redis://localhost:6379/0"
 
     s3_endpoint: str | None = None
@@ -32,6 +47,45 @@ class Settings(BaseSettings):
 
     two_factor_issuer: str = "Yorumator"
 
+    # Argon2 maliyeti (passlib varsayılanları) ve parola işlemleri için ayrılmış worker havuzu
+    argon2_time_cost: int = 2
+    argon2_memory_cost: int = 102_400  # KiB
+    argon2_parallelism: int = 8
+    password_hash_workers: int = 2
+    password_hash_queue_size: int = 8
+    password_hash_queue_timeout_seconds: float = 0.5
+
+    reply_tree_max_depth: int = 8
+
+    # Toplu ürün içe aktarımı (bkz. app/services/importer.py)
+    import_batch_size: int = 1000
+    import_max_reported_errors: int = 1000
+    import_queue: str = "local"  # "local" (süreç içi thread havuzu) veya "celery" (redis_url broker'ı)
+    import_local_workers: int = 1
+    import_storage_dir: str = "var/imports"  # Celery modunda worker'larla paylaşılan bir dizin olmalı
+
+    # Yanıt sıkıştırma (brotli için: pip install ".[compression]")
+    compression_min_size: int = 1024
+    compression_content_types: List[str] = ["application/json", "text/plain", "text/html"]
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4
+
+    # Geliştirme modu SQL enstrümantasyonu (bkz. app/core/querylog.py)
+    query_debug: bool = False
+    query_debug_max_queries: int = 20
+    query_debug_max_seconds: float = 0.5
+    query_debug_slow_query_ms: float = 100.0
+    query_debug_repeat_threshold: int = 3
+
+    # get_current_user için süreç içi kullanıcı önbelleği
+    auth_user_cache_size: int = 10_000
+    auth_user_cache_ttl_seconds: float = 30.0
+
+    # Kategori ağacı önbelleğinin sürüm kontrol aralığı (bkz. app/services/category_tree.py)
+    category_tree_check_seconds: float = 30.0
+    # Marka kaydının sürüm kontrol aralığı (bkz. app/services/brand_registry.py)
+    brand_registry_check_seconds: float = 30.0
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -0,0 +1,202 @@
+"""Prometheus metin formatında istek ve SQL metrikleri.
+
+Harici bağımlılık olmadan küçük bir sayaç/histogram kaydı tutar. ``MetricsMiddleware`` her HTTP
+isteği için route şablonu bazında süre, durum kodu ve eşzamanlı istek sayısını; SQLAlchemy cursor
+olayları ise aynı istek içinde çalışan sorgu sayısını ve süresini kaydeder.
+"""
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, Iterable, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+LabelValues = Tuple[str, ...]
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _labels(self, labels: LabelValues) -> str:
+        if not labels:
+            return ""
+        pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, labels))
+        return "{" + pairs + "}"
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def render(self) -> list[str]:
+        with self._lock:
+            values = dict(self._values)
+        return self.header() + [f"{self.name}{self._labels(k)} {_number(v)}" for k, v in sorted(values.items())]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (), *, buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+        # etiketler -> (kova sayaçları, toplam, adet)
+        self._values: Dict[LabelValues, list] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                state = self._values[labels] = [[0] * len(self.buckets), 0.0, 0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def render(self) -> list[str]:
+        with self._lock:
+            values = {labels: (list(counts), total, count) for labels, (counts, total, count) in self._values.items()}
+        lines = self.header()
+        for labels, (counts, total, count) in sorted(values.items()):
+            base = self._labels(labels)[1:-1]
+            prefix = base + "," if base else ""
+            for bound, bucket_count in zip(self.buckets, counts):
+                lines.append(f'{self.name}_bucket{{{prefix}le="{_number(bound)}"}} {bucket_count}')
+            lines.append(f'{self.name}_bucket{{{prefix}le="+Inf"}} {count}')
+            lines.append(f"{self.name}_sum{self._labels(labels)} {_number(total)}")
+            lines.append(f"{self.name}_count{self._labels(labels)} {count}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+REQUESTS = Counter("http_requests_total", "HTTP istekleri", ("method", "route", "status"))
+REQUEST_LATENCY = Histogram("http_request_duration_seconds", "HTTP istek süresi", ("method", "route"))
+IN_PROGRESS = Gauge("http_requests_in_progress", "İşlenmekte olan HTTP istekleri", ("method",))
+QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request", "İstek başına SQL sorgu sayısı", ("method", "route"), buckets=QUERY_COUNT_BUCKETS
+)
+QUERY_TIME_PER_REQUEST = Histogram(
+    "db_query_duration_seconds_per_request", "İstek başına toplam SQL süresi", ("method", "route")
+)
+QUERIES = Counter("db_queries_total", "Çalıştırılan SQL sorguları", ("route",))
+
+REGISTRY = (REQUESTS, REQUEST_LATENCY, IN_PROGRESS, QUERIES_PER_REQUEST, QUERY_TIME_PER_REQUEST, QUERIES)
+
+
+def render() -> str:
+    lines: list[str] = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+@dataclass
+class QueryStats:
+    """Tek bir isteğin SQL sayacı; threadpool'a kopyalanan context'lerde aynı nesne paylaşılır."""
+
+    count: int = 0
+    seconds: float = 0.0
+
+
+current_query_stats: ContextVar[QueryStats | None] = ContextVar("current_query_stats", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_started_at"].pop()
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.seconds += time.perf_counter() - started
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    # Hatalı sorguda after_cursor_execute çalışmaz; başlangıç zamanını yığında bırakma
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_started_at"):
+        connection.info["query_started_at"].pop()
+
+
+class MetricsMiddleware:
+    """Saf ASGI middleware: BaseHTTPMiddleware'in aksine yanıt gövdesini ara belleğe almaz."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        IN_PROGRESS.inc(method)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            IN_PROGRESS.dec(method)
+            current_query_stats.reset(token)
+            # Ham path yerine route şablonu: /products/{product_id} tek bir seri olur
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            REQUESTS.inc(method, route_path, str(status_code))
+            REQUEST_LATENCY.observe(elapsed, method, route_path)
+            QUERIES_PER_REQUEST.observe(stats.count, method, route_path)
+            QUERY_TIME_PER_REQUEST.observe(stats.seconds, method, route_path)
+            if stats.count:
+                QUERIES.inc(route_path, amount=stats.count)
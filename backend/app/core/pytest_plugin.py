@@ -0,0 +1,28 @@
+"""SQL bütçesi için pytest eklentisi.
+
+``pytest -p app.core.pytest_plugin`` ile (veya conftest.py içinde ``pytest_plugins``) etkinleştirilir::
+
+    def test_favorites_page(client, query_budget):
+        with query_budget(max_queries=3):
+            client.get("/api/v1/users/me/favorites")
+"""
+from contextlib import contextmanager
+
+import pytest
+
+from app.core import querylog
+
+
+@pytest.fixture
+def query_budget():
+    """Blok bütçeyi aşarsa (sorgu sayısı, süre veya tekrarlanan sorgu şekli) testi başarısız say."""
+
+    @contextmanager
+    def _budget(max_queries: int | None = None, max_seconds: float | None = None, repeat_threshold: int | None = None):
+        with querylog.capture() as log:
+            yield log
+        problems = log.problems(max_queries=max_queries, max_seconds=max_seconds, repeat_threshold=repeat_threshold)
+        if problems:
+            pytest.fail("Query budget exceeded:\n  - " + "\n  - ".join(problems), pytrace=False)
+
+    return _budget
@@ -0,0 +1,219 @@
+"""Geliştirme modu SQL enstrümantasyonu: yavaş sorgu logu ve N+1 tespiti.
+
+``QUERY_DEBUG=true`` ile açılır. Her istekte çalışan SQL'ler parametrelerinden arındırılıp parmak izine
+çevrilir; sorgu sayısı veya süre bütçesini aşan istekler ve aynı şekilde tekrarlanan sorgular (muhtemel N+1)
+çağrıldıkları kod satırıyla birlikte loglanır. Testlerde ``capture()`` / ``query_budget`` fixture'ı ile kullanılır.
+"""
+import logging
+import re
+import threading
+import time
+import traceback
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import get_settings
+
+try:  # async motorlarla birlikte gelir (sqlalchemy[asyncio])
+    import greenlet
+except ImportError:  # pragma: no cover
+    greenlet = None
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_APP_ROOT = str(Path(__file__).resolve().parents[1])
+_THIS_FILE = str(Path(__file__).resolve())
+
+_PARAM_RE = re.compile(r"%\(\w+\)s|%s|\$\d+")
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """SQL'i şekline indir: parametreler, sabitler ve IN listeleri ``?`` olur, boşluklar tekleşir."""
+    normalized = _STRING_RE.sub("?", statement)
+    normalized = _PARAM_RE.sub("?", normalized)
+    normalized = _NUMBER_RE.sub("?", normalized)
+    normalized = _IN_LIST_RE.sub("(?...)", normalized)
+    return _SPACE_RE.sub(" ", normalized).strip()
+
+
+def _stack() -> list[traceback.FrameSummary]:
+    """Çağrı yığını, async sorgular için greenlet sınırının ötesi dahil.
+
+    AsyncSession sorguları SQLAlchemy'nin açtığı bir greenlet içinde çalışır; o greenlet'in yığınında
+    yalnızca SQLAlchemy çerçeveleri vardır. ``await`` eden kod (crud, route) ebeveyn greenlet'in askıdaki
+    çerçevelerindedir, bu yüzden ebeveynlerin yığınları da en dıştan içe doğru eklenir.
+    """
+    stack = traceback.extract_stack()
+    if greenlet is None:
+        return stack
+    current = greenlet.getcurrent().parent
+    while current is not None:
+        if current.gr_frame is not None:
+            stack = traceback.extract_stack(current.gr_frame) + stack
+        current = current.parent
+    return stack
+
+
+def _call_site() -> str:
+    """Sorguyu tetikleyen uygulama kodu: en içteki iki app/ çerçevesi (ör. crud <- route)."""
+    frames = [
+        frame for frame in _stack() if frame.filename.startswith(_APP_ROOT) and frame.filename != _THIS_FILE
+    ]
+    return " <- ".join(
+        f"{Path(frame.filename).relative_to(_APP_ROOT).as_posix()}:{frame.lineno} in {frame.name}"
+        for frame in reversed(frames[-2:])
+    ) or "<unknown>"
+
+
+@dataclass
+class QueryRecord:
+    fingerprint: str
+    seconds: float
+    call_site: str
+
+
+@dataclass
+class QueryLog:
+    """Bir istek veya test bloğu boyunca çalışan sorgular."""
+
+    label: str = ""
+    records: list[QueryRecord] = field(default_factory=list)
+    started_at: float = field(default_factory=time.perf_counter)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, record: QueryRecord) -> None:
+        with self._lock:
+            self.records.append(record)
+
+    @property
+    def query_count(self) -> int:
+        return len(self.records)
+
+    @property
+    def query_seconds(self) -> float:
+        return sum(record.seconds for record in self.records)
+
+    def repeated(self, threshold: int) -> list[tuple[str, int, list[str]]]:
+        """``threshold`` veya daha fazla kez çalışan sorgu şekilleri: (parmak izi, adet, çağrı yerleri)."""
+        counts = Counter(record.fingerprint for record in self.records)
+        result = []
+        for shape, count in counts.most_common():
+            if count < threshold:
+                break
+            sites = Counter(record.call_site for record in self.records if record.fingerprint == shape)
+            result.append((shape, count, [site for site, _ in sites.most_common(3)]))
+        return result
+
+    def problems(
+        self,
+        *,
+        max_queries: int | None = None,
+        max_seconds: float | None = None,
+        repeat_threshold: int | None = None,
+    ) -> list[str]:
+        max_queries = settings.query_debug_max_queries if max_queries is None else max_queries
+        max_seconds = settings.query_debug_max_seconds if max_seconds is None else max_seconds
+        repeat_threshold = settings.query_debug_repeat_threshold if repeat_threshold is None else repeat_threshold
+
+        found = []
+        if self.query_count > max_queries:
+            found.append(f"{self.query_count} queries (budget {max_queries})")
+        elapsed = time.perf_counter() - self.started_at
+        if elapsed > max_seconds:
+            found.append(f"{elapsed * 1000:.0f} ms, {self.query_seconds * 1000:.0f} ms in SQL (budget {max_seconds * 1000:.0f} ms)")
+        for shape, count, sites in self.repeated(repeat_threshold):
+            found.append(f"possible N+1: {count}x {shape[:200]}\n      at " + "\n      at ".join(sites))
+        return found
+
+
+_current_log: ContextVar[QueryLog | None] = ContextVar("current_query_log", default=None)
+# TestClient uygulamayı başka bir thread'de çalıştırır; test yakalamaları context'ten bağımsız tutulur
+_captures: list[QueryLog] = []
+_captures_lock = threading.Lock()
+_installed = False
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("querylog_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    seconds = time.perf_counter() - conn.info["querylog_started_at"].pop()
+    request_log = _current_log.get()
+    with _captures_lock:
+        targets = list(_captures)
+    if request_log is not None:
+        targets.append(request_log)
+    if not targets and seconds * 1000 < settings.query_debug_slow_query_ms:
+        return
+
+    record = QueryRecord(fingerprint(statement), seconds, _call_site())
+    for log in targets:
+        log.add(record)
+    if seconds * 1000 >= settings.query_debug_slow_query_ms:
+        logger.warning("Slow query (%.0f ms) at %s: %s", seconds * 1000, record.call_site, record.fingerprint[:500])
+
+
+def _handle_error(exception_context):
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("querylog_started_at"):
+        connection.info["querylog_started_at"].pop()
+
+
+def install() -> None:
+    """Engine olay dinleyicilerini bir kez kaydet (tüm engine'ler, async olanlar dahil)."""
+    global _installed
+    if _installed:
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+    _installed = True
+
+
+@contextmanager
+def capture(label: str = ""):
+    """Blok içinde (hangi thread'de olursa olsun) çalışan tüm sorguları topla."""
+    install()
+    log = QueryLog(label=label)
+    with _captures_lock:
+        _captures.append(log)
+    try:
+        yield log
+    finally:
+        with _captures_lock:
+            _captures.remove(log)
+
+
+class QueryDebugMiddleware:
+    """İstek başına QueryLog tutar ve bütçeyi aşan istekleri loglar (yalnızca ``query_debug`` açıkken eklenir)."""
+
+    def __init__(self, app):
+        self.app = app
+        install()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        log = QueryLog(label=f"{scope['method']} {scope['path']}")
+        token = _current_log.set(log)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_log.reset(token)
+            problems = log.problems()
+            if problems:
+                logger.warning("Query budget exceeded for %s:\n  - %s", log.label, "\n  - ".join(problems))
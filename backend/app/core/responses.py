@@ -0,0 +1,26 @@
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class FastJSONResponse(ORJSONResponse):
+    """Uygulamanın varsayılan yanıt sınıfı; orjson ile serileştirir.
+
+    Route'lar kendi kurdukları Pydantic modellerini doğrudan bu sınıfla döndürebilir: FastAPI, dönen
+    değer bir Response olduğunda ``response_model`` ile ikinci kez doğrulama ve jsonable_encoder
+    adımlarını atlar. ``response_model`` yine de OpenAPI şeması için route üzerinde kalmalıdır.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
@@ -1,5 +1,8 @@
+import asyncio
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict
+from typing import Any, Callable, Dict, TypeVar
 
 from jose import jwt
 from passlib.context import CryptContext
@@ -7,10 +10,59 @@ import pyotp
 
 from app.core.config import get_settings
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
 settings = get_settings()
+pwd_context = CryptContext(
+    schemes=["argon2"],
+    deprecated="auto",
+    argon2__time_cost=settings.argon2_time_cost,
+    argon2__memory_cost=settings.argon2_memory_cost,
+    argon2__parallelism=settings.argon2_parallelism,
+)
 ALGORITHM = "HS256"
 
+T = TypeVar("T")
+
+# Argon2 CPU ve bellek yoğun: aynı anda en fazla `password_hash_workers` işlem çalışır,
+# `password_hash_queue_size` kadarı sırada bekler. Fazlası PasswordHashingBusy alır. Bekleme ve
+# hesaplama event loop'ta await edilir; login patlaması istek threadpool'undan thread tutmaz.
+_password_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers, thread_name_prefix="password-hash"
+)
+# asyncio.Semaphore ilk beklemede event loop'a bağlanır; her loop (ör. testlerdeki) kendi semaforunu alır
+_password_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class PasswordHashingBusy(Exception):
+    """Parola işlemleri kuyruğu dolu; istemci daha sonra tekrar denemeli (503)."""
+
+
+def _slots(loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+    slots = _password_slots.get(loop)
+    if slots is None:
+        slots = _password_slots[loop] = asyncio.Semaphore(
+            settings.password_hash_workers + settings.password_hash_queue_size
+        )
+    return slots
+
+
+async def _run_password_op(fn: Callable[..., T], *args: Any) -> T:
+    loop = asyncio.get_running_loop()
+    slots = _slots(loop)
+    try:
+        await asyncio.wait_for(slots.acquire(), timeout=settings.password_hash_queue_timeout_seconds)
+    except asyncio.TimeoutError:
+        raise PasswordHashingBusy() from None
+    try:
+        future = _password_executor.submit(fn, *args)
+    except BaseException:
+        slots.release()
+        raise
+    # Slot, istek iptal edilse bile iş gerçekten bitince bırakılır
+    future.add_done_callback(lambda _: loop.is_closed() or loop.call_soon_threadsafe(slots.release))
+    return await asyncio.wrap_future(future)
+
 
 def create_access_token(subject: str, expires_delta: timedelta | None = None) -> str:
     expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=settings.access_token_expire_minutes))
@@ -28,7 +80,17 @@ def decode_token(token: str) -> Dict[str, Any]:
     return jwt.decode(token, settings.secret_key, algorithms=[ALGORITHM])
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """İstek yolunda kullanılır: sınırlı parola havuzunda çalışır, kuyruk doluysa PasswordHashingBusy."""
+    return await _run_password_op(pwd_context.verify, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await _run_password_op(pwd_context.hash, password)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Çağıran thread'de çalışır; script'ler ve tek seferlik işler için."""
     return pwd_context.verify(plain_password, hashed_password)
 
 
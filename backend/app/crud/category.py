@@ -1,3 +1,7 @@
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models.category import Category
@@ -9,6 +13,7 @@ def create(db: Session, category_in: CategoryCreate) -> Category:
     db.add(db_obj)
     db.commit()
     db.refresh(db_obj)
+    _invalidate_tree()
     return db_obj
 
 
@@ -18,9 +23,16 @@ def update(db: Session, category: Category, category_in: CategoryUpdate) -> Cate
     db.add(category)
     db.commit()
     db.refresh(category)
+    _invalidate_tree()
     return category
 
 
+def _invalidate_tree() -> None:
+    from app.services import category_tree
+
+    category_tree.invalidate()
+
+
 def get_all(db: Session, skip: int = 0, limit: int = 100):
     """Tüm kategorileri getir"""
     return (
@@ -31,6 +43,26 @@ def get_all(db: Session, skip: int = 0, limit: int = 100):
     )
 
 
+_VERSION_STATEMENT = select(func.count(Category.id), func.max(Category.updated_at))
+# Ağaç için yalnızca hiyerarşi kolonları; attributes JSONB'si yüklenmez
+_TREE_STATEMENT = select(Category.id, Category.parent_id, Category.name, Category.slug).order_by(Category.name)
+
+
+def get_version(db: Session) -> tuple[int, datetime | None]:
+    """Kategori listesinin sürümü: (adet, en son güncelleme); ETag/Last-Modified ve ağaç önbelleği için."""
+    count, last_modified = db.execute(_VERSION_STATEMENT).one()
+    return count, last_modified
+
+
+async def get_version_async(db: AsyncSession) -> tuple[int, datetime | None]:
+    count, last_modified = (await db.execute(_VERSION_STATEMENT)).one()
+    return count, last_modified
+
+
 def get_tree(db: Session):
-    """Kategori ağacını getir (hierarchical)"""
-    return db.query(Category).all()
+    """Ağaç satırları: (id, parent_id, name, slug); hiyerarşi app.services.category_tree'de kurulur."""
+    return db.execute(_TREE_STATEMENT).all()
+
+
+async def get_tree_async(db: AsyncSession):
+    return (await db.execute(_TREE_STATEMENT)).all()
@@ -1,7 +1,12 @@
-from sqlalchemy.orm import Session
+from datetime import datetime
+
+from sqlalchemy import Integer, literal_column, select, tuple_
+from sqlalchemy.orm import Session, joinedload
 from uuid import UUID
 
+from app.core.pagination import decode_cursor, encode_cursor
 from app.models.comment_reply import CommentReply
+from app.models.user import User
 
 
 def create_reply(db: Session, review_id: UUID, user_id: UUID, body: str, parent_reply_id: UUID = None) -> CommentReply:
@@ -29,3 +34,77 @@ def get_reply_children(db: Session, parent_reply_id: UUID):
         CommentReply.parent_reply_id == parent_reply_id
     ).all()
 
+
+def get_reply_tree(
+    db: Session,
+    review_id: UUID,
+    *,
+    max_depth: int,
+    skip: int = 0,
+    limit: int = 20,
+    cursor: str | None = None,
+) -> list[CommentReply]:
+    """Bir yorumun yanıt ağaçlarını tek bir recursive CTE sorgusuyla getir.
+
+    Sayfalama en üst seviye yanıtlar üzerinde (created_at, id) keyset'i ile yapılır; her
+    sayfadaki başlıkların ``max_depth`` seviyeye kadar tüm alt yanıtları ve yazarları aynı
+    sorguda yüklenir. Dönen düz liste ``build_reply_tree`` ile iç içe yapıya çevrilir.
+    """
+    roots = (
+        select(CommentReply.id, literal_column("1", Integer).label("depth"))
+        .where(CommentReply.review_id == review_id, CommentReply.parent_reply_id.is_(None))
+        .order_by(CommentReply.created_at, CommentReply.id)
+        .limit(limit)
+    )
+    if cursor:
+        roots = roots.where(tuple_(CommentReply.created_at, CommentReply.id) > _decode_cursor(cursor))
+    else:
+        roots = roots.offset(skip)
+
+    tree = roots.subquery("roots").select().cte("reply_tree", recursive=True)
+    children = (
+        # Sabitler literal olarak yazılır; bağlı parametre int8 gelirse recursive terimin tipi int4 ile çakışır
+        select(CommentReply.id, (tree.c.depth + literal_column("1", Integer)).label("depth"))
+        .join(tree, CommentReply.parent_reply_id == tree.c.id)
+        .where(tree.c.depth < max_depth)
+    )
+    tree = tree.union_all(children)
+
+    stmt = (
+        select(CommentReply)
+        .join(tree, CommentReply.id == tree.c.id)
+        .options(joinedload(CommentReply.author).load_only(User.id, User.email, User.full_name))
+        .order_by(tree.c.depth, CommentReply.created_at, CommentReply.id)
+    )
+    return db.scalars(stmt).all()
+
+
+def build_reply_tree(replies: list[CommentReply], serialize) -> list[dict]:
+    """Düz yanıt listesini O(n) sürede iç içe ``child_replies`` yapısına çevir.
+
+    ``replies`` ebeveynler çocuklarından önce gelecek şekilde sıralı olmalıdır (derinliğe göre).
+    """
+    nodes: dict[UUID, dict] = {}
+    roots: list[dict] = []
+    for reply in replies:
+        node = serialize(reply)
+        node["child_replies"] = []
+        nodes[reply.id] = node
+        parent = nodes.get(reply.parent_reply_id) if reply.parent_reply_id else None
+        if parent is not None:
+            parent["child_replies"].append(node)
+        else:
+            roots.append(node)
+    return roots
+
+
+def build_cursor(reply: CommentReply) -> str:
+    return encode_cursor({"c": reply.created_at.isoformat(), "id": reply.id})
+
+
+def _decode_cursor(cursor: str):
+    payload = decode_cursor(cursor)
+    try:
+        return tuple_(datetime.fromisoformat(payload["c"]), UUID(payload["id"]))
+    except (KeyError, TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
@@ -1,6 +1,11 @@
-from sqlalchemy.orm import Session
+from datetime import datetime
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
 from uuid import UUID
 
+from app.core.pagination import decode_cursor, encode_cursor
 from app.models.favorite import FavoriteProduct
 
 
@@ -41,8 +46,35 @@ def is_favorite(db: Session, user_id: UUID, product_id: UUID) -> bool:
     ).first() is not None
 
 
-def get_user_favorites(db: Session, user_id: UUID, skip: int = 0, limit: int = 100):
-    return db.query(FavoriteProduct).filter(
-        FavoriteProduct.user_id == user_id
-    ).offset(skip).limit(limit).all()
+async def is_favorite_async(db: AsyncSession, user_id: UUID, product_id: UUID) -> bool:
+    stmt = select(FavoriteProduct.id).where(
+        FavoriteProduct.user_id == user_id, FavoriteProduct.product_id == product_id
+    )
+    return (await db.scalar(stmt.limit(1))) is not None
+
+
+def get_user_favorites(db: Session, user_id: UUID, skip: int = 0, limit: int = 100, cursor: str | None = None):
+    """Favorileri ürünleriyle birlikte tek sorguda getir (en yeni favori önce).
+
+    cursor verildiğinde OFFSET yerine (created_at, id) keyset'i kullanılır.
+    """
+    query = (
+        db.query(FavoriteProduct)
+        .options(joinedload(FavoriteProduct.product, innerjoin=True))
+        .filter(FavoriteProduct.user_id == user_id)
+        .order_by(FavoriteProduct.created_at.desc(), FavoriteProduct.id.desc())
+    )
+    if cursor:
+        payload = decode_cursor(cursor)
+        try:
+            last_seen = tuple_(datetime.fromisoformat(payload["c"]), UUID(payload["id"]))
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ValueError("Invalid cursor") from exc
+        query = query.filter(tuple_(FavoriteProduct.created_at, FavoriteProduct.id) < last_seen)
+    else:
+        query = query.offset(skip)
+    return query.limit(limit).all()
+
 
+def build_cursor(favorite: FavoriteProduct) -> str:
+    return encode_cursor({"c": favorite.created_at.isoformat(), "id": favorite.id})
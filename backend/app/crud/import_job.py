@@ -0,0 +1,116 @@
+from dataclasses import asdict
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from uuid import UUID
+
+from app.models.import_job import ImportJob, ImportJobStatusEnum
+from app.services.importer import Checkpoint, ImportReport, RowError
+
+UNFINISHED_STATUSES = (ImportJobStatusEnum.queued, ImportJobStatusEnum.running)
+
+
+def create(
+    db: Session,
+    *,
+    created_by: UUID | None,
+    fmt: str,
+    filename: str | None,
+    file_path: str,
+    total_bytes: int,
+    source: str | None = None,
+) -> ImportJob:
+    job = ImportJob(
+        created_by=created_by,
+        format=fmt,
+        filename=filename,
+        file_path=file_path,
+        total_bytes=total_bytes,
+        source=source,
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def get(db: Session, job_id) -> ImportJob | None:
+    try:
+        job_uuid = UUID(str(job_id))
+    except ValueError:
+        return None
+    return db.get(ImportJob, job_uuid)
+
+
+def get_unfinished(db: Session) -> list[ImportJob]:
+    return list(db.scalars(select(ImportJob).where(ImportJob.status.in_(UNFINISHED_STATUSES))))
+
+
+def start_run(db: Session, job: ImportJob) -> None:
+    """İşi çalışıyor olarak işaretle; hız/ETA bu çalıştırmanın başladığı checkpoint'e göre hesaplanır."""
+    job.status = ImportJobStatusEnum.running
+    job.attempts += 1
+    job.error = None
+    job.finished_at = None
+    job.run_started_at = datetime.utcnow()
+    job.run_start_offset = job.checkpoint_offset
+    job.run_start_rows = job.total_rows
+    db.commit()
+
+
+def requeue(db: Session, job: ImportJob) -> None:
+    job.status = ImportJobStatusEnum.queued
+    db.commit()
+
+
+def report_from(job: ImportJob) -> ImportReport:
+    """Kayıtlı sayaçlardan importer raporunu yeniden kur (devam eden işlerde sayaçlar kaldığı yerden artar)."""
+    return ImportReport(
+        format=job.format,
+        total_rows=job.total_rows,
+        imported=job.imported,
+        updated=job.updated,
+        failed=job.failed,
+        errors=[RowError(**error) for error in job.errors or []],
+        errors_truncated=job.errors_truncated,
+    )
+
+
+def checkpoint_from(job: ImportJob) -> Checkpoint:
+    return Checkpoint(offset=job.checkpoint_offset, line=job.checkpoint_line)
+
+
+def record_checkpoint(db: Session, job: ImportJob, report: ImportReport, checkpoint: Checkpoint) -> None:
+    """Grup commit'inden önce çağrılır; commit etmez, ürün satırlarıyla aynı transaction'da yazılır."""
+    job.checkpoint_offset = checkpoint.offset
+    job.checkpoint_line = checkpoint.line
+    job.total_rows = report.total_rows
+    job.imported = report.imported
+    job.updated = report.updated
+    job.failed = report.failed
+    job.errors = [asdict(error) for error in report.errors]
+    job.errors_truncated = report.errors_truncated
+    db.add(job)
+
+
+def finish(db: Session, job: ImportJob, *, error: str | None = None) -> None:
+    job.status = ImportJobStatusEnum.failed if error else ImportJobStatusEnum.completed
+    job.error = error
+    job.finished_at = datetime.utcnow()
+    db.commit()
+
+
+def progress(job: ImportJob, now: datetime | None = None) -> dict:
+    """İlerleme yüzdesi, bu çalıştırmadaki satır/saniye hızı ve bayt hızından tahmini kalan süre."""
+    now = now or datetime.utcnow()
+    percent = 100.0 if not job.total_bytes else round(100 * job.checkpoint_offset / job.total_bytes, 1)
+    rows_per_second = eta_seconds = None
+    if job.run_started_at:
+        elapsed = ((job.finished_at or now) - job.run_started_at).total_seconds()
+        if elapsed > 0:
+            rows_per_second = round((job.total_rows - job.run_start_rows) / elapsed, 1)
+            bytes_per_second = (job.checkpoint_offset - job.run_start_offset) / elapsed
+            if job.status == ImportJobStatusEnum.running and bytes_per_second > 0:
+                eta_seconds = round((job.total_bytes - job.checkpoint_offset) / bytes_per_second, 1)
+    return {"percent": percent, "rows_per_second": rows_per_second, "eta_seconds": eta_seconds}
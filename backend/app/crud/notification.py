@@ -1,3 +1,5 @@
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from uuid import UUID
 from datetime import datetime
@@ -62,9 +64,17 @@ def mark_all_read(db: Session, user_id: UUID) -> int:
     return count
 
 
-def get_unread_count(db: Session, user_id: UUID) -> int:
-    return db.query(Notification).filter(
+def _unread_count_statement(user_id: UUID) -> Select:
+    return select(func.count(Notification.id)).where(
         Notification.user_id == user_id,
         Notification.is_read == False
-    ).count()
+    )
+
+
+def get_unread_count(db: Session, user_id: UUID) -> int:
+    return db.scalar(_unread_count_statement(user_id))
+
+
+async def get_unread_count_async(db: AsyncSession, user_id: UUID) -> int:
+    return await db.scalar(_unread_count_statement(user_id))
 
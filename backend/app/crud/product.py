@@ -1,11 +1,54 @@
-from typing import Any, Dict, Optional
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Optional
 
-from sqlalchemy import func, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import Numeric, Select, case, cast, func, literal_column, or_, select, tuple_
+from sqlalchemy import update as sql_update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only
 
+from app.core.pagination import decode_cursor, encode_cursor
 from app.models.product import Product
 from app.models.review import Review, ReviewStatusEnum
 from app.schemas.product import ProductCreate, ProductUpdate
+from app.services import search as search_service
+from app.services.fingerprint import product_fingerprint
+
+_TS_CONFIG = literal_column("'simple'::regconfig")
+
+
+class DuplicateProductError(Exception):
+    """Aynı marka + model + özelliklere (parmak izine) sahip bir ürün zaten var."""
+
+    def __init__(self, product_id):
+        super().__init__(f"Product already exists: {product_id}")
+        self.product_id = product_id
+
+
+def get_id_by_fingerprint(db: Session, fingerprint: str) -> Optional[uuid.UUID]:
+    """``ix_products_fingerprint`` (unique) üzerinden tek index araması."""
+    return db.scalar(select(Product.id).where(Product.fingerprint == fingerprint))
+
+
+def _commit_or_duplicate(db: Session, fingerprint: str) -> None:
+    # Eşzamanlı iki istek ön kontrolü birlikte geçebilir; unique index ikincisini reddeder
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        existing_id = get_id_by_fingerprint(db, fingerprint)
+        if existing_id is None:
+            raise
+        raise DuplicateProductError(existing_id)
+    _invalidate_brands()
+
+
+def _invalidate_brands() -> None:
+    from app.services import brand_registry
+
+    brand_registry.invalidate()
 
 
 def create(db: Session, product_in: ProductCreate) -> Product:
@@ -26,10 +69,16 @@ def create(db: Session, product_in: ProductCreate) -> Product:
     # Product oluştur
     product_data = product_in.model_dump(exclude={'category_id'})
     product_data['category_id'] = category_uuid
-    
+
+    # Aynı ürün zaten kataloğa girmişse yenisini oluşturma
+    fingerprint = product_fingerprint(product_data['brand'], product_data['model'], product_data.get('specs'))
+    existing_id = get_id_by_fingerprint(db, fingerprint)
+    if existing_id is not None:
+        raise DuplicateProductError(existing_id)
+
     db_obj = Product(**product_data)
     db.add(db_obj)
-    db.commit()
+    _commit_or_duplicate(db, fingerprint)
     db.refresh(db_obj)
     return db_obj
 
@@ -38,109 +87,307 @@ def update(db: Session, product: Product, product_in: ProductUpdate) -> Product:
     for field, value in product_in.model_dump(exclude_unset=True).items():
         setattr(product, field, value)
     db.add(product)
-    db.commit()
+    # Parmak izi before_update olayında yeniden hesaplanır (bkz. models/product.py)
+    _commit_or_duplicate(db, product_fingerprint(product.brand, product.model, product.specs))
     db.refresh(product)
     return product
 
 
-def get(db: Session, product_id: str) -> Optional[Product]:
-    import uuid
-    # product_id'yi UUID'ye çevir
+def _get_statement(product_id) -> Select:
     product_uuid = uuid.UUID(product_id) if isinstance(product_id, str) else product_id
-    return db.query(Product).filter(Product.id == product_uuid).first()
+    return select(Product).where(Product.id == product_uuid)
+
+
+def get(db: Session, product_id: str) -> Optional[Product]:
+    return db.scalars(_get_statement(product_id)).first()
+
+
+async def get_async(db: AsyncSession, product_id: str) -> Optional[Product]:
+    return (await db.scalars(_get_statement(product_id))).first()
+
+
+async def get_many_async(db: AsyncSession, product_ids: Iterable[uuid.UUID]) -> dict[uuid.UUID, Product]:
+    """Verilen id'lerdeki ürünleri tek bir ``IN`` sorgusuyla getir; sonuç id -> ürün sözlüğüdür."""
+    product_ids = list(product_ids)
+    if not product_ids:
+        return {}
+    products = (await db.scalars(select(Product).where(Product.id.in_(product_ids)))).all()
+    return {product.id: product for product in products}
+
+
+# Sıralama anahtarı -> (kolon, azalan mı, NULL olabilir mi, cursor değerini çözen fonksiyon)
+_SORTS = {
+    "newest": (Product.created_at, True, False, datetime.fromisoformat),
+    "price_asc": (Product.price, False, True, Decimal),
+    "price_desc": (Product.price, True, True, Decimal),
+    "rating_desc": (Product.average_rating, True, True, Decimal),
+}
+
+
+def resolve_sort(sort_by: str | None, search: str | None = None) -> str:
+    """Etkin sıralama anahtarını belirle; arama varken açık bir sıralama yoksa alaka düzeyine göre sıralanır."""
+    if sort_by in _SORTS:
+        return sort_by
+    if search and sort_by in (None, "relevance"):
+        return "relevance"
+    return "newest"
 
 
-def get_multi(
-    db: Session,
+def _order_by(sort_key: str):
+    column, descending, nullable, _ = _SORTS[sort_key]
+    ordered = column.desc() if descending else column.asc()
+    if nullable:
+        ordered = ordered.nullslast()
+    # id ikincil anahtar: aynı fiyat/puana sahip ürünlerde sayfa sınırı kararlı kalır
+    return ordered, Product.id.desc() if descending else Product.id.asc()
+
+
+def _multi_statements(
     *,
     skip: int = 0,
     limit: int = 20,
     brand: str | None = None,
     category_id: str | None = None,
+    category_ids: Iterable[uuid.UUID] | None = None,
     search: str | None = None,
     sort_by: str | None = None,
     min_rating: float | None = None,
-):
-    query = db.query(Product)
+    cursor: str | None = None,
+    columns: Iterable[str] | None = None,
+) -> tuple[Select, Select | None, int]:
+    """Ürün listesi sorgularını kur: (sayfa sorgusu, NULL kuyruğu sorgusu veya None, limit).
+
+    Sync ve async listeleme aynı sorguları çalıştırır; NULL kuyruğu sorgusu yalnızca
+    sayfa dolmadığında, kalan satır sayısı kadar limitlenerek çalıştırılır. ``columns`` verilirse
+    yalnızca bu kolonlar (ve cursor için sıralama kolonu) SELECT edilir. ``category_ids`` (ör. bir
+    kategorinin alt ağacı) tek bir ``IN`` filtresine dönüşür.
+    """
+    query = select(Product)
     
     # Filtreleme
     if brand:
         query = query.filter(Product.brand.ilike(f"%{brand}%"))
     if category_id:
-        import uuid
         category_uuid = uuid.UUID(category_id) if isinstance(category_id, str) else category_id
         query = query.filter(Product.category_id == category_uuid)
+    if category_ids is not None:
+        query = query.filter(Product.category_id.in_(sorted(category_ids)))
+    search_rank = None
     if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            or_(
-                Product.brand.ilike(search_term),
-                Product.model.ilike(search_term)
-            )
-        )
+        query, search_rank = _apply_search(query, search)
     if min_rating is not None:
         query = query.filter(Product.average_rating >= min_rating)
     
-    # Sıralama
-    if sort_by == "price_asc":
-        query = query.order_by(Product.price.asc().nullslast())
-    elif sort_by == "price_desc":
-        query = query.order_by(Product.price.desc().nullslast())
-    elif sort_by == "rating_desc":
-        query = query.order_by(Product.average_rating.desc().nullslast())
+    # Sıralama (varsayılan: en yeni ürünler, arama varsa alaka düzeyi)
+    sort_key = resolve_sort(sort_by, search)
+    limit = min(limit, 100)
+    if columns is not None:
+        loaded = {getattr(Product, name) for name in columns}
+        if sort_key in _SORTS:
+            loaded.add(_SORTS[sort_key][0])  # build_cursor sıralama değerini okur
+        query = query.options(load_only(*loaded))
+    if sort_key == "relevance":
+        if cursor:
+            raise ValueError("Cursor pagination requires an explicit sort_by when searching")
+        query = query.order_by(search_rank.desc(), Product.id.desc())
     else:
-        # Varsayılan: en yeni ürünler
-        query = query.order_by(Product.created_at.desc())
-    
-    return (
-        query.offset(skip)
-        .limit(min(limit, 100))
-        .all()
-    )
+        query = query.order_by(*_order_by(sort_key))
 
+    if cursor:
+        page, null_tail = _after_cursor_statements(query, sort_key, cursor)
+        return page.limit(limit), null_tail, limit
+    return query.offset(skip).limit(limit), None, limit
 
-def get_distinct_brands(db: Session) -> list[str]:
-    """Veritabanındaki tüm ürünlerin tekilleştirilmiş markalarını getir."""
-    from sqlalchemy import distinct
-    
-    brands = (
-        db.query(distinct(Product.brand))
-        .filter(Product.brand.isnot(None))
-        .order_by(Product.brand.asc())
-        .all()
+
+def get_multi(db: Session, **filters) -> list[Product]:
+    page, null_tail, limit = _multi_statements(**filters)
+    products = list(db.scalars(page))
+    if null_tail is not None and len(products) < limit:
+        products += db.scalars(null_tail.limit(limit - len(products))).all()
+    return products
+
+
+async def get_multi_async(db: AsyncSession, **filters) -> list[Product]:
+    page, null_tail, limit = _multi_statements(**filters)
+    products = list((await db.scalars(page)).all())
+    if null_tail is not None and len(products) < limit:
+        products += (await db.scalars(null_tail.limit(limit - len(products)))).all()
+    return products
+
+
+def _apply_search(query: Select, search: str):
+    """Aramayı GIN index'li üretilmiş kolonlara yönlendir; filtrelenmiş sorgu ile sıralama puanını döndürür.
+
+    search_vector önek eşleşmeli kelime aramasını (specs dahil), search_text ise pg_trgm üzerinden
+    eski ``%terim%`` alt dizi davranışını karşılar. Her ikisi de Türkçe karakterlerden arındırılmıştır.
+    """
+    term = search_service.fold(search.strip())
+    substring_match = Product.search_text.contains(term, autoescape=True)
+    rank = func.similarity(Product.search_text, term)
+
+    tsquery_text = search_service.to_prefix_tsquery(search)
+    if tsquery_text is None:
+        return query.filter(substring_match), rank
+
+    tsquery = func.to_tsquery(_TS_CONFIG, tsquery_text)
+    query = query.filter(or_(Product.search_vector.bool_op("@@")(tsquery), substring_match))
+    return query, func.ts_rank_cd(Product.search_vector, tsquery) + rank
+
+
+def _after_cursor_statements(query: Select, sort_key: str, cursor: str) -> tuple[Select, Select | None]:
+    """Keyset sayfalama: OFFSET yerine son görülen (sıralama değeri, id) çiftinden devam eder."""
+    column, descending, nullable, parse = _SORTS[sort_key]
+    payload = decode_cursor(cursor)
+    if payload.get("s") != sort_key or "id" not in payload:
+        raise ValueError("Cursor does not match the requested sort order")
+    try:
+        last_id = uuid.UUID(str(payload["id"]))
+        value = parse(payload["v"]) if payload.get("v") is not None else None
+    except (ValueError, TypeError, ArithmeticError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+    id_after = Product.id < last_id if descending else Product.id > last_id
+    if value is None:
+        # NULL kuyruğundayız (nullslast): yalnızca id ile ilerle
+        return query.filter(column.is_(None), id_after), None
+
+    # Satır karşılaştırması, (kolon, id) bileşik index'inde doğrudan aralık taramasına dönüşür
+    boundary = tuple_(column, Product.id)
+    last_seen = tuple_(value, last_id)
+    after = boundary < last_seen if descending else boundary > last_seen
+    # Satır karşılaştırması NULL değerleri dışarıda bırakır; sayfanın kalanı NULL kuyruğundan gelir
+    null_tail = query.filter(column.is_(None)) if nullable else None
+    return query.filter(after), null_tail
+
+
+def build_cursor(product: Product, sort_key: str) -> str | None:
+    """Verilen ürünün ardından gelen sayfayı işaret eden opak cursor'ı üret (alaka sıralamasında yok)."""
+    if sort_key not in _SORTS:
+        return None
+    column = _SORTS[sort_key][0]
+    return encode_cursor({"s": sort_key, "v": getattr(product, column.key), "id": product.id})
+
+
+def get_catalog_version(db: Session) -> tuple[int, datetime | None]:
+    """Katalog sürümü: (ürün sayısı, en son güncelleme); adet, max(updated_at)'in kaçırdığı silmeleri yakalar."""
+    count, last_modified = db.execute(select(func.count(Product.id), func.max(Product.updated_at))).one()
+    return count, last_modified
+
+
+def get_brand_counts(db: Session):
+    """(category_id, brand, ürün sayısı) satırları; markaya göre sıralı. Marka kaydı (app.services.brand_registry) için."""
+    return db.execute(
+        select(Product.category_id, Product.brand, func.count())
+        .where(Product.brand.isnot(None), Product.brand != "")
+        .group_by(Product.category_id, Product.brand)
+        .order_by(Product.brand.asc(), Product.category_id)
+    ).all()
+
+
+RATING_HISTOGRAM = {star: getattr(Product, f"rating_{star}_count") for star in range(1, 6)}
+
+
+def _average(rating_sum, review_count):
+    return case(
+        (review_count > 0, func.round(cast(rating_sum, Numeric) / review_count, 2)),
+        else_=None,
     )
-    # Tuple'ları string'e çevir
-    return [brand[0] for brand in brands if brand[0]]
 
 
-def refresh_rating_cache(db: Session, product_id: str) -> Dict[str, Any]:
-    """Recompute rating aggregates and persist denormalized fields on the product row."""
-    import uuid
-    product = get(db, product_id)
-    if not product:
-        return {"average_rating": None, "review_count": 0}
+def apply_rating_delta(db: Session, product_id, rating: int, delta: int) -> None:
+    """Onaylı bir yorumun eklenmesini (+1) veya çıkarılmasını (-1) ürün özetine uygula.
 
-    # product_id'yi UUID'ye çevir
+    Tek bir atomik UPDATE çalıştırır ve commit etmez; çağıran, yorum değişikliğiyle aynı
+    transaction içinde commit eder. Eşzamanlı yorumlarda satır kilidi sayesinde kayıp güncelleme olmaz.
+    """
     product_uuid = uuid.UUID(product_id) if isinstance(product_id, str) else product_id
+    review_count = Product.review_count + delta
+    rating_sum = Product.rating_sum + rating * delta
+    histogram = RATING_HISTOGRAM[rating]
+    db.execute(
+        sql_update(Product)
+        .where(Product.id == product_uuid)
+        .values(
+            {
+                Product.review_count: review_count,
+                Product.rating_sum: rating_sum,
+                histogram: histogram + delta,
+                Product.average_rating: _average(rating_sum, review_count),
+            }
+        )
+        .execution_options(synchronize_session="fetch")
+    )
 
-    agg = (
-        db.query(
-            func.avg(Review.rating).label("average_rating"),
+
+def _expected_rating_aggregates(product_id=None):
+    """Onaylı yorumlardan baştan hesaplanan özet değerleri (ürün başına bir satır)."""
+    approved = (
+        select(
+            Review.product_id,
             func.count(Review.id).label("review_count"),
+            func.sum(Review.rating).label("rating_sum"),
+            *[
+                func.count(Review.id).filter(Review.rating == star).label(f"rating_{star}_count")
+                for star in RATING_HISTOGRAM
+            ],
         )
-        .filter(
-            Review.product_id == product_uuid,
-            Review.status == ReviewStatusEnum.approved,
+        .where(Review.status == ReviewStatusEnum.approved)
+        .group_by(Review.product_id)
+    )
+    if product_id is not None:
+        approved = approved.where(Review.product_id == product_id)
+    approved = approved.subquery()
+
+    products = Product.__table__.alias("expected_product")
+    expected = (
+        select(
+            products.c.id.label("product_id"),
+            func.coalesce(approved.c.review_count, 0).label("review_count"),
+            func.coalesce(approved.c.rating_sum, 0).label("rating_sum"),
+            *[
+                func.coalesce(approved.c[f"rating_{star}_count"], 0).label(f"rating_{star}_count")
+                for star in RATING_HISTOGRAM
+            ],
         )
-        .one()
+        .select_from(products.outerjoin(approved, approved.c.product_id == products.c.id))
     )
-    average = float(agg.average_rating) if agg.average_rating is not None else None
-    review_count = int(agg.review_count)
+    if product_id is not None:
+        expected = expected.where(products.c.id == product_id)
+    return expected.subquery()
 
-    product.average_rating = average
-    product.review_count = review_count
-    db.add(product)
+
+def reconcile_rating_aggregates(db: Session, product_id=None) -> int:
+    """Artımlı puan özetlerindeki sapmaları düzelt; düzeltilen ürün sayısını döndürür.
+
+    Periyodik olarak ``python -m scripts.reconcile_ratings`` ile çalıştırılır. Yalnızca
+    sapmış satırları günceller, böylece tutarlı ürünler için yazma maliyeti oluşmaz.
+    """
+    expected = _expected_rating_aggregates(product_id)
+    columns = ["review_count", "rating_sum", *[f"rating_{star}_count" for star in RATING_HISTOGRAM]]
+    average = _average(expected.c.rating_sum, expected.c.review_count)
+    drifted = [getattr(Product, name).is_distinct_from(expected.c[name]) for name in columns]
+    drifted.append(Product.average_rating.is_distinct_from(average))
+
+    result = db.execute(
+        sql_update(Product)
+        .where(Product.id == expected.c.product_id, or_(*drifted))
+        .values({**{name: expected.c[name] for name in columns}, "average_rating": average})
+        .execution_options(synchronize_session=False)
+    )
     db.commit()
-    db.refresh(product)
+    return result.rowcount
+
 
-    return {"average_rating": average, "review_count": review_count}
+def refresh_rating_cache(db: Session, product_id: str) -> Dict[str, Any]:
+    """Tek bir ürünün puan özetini yorumlardan yeniden hesapla (seed ve manuel düzeltmeler için)."""
+    product_uuid = uuid.UUID(product_id) if isinstance(product_id, str) else product_id
+    reconcile_rating_aggregates(db, product_uuid)
+    row = (
+        db.query(Product.average_rating, Product.review_count)
+        .filter(Product.id == product_uuid)
+        .first()
+    )
+    if not row:
+        return {"average_rating": None, "review_count": 0}
+    average = float(row.average_rating) if row.average_rating is not None else None
+    return {"average_rating": average, "review_count": row.review_count}
@@ -1,7 +1,17 @@
-from sqlalchemy.orm import Session
+from collections import defaultdict
+from datetime import datetime
+
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 from uuid import UUID
 
+from app.core.pagination import decode_cursor, encode_cursor
 from app.models.question import Question, Answer
+from app.models.user import User
+
+_AUTHOR_FIELDS = (User.id, User.email, User.full_name)
 
 
 def create_question(db: Session, product_id: UUID, user_id: UUID, question_text: str) -> Question:
@@ -16,10 +26,96 @@ def create_question(db: Session, product_id: UUID, user_id: UUID, question_text:
     return question
 
 
-def get_product_questions(db: Session, product_id: UUID, skip: int = 0, limit: int = 100):
-    return db.query(Question).filter(
-        Question.product_id == product_id
-    ).order_by(Question.created_at.desc()).offset(skip).limit(limit).all()
+def _product_questions_statement(
+    product_id: UUID, skip: int = 0, limit: int = 100, cursor: str | None = None
+) -> Select:
+    stmt = (
+        select(Question)
+        .options(joinedload(Question.author).load_only(*_AUTHOR_FIELDS))
+        .where(Question.product_id == product_id)
+        .order_by(Question.created_at.desc(), Question.id.desc())
+    )
+    if cursor:
+        payload = decode_cursor(cursor)
+        try:
+            last_seen = tuple_(datetime.fromisoformat(payload["c"]), UUID(payload["id"]))
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ValueError("Invalid cursor") from exc
+        stmt = stmt.where(tuple_(Question.created_at, Question.id) < last_seen)
+    else:
+        stmt = stmt.offset(skip)
+    return stmt.limit(limit)
+
+
+def _top_answers_statement(questions: list[Question], per_question: int) -> Select | None:
+    if not questions or per_question <= 0:
+        return None
+    ranked = (
+        select(
+            Answer.id,
+            func.row_number()
+            .over(
+                partition_by=Answer.question_id,
+                order_by=(Answer.helpful_count.desc(), Answer.created_at, Answer.id),
+            )
+            .label("rank"),
+        )
+        .where(Answer.question_id.in_([q.id for q in questions]))
+        .subquery()
+    )
+    return (
+        select(Answer)
+        .join(ranked, ranked.c.id == Answer.id)
+        .where(ranked.c.rank <= per_question)
+        .options(joinedload(Answer.author).load_only(*_AUTHOR_FIELDS))
+        .order_by(Answer.question_id, ranked.c.rank)
+    )
+
+
+def _attach_answers(questions: list[Question], answers) -> None:
+    answers_by_question = defaultdict(list)
+    for answer in answers:
+        answers_by_question[answer.question_id].append(answer)
+    for question in questions:
+        set_committed_value(question, "answers", answers_by_question[question.id])
+
+
+def get_product_questions(
+    db: Session,
+    product_id: UUID,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+    answers_per_question: int = 3,
+):
+    """Soruları yazarları ve en faydalı ``answers_per_question`` cevabıyla birlikte getir.
+
+    Sayfa büyüklüğünden bağımsız olarak iki sorgu çalışır: sorular + yazarları, ardından
+    tüm sayfanın kırpılmış cevapları + yazarları. ``question.answers`` önceden doldurulur,
+    böylece erişim lazy load tetiklemez.
+    """
+    questions = list(db.scalars(_product_questions_statement(product_id, skip, limit, cursor)))
+    answers_stmt = _top_answers_statement(questions, answers_per_question)
+    _attach_answers(questions, db.scalars(answers_stmt) if answers_stmt is not None else [])
+    return questions
+
+
+async def get_product_questions_async(
+    db: AsyncSession,
+    product_id: UUID,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+    answers_per_question: int = 3,
+):
+    questions = list(await db.scalars(_product_questions_statement(product_id, skip, limit, cursor)))
+    answers_stmt = _top_answers_statement(questions, answers_per_question)
+    _attach_answers(questions, (await db.scalars(answers_stmt)).all() if answers_stmt is not None else [])
+    return questions
+
+
+def build_cursor(question: Question) -> str:
+    return encode_cursor({"c": question.created_at.isoformat(), "id": question.id})
 
 
 def create_answer(db: Session, question_id: UUID, user_id: UUID, answer_text: str) -> Answer:
@@ -1,43 +1,99 @@
-from sqlalchemy.orm import Session, joinedload
+from typing import Iterable
 
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, load_only
+
+from app.crud import product as product_crud
 from app.models.review import Review, ReviewStatusEnum
 from app.schemas.review import ReviewCreate, ReviewUpdate
 
 
-def create(db: Session, review_in: ReviewCreate, *, user_id: str) -> Review:
-    db_obj = Review(**review_in.model_dump(), user_id=user_id)
+def create(
+    db: Session,
+    review_in: ReviewCreate,
+    *,
+    user_id: str,
+    status: ReviewStatusEnum = ReviewStatusEnum.pending,
+) -> Review:
+    db_obj = Review(**review_in.model_dump(), user_id=user_id, status=status)
     db.add(db_obj)
+    if status == ReviewStatusEnum.approved:
+        # Puan özeti yorumla aynı transaction'da güncellenir
+        product_crud.apply_rating_delta(db, db_obj.product_id, db_obj.rating, 1)
     db.commit()
     db.refresh(db_obj)
     return db_obj
 
 
 def update(db: Session, review: Review, review_in: ReviewUpdate) -> Review:
+    old_rating = review.rating
     for field, value in review_in.model_dump(exclude_unset=True).items():
         setattr(review, field, value)
+    if review.status == ReviewStatusEnum.approved and review.rating != old_rating:
+        product_crud.apply_rating_delta(db, review.product_id, old_rating, -1)
+        product_crud.apply_rating_delta(db, review.product_id, review.rating, 1)
     db.add(review)
     db.commit()
     db.refresh(review)
     return review
 
 
-def get_product_reviews_paginated(
-    db: Session,
-    product_id: str,
+def set_status(db: Session, review: Review, status: ReviewStatusEnum) -> Review:
+    """Moderasyon durumunu değiştir; onaya girip çıkan yorumlar ürün puan özetine yansıtılır."""
+    was_approved = review.status == ReviewStatusEnum.approved
+    is_approved = status == ReviewStatusEnum.approved
+    if was_approved != is_approved:
+        product_crud.apply_rating_delta(db, review.product_id, review.rating, 1 if is_approved else -1)
+    review.status = status
+    db.add(review)
+    db.commit()
+    db.refresh(review)
+    return review
+
+
+def get(db: Session, review_id) -> Review | None:
+    return db.get(Review, review_id)
+
+
+def _product_reviews_statement(
+    product_id,
     *,
     skip: int = 0,
     limit: int = 20,
     status: ReviewStatusEnum | None = ReviewStatusEnum.approved,
-):
-    query = (
-        db.query(Review)
-        .options(joinedload(Review.author))
-        .filter(Review.product_id == product_id)
-        .order_by(Review.created_at.desc())
-    )
+    columns: Iterable[str] | None = None,
+) -> Select:
+    stmt = select(Review).where(Review.product_id == product_id).order_by(Review.created_at.desc())
+    if columns is None:
+        stmt = stmt.options(joinedload(Review.author))
+    else:
+        # Seyrek alan seçimi: yazar join'i yok, yalnızca istenen kolonlar
+        stmt = stmt.options(load_only(*(getattr(Review, name) for name in columns)))
     if status:
-        query = query.filter(Review.status == status)
-    return query.offset(skip).limit(min(limit, 100)).all()
+        stmt = stmt.where(Review.status == status)
+    return stmt.offset(skip).limit(min(limit, 100))
+
+
+def _product_reviews_version_statement(product_id) -> Select:
+    # ix_reviews_product_status_created (INCLUDE updated_at) üzerinden index-only tarama
+    return select(func.count(Review.id), func.max(Review.updated_at)).where(
+        Review.product_id == product_id, Review.status == ReviewStatusEnum.approved
+    )
+
+
+async def get_product_reviews_version_async(db: AsyncSession, product_id):
+    """Ürünün onaylı yorumlarının sürümü: (adet, en son güncelleme)."""
+    count, last_modified = (await db.execute(_product_reviews_version_statement(product_id))).one()
+    return count, last_modified
+
+
+def get_product_reviews_paginated(db: Session, product_id: str, **params):
+    return db.scalars(_product_reviews_statement(product_id, **params)).all()
+
+
+async def get_product_reviews_paginated_async(db: AsyncSession, product_id, **params):
+    return (await db.scalars(_product_reviews_statement(product_id, **params))).all()
 
 
 def get_user_reviews(db: Session, user_id: str, *, skip: int = 0, limit: int = 20):
@@ -1,10 +1,26 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import Select, and_, null, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
+from app.models.review import Review
 from app.models.review_like import ReviewLike
 
 
+def _adjust_counters(db: Session, review_id: UUID, like_delta: int, dislike_delta: int) -> None:
+    """Sayaçları atomik olarak güncelle; oy değişikliğiyle aynı transaction'da commit edilir."""
+    db.execute(
+        update(Review)
+        .where(Review.id == review_id)
+        .values(
+            like_count=Review.like_count + like_delta,
+            dislike_count=Review.dislike_count + dislike_delta,
+            updated_at=Review.updated_at,  # Oylar yorumun içeriğini değiştirmez
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
 def toggle_like(db: Session, review_id: UUID, user_id: UUID, is_like: bool) -> ReviewLike:
     existing = db.query(ReviewLike).filter(
         ReviewLike.review_id == review_id,
@@ -15,11 +31,13 @@ def toggle_like(db: Session, review_id: UUID, user_id: UUID, is_like: bool) -> R
         if existing.is_like == is_like:
             # Same action, remove like/dislike
             db.delete(existing)
+            _adjust_counters(db, review_id, -1 if is_like else 0, 0 if is_like else -1)
             db.commit()
             return None
         else:
             # Different action, update
             existing.is_like = is_like
+            _adjust_counters(db, review_id, 1 if is_like else -1, -1 if is_like else 1)
             db.commit()
             db.refresh(existing)
             return existing
@@ -27,34 +45,58 @@ def toggle_like(db: Session, review_id: UUID, user_id: UUID, is_like: bool) -> R
         # New like/dislike
         like = ReviewLike(review_id=review_id, user_id=user_id, is_like=is_like)
         db.add(like)
+        _adjust_counters(db, review_id, 1 if is_like else 0, 0 if is_like else 1)
         db.commit()
         db.refresh(like)
         return like
 
 
-def get_like_stats(db: Session, review_id: UUID, user_id: UUID = None) -> dict:
-    like_count = db.query(func.count(ReviewLike.id)).filter(
-        ReviewLike.review_id == review_id,
-        ReviewLike.is_like == True
-    ).scalar() or 0
-    
-    dislike_count = db.query(func.count(ReviewLike.id)).filter(
-        ReviewLike.review_id == review_id,
-        ReviewLike.is_like == False
-    ).scalar() or 0
-    
-    user_like_status = None
+def _like_stats_statement(review_ids: list[UUID], user_id: UUID = None) -> Select:
     if user_id:
-        user_like = db.query(ReviewLike).filter(
-            ReviewLike.review_id == review_id,
-            ReviewLike.user_id == user_id
-        ).first()
-        if user_like:
-            user_like_status = user_like.is_like
-    
+        own_vote = ReviewLike.is_like
+        source = Review.__table__.outerjoin(
+            ReviewLike.__table__,
+            and_(ReviewLike.review_id == Review.id, ReviewLike.user_id == user_id),
+        )
+    else:
+        own_vote = null()
+        source = Review.__table__
+    return (
+        select(Review.id, Review.like_count, Review.dislike_count, own_vote)
+        .select_from(source)
+        .where(Review.id.in_(review_ids))
+    )
+
+
+def _stats_by_review(rows) -> dict[UUID, dict]:
     return {
-        "like_count": like_count,
-        "dislike_count": dislike_count,
-        "user_like_status": user_like_status,
+        row[0]: {
+            "like_count": row[1],
+            "dislike_count": row[2],
+            "user_like_status": row[3],
+        }
+        for row in rows
     }
 
+
+def get_like_stats_batch(db: Session, review_ids: list[UUID], user_id: UUID = None) -> dict[UUID, dict]:
+    """Birden çok yorumun sayaçlarını ve kullanıcının kendi oyunu tek sorguda getir.
+
+    Sonuçta yalnızca var olan yorumlar yer alır.
+    """
+    if not review_ids:
+        return {}
+    return _stats_by_review(db.execute(_like_stats_statement(review_ids, user_id)))
+
+
+async def get_like_stats_batch_async(
+    db: AsyncSession, review_ids: list[UUID], user_id: UUID = None
+) -> dict[UUID, dict]:
+    if not review_ids:
+        return {}
+    return _stats_by_review(await db.execute(_like_stats_statement(review_ids, user_id)))
+
+
+def get_like_stats(db: Session, review_id: UUID, user_id: UUID = None) -> dict:
+    stats = get_like_stats_batch(db, [review_id], user_id)
+    return stats.get(review_id, {"like_count": 0, "dislike_count": 0, "user_like_status": None})
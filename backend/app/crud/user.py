@@ -1,31 +1,41 @@
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash_async, verify_password_async
 from app.models.user import User
 from app.schemas.user import UserCreate
 
 
+def _by_email_statement(email: str) -> Select:
+    return select(User).where(User.email == email).limit(1)
+
+
 def get_by_email(db: Session, email: str) -> User | None:
-    return db.query(User).filter(User.email == email).first()
+    return db.scalars(_by_email_statement(email)).first()
+
+
+async def get_by_email_async(db: AsyncSession, email: str) -> User | None:
+    return (await db.scalars(_by_email_statement(email))).first()
 
 
-def create(db: Session, user_in: UserCreate) -> User:
+async def create_async(db: AsyncSession, user_in: UserCreate) -> User:
     db_obj = User(
         email=user_in.email,
-        password_hash=get_password_hash(user_in.password),
+        password_hash=await get_password_hash_async(user_in.password),
         full_name=user_in.full_name,
         is_active=True,  # Yeni kullanıcılar varsayılan olarak aktif
         is_superuser=False,  # Yeni kullanıcılar varsayılan olarak admin değil
         two_factor_enabled=user_in.two_factor_enabled,
     )
     db.add(db_obj)
-    db.commit()
-    db.refresh(db_obj)
+    await db.commit()
+    await db.refresh(db_obj)
     return db_obj
 
 
-def authenticate(db: Session, email: str, password: str) -> User | None:
-    user = get_by_email(db, email=email)
-    if not user or not verify_password(password, user.password_hash):
+async def authenticate_async(db: AsyncSession, email: str, password: str) -> User | None:
+    user = await get_by_email_async(db, email=email)
+    if not user or not await verify_password_async(password, user.password_hash):
         return None
     return user
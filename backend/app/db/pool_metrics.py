@@ -0,0 +1,115 @@
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+# Checkout bekleme süresi histogram sınırları (ms)
+CHECKOUT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+class CheckoutStats:
+    """Bir havuzun checkout bekleme istatistikleri; havuz yeniden yaratılsa da korunur."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+        self.peak_in_use = 0
+        self.bucket_counts = [0] * (len(CHECKOUT_BUCKETS_MS) + 1)
+
+    def record(self, wait_ms: float, in_use: int, *, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+            self.peak_in_use = max(self.peak_in_use, in_use)
+            for index, bound in enumerate(CHECKOUT_BUCKETS_MS):
+                if wait_ms <= bound:
+                    self.bucket_counts[index] += 1
+                    break
+            else:
+                self.bucket_counts[-1] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            buckets = {f"le_{bound}ms": count for bound, count in zip(CHECKOUT_BUCKETS_MS, self.bucket_counts)}
+            buckets["gt_%sms" % CHECKOUT_BUCKETS_MS[-1]] = self.bucket_counts[-1]
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait_ms / attempts, 3) if attempts else None,
+                "max_wait_ms": round(self.max_wait_ms, 3),
+                "peak_in_use": self.peak_in_use,
+                "wait_buckets": buckets,
+            }
+
+
+_stats: Dict[str, CheckoutStats] = {}
+_pools: Dict[str, Pool] = {}
+_registry_lock = threading.Lock()
+
+
+def _register(pool: Pool) -> CheckoutStats:
+    name = pool.logging_name or f"pool-{id(pool)}"
+    with _registry_lock:
+        _pools[name] = pool  # engine.dispose() sonrası yeni havuz eskisinin yerini alır
+        return _stats.setdefault(name, CheckoutStats())
+
+
+class _CheckoutTimingMixin:
+    """Pool.connect() süresini ölçer.
+
+    SQLAlchemy'nin ``checkout`` olayı bağlantı alındıktan sonra tetiklenir ve bekleme başlangıcını
+    bilmez; bu yüzden kuyruk beklemesi, yeni bağlantı açma ve pre-ping dahil toplam süre burada ölçülür.
+    """
+
+    def __init__(self, *args, max_overflow: int = 10, **kwargs):
+        super().__init__(*args, max_overflow=max_overflow, **kwargs)
+        # QueuePool bu değeri yalnızca özel bir niteliğe yazar; anlık görüntü için burada saklanır
+        self.configured_max_overflow = max_overflow
+        self._checkout_stats = _register(self)
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            wait_ms = (time.perf_counter() - started) * 1000
+            self._checkout_stats.record(wait_ms, self.checkedout(), timed_out=True)
+            raise
+        self._checkout_stats.record((time.perf_counter() - started) * 1000, self.checkedout())
+        return connection
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    """Her havuz için anlık doluluk ve birikmiş checkout istatistikleri."""
+    with _registry_lock:
+        pools = dict(_pools)
+    result = {}
+    for name, pool in pools.items():
+        result[name] = {
+            "size": pool.size(),
+            "in_use": pool.checkedout(),
+            "idle": pool.checkedin(),
+            # QueuePool.overflow() pool_size'ın altında negatiftir
+            "overflow": max(0, pool.overflow()),
+            "max_overflow": pool.configured_max_overflow,
+            **_stats[name].snapshot(),
+        }
+    return result
@@ -0,0 +1,199 @@
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+
+from jose import JWTError
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.core.security import decode_token
+from app.db.pool_metrics import InstrumentedAsyncQueuePool, InstrumentedQueuePool
+from app.db.session import AsyncSessionLocal, SessionLocal, pool_options
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Yazma yapan istemci db_read_your_writes_seconds boyunca primary'den okur (bkz. ReadYourWritesMiddleware):
+# tarayıcılar çerezle, bearer token kullanan istemciler (mobil, API) kullanıcı id'siyle sabitlenir
+PRIMARY_PIN_COOKIE = "yorumator_primary_pin"
+_SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+_pinned_users = TTLCache(maxsize=settings.db_read_your_writes_max_users, ttl=settings.db_read_your_writes_seconds)
+
+# Replay bekleyen WAL yoksa gecikme 0'dır; aksi halde son replay edilen transaction'ın yaşı
+LAG_SQL = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+
+@dataclass
+class Replica:
+    name: str
+    engine: Engine
+    async_engine: AsyncEngine
+    session_factory: sessionmaker
+    async_session_factory: async_sessionmaker
+    lag_seconds: float | None = None
+    healthy: bool = True
+    checked_at: float = 0.0
+    _checking: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def needs_check(self) -> bool:
+        return time.monotonic() - self.checked_at >= settings.db_replica_lag_check_interval_seconds
+
+    def record_lag(self, lag: float | None) -> None:
+        self.lag_seconds = lag
+        self.healthy = lag is not None and lag <= settings.db_replica_max_lag_seconds
+        self.checked_at = time.monotonic()
+        if not self.healthy:
+            logger.warning("Replica %s out of rotation (lag=%s)", self.name, lag)
+
+
+def _build_replica(index: int, url: str) -> Replica:
+    name = f"replica-{index}"
+    engine = create_engine(url, poolclass=InstrumentedQueuePool, **pool_options(name))
+    async_engine = create_async_engine(url, poolclass=InstrumentedAsyncQueuePool, **pool_options(f"{name}-async"))
+    return Replica(
+        name=name,
+        engine=engine,
+        async_engine=async_engine,
+        session_factory=sessionmaker(autocommit=False, autoflush=False, bind=engine),
+        async_session_factory=async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False),
+    )
+
+
+replicas: list[Replica] = [_build_replica(i, url) for i, url in enumerate(settings.db_replica_urls)]
+_round_robin = itertools.cycle(replicas) if replicas else None
+
+
+def _check_lag(replica: Replica) -> None:
+    if not replica._checking.acquire(blocking=False):
+        return  # başka bir istek şu an ölçüyor; son bilinen durum kullanılır
+    try:
+        with replica.engine.connect() as conn:
+            replica.record_lag(float(conn.execute(LAG_SQL).scalar_one()))
+    except Exception:
+        logger.exception("Replica %s lag check failed", replica.name)
+        replica.record_lag(None)
+    finally:
+        replica._checking.release()
+
+
+async def _check_lag_async(replica: Replica) -> None:
+    if not replica._checking.acquire(blocking=False):
+        return
+    try:
+        async with replica.async_engine.connect() as conn:
+            replica.record_lag(float((await conn.execute(LAG_SQL)).scalar_one()))
+    except Exception:
+        logger.exception("Replica %s lag check failed", replica.name)
+        replica.record_lag(None)
+    finally:
+        replica._checking.release()
+
+
+def _next_candidates():
+    """Round-robin sırasıyla her replikayı bir kez döndür."""
+    for _ in range(len(replicas)):
+        yield next(_round_robin)
+
+
+def choose_replica() -> Replica | None:
+    """Okuma için gecikmesi eşik altında olan bir replika seç; hiçbiri uygun değilse None (primary)."""
+    for replica in _next_candidates():
+        if replica.needs_check():
+            _check_lag(replica)
+        if replica.healthy:
+            return replica
+    return None
+
+
+async def choose_replica_async() -> Replica | None:
+    for replica in _next_candidates():
+        if replica.needs_check():
+            await _check_lag_async(replica)
+        if replica.healthy:
+            return replica
+    return None
+
+
+def read_session(pinned_to_primary: bool):
+    replica = None if pinned_to_primary else choose_replica()
+    return replica.session_factory() if replica else SessionLocal()
+
+
+async def async_read_session(pinned_to_primary: bool):
+    replica = None if pinned_to_primary else await choose_replica_async()
+    return replica.async_session_factory() if replica else AsyncSessionLocal()
+
+
+def status() -> list[dict]:
+    return [
+        {
+            "name": replica.name,
+            "healthy": replica.healthy,
+            "lag_seconds": replica.lag_seconds,
+            "checked_seconds_ago": round(time.monotonic() - replica.checked_at, 1) if replica.checked_at else None,
+        }
+        for replica in replicas
+    ]
+
+
+def _bearer_subject(authorization: str | None) -> str | None:
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        payload = decode_token(token)
+    except JWTError:
+        return None
+    return payload.get("sub") if payload.get("type") == "access" else None
+
+
+def is_pinned(request) -> bool:
+    """İstemci yakın zamanda yazdıysa True: okumaları gecikmeli bir replikaya değil primary'ye gitmeli."""
+    if PRIMARY_PIN_COOKIE in request.cookies:
+        return True
+    subject = _bearer_subject(request.headers.get("authorization"))
+    return subject is not None and _pinned_users.get(subject) is not None
+
+
+class ReadYourWritesMiddleware:
+    """Başarılı bir yazmadan sonra istemcinin okumalarını kısa süre primary'ye sabitler.
+
+    Çerez her istemciye gönderilir; bearer token'lı isteklerde kullanıcı id'si de süreç içi bir
+    tabloya yazılır, böylece çerez saklamayan istemciler de kendi yazdıklarını okur.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._cookie = (
+            f"{PRIMARY_PIN_COOKIE}=1; HttpOnly; Max-Age={settings.db_read_your_writes_seconds}; Path=/; SameSite=lax"
+        ).encode("latin-1")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in _SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                authorization = next(
+                    (value.decode("latin-1") for key, value in scope["headers"] if key == b"authorization"), None
+                )
+                subject = _bearer_subject(authorization)
+                if subject is not None:
+                    _pinned_users.set(subject, True)
+                message = {**message, "headers": [*message.get("headers", []), (b"set-cookie", self._cookie)]}
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
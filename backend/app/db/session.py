@@ -1,7 +1,9 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import get_settings
+from app.db.pool_metrics import InstrumentedAsyncQueuePool, InstrumentedQueuePool
 
 settings = get_settings()
 DATABASE_URL = (
@@ -9,9 +11,30 @@ DATABASE_URL = (
     f"@{settings.postgres_server}:{settings.postgres_port}/{settings.postgres_db}"
 )
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+
+def pool_options(name: str) -> dict:
+    """Settings'teki havuz ayarları; ``name`` /metrics/db-pool çıktısındaki havuz adıdır."""
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_use_lifo": settings.db_pool_use_lifo,
+        "pool_logging_name": name,
+    }
+
+
+engine = create_engine(DATABASE_URL, poolclass=InstrumentedQueuePool, **pool_options("primary"))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Sıcak okuma yolları için async motor; psycopg 3 aynı URL ile async sürücüyü kullanır.
+# Ayrı bir bağlantı havuzu tutar, sync havuzla paylaşılmaz.
+async_engine = create_async_engine(
+    DATABASE_URL, poolclass=InstrumentedAsyncQueuePool, **pool_options("primary-async")
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 
 def get_db():
     db = SessionLocal()
@@ -19,3 +42,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,14 +1,42 @@
-from fastapi import FastAPI
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
+from app.api.caching import CachePolicyMiddleware
 from app.api.routes import api_router
+from app.core import metrics, querylog
+from app.core.compression import CompressionMiddleware
 from app.core.config import get_settings
 from app.core.logging import setup_logging
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.responses import FastJSONResponse
+from app.core.security import PasswordHashingBusy
+from app.db.replicas import ReadYourWritesMiddleware
+from app.worker import resume_unfinished_imports
 
 settings = get_settings()
 setup_logging()
 
-app = FastAPI(title=settings.project_name, version="0.1.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Yerel kuyrukta süreçle birlikte yarıda kalan içe aktarımlar checkpoint'lerinden devam eder
+    try:
+        resume_unfinished_imports()
+    except Exception:
+        logging.getLogger(__name__).exception("Could not resume unfinished import jobs")
+    yield
+
+
+app = FastAPI(
+    title=settings.project_name,
+    version="0.1.0",
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -16,11 +44,39 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
 )
+app.add_middleware(CachePolicyMiddleware)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_min_size,
+    content_types=settings.compression_content_types,
+    gzip_level=settings.compression_gzip_level,
+    brotli_quality=settings.compression_brotli_quality,
+)
+app.add_middleware(metrics.MetricsMiddleware)
+if settings.db_replica_urls:
+    app.add_middleware(ReadYourWritesMiddleware)
+if settings.query_debug:
+    app.add_middleware(querylog.QueryDebugMiddleware)
 
 app.include_router(api_router, prefix=settings.api_v1_str)
 
 
+@app.exception_handler(PasswordHashingBusy)
+def password_hashing_busy_handler(request: Request, exc: PasswordHashingBusy) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Authentication service is busy, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+def prometheus_metrics() -> PlainTextResponse:
+    return PlainTextResponse(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+
 @app.get("/health", tags=["health"])
 def health_check() -> dict[str, str]:
     return {"status": "ok", "environment": settings.environment}
@@ -10,6 +10,7 @@ from app.models.notification import Notification
 from app.models.question import Question, Answer
 from app.models.badge import Badge, UserBadge
 from app.models.review_like import ReviewLike
+from app.models.import_job import ImportJob
 
 __all__ = [
     "User",
@@ -28,4 +29,5 @@ __all__ = [
     "Badge",
     "UserBadge",
     "ReviewLike",
+    "ImportJob",
 ]
@@ -1,6 +1,7 @@
 import uuid
+from datetime import datetime
 
-from sqlalchemy import Column, ForeignKey, String, Text
+from sqlalchemy import Column, DateTime, ForeignKey, String, Text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 
@@ -15,6 +16,8 @@ class Category(Base):
     slug = Column(String(160), unique=True, nullable=False)
     parent_id = Column(UUID(as_uuid=True), ForeignKey("categories.id"), nullable=True)
     attributes = Column(JSONB, nullable=True)
+    # Koşullu GET doğrulayıcısı (bkz. crud.category.get_version)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     parent = relationship("Category", remote_side=[id], backref="children")
     products = relationship("Product", back_populates="category")
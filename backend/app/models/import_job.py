@@ -0,0 +1,55 @@
+import uuid
+from datetime import datetime
+from enum import Enum
+
+from sqlalchemy import BigInteger, Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Enum as PgEnum
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+
+from app.db.base_class import Base
+
+
+class ImportJobStatusEnum(str, Enum):
+    queued = "queued"
+    running = "running"
+    completed = "completed"
+    failed = "failed"
+
+
+class ImportJob(Base):
+    """Arka planda çalışan toplu ürün içe aktarımı (bkz. app/worker.py).
+
+    ``checkpoint_offset``/``checkpoint_line`` son commit edilen grubun dosyadaki konumudur; sayaçlar aynı
+    transaction içinde güncellenir, böylece çöken bir iş bu noktadan tutarlı şekilde devam eder.
+    """
+
+    __tablename__ = "import_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    source = Column(String(120), nullable=True)
+    format = Column(String(10), nullable=False)
+    filename = Column(String(255), nullable=True)
+    file_path = Column(Text, nullable=False)
+    total_bytes = Column(BigInteger, nullable=False, default=0)
+    status = Column(PgEnum(ImportJobStatusEnum), nullable=False, default=ImportJobStatusEnum.queued)
+    attempts = Column(Integer, nullable=False, default=0)
+
+    checkpoint_offset = Column(BigInteger, nullable=False, default=0)
+    checkpoint_line = Column(Integer, nullable=False, default=0)
+    total_rows = Column(Integer, nullable=False, default=0)
+    imported = Column(Integer, nullable=False, default=0)
+    updated = Column(Integer, nullable=False, default=0)  # parmak izi eşleşip güncellenen kayıtlar
+    failed = Column(Integer, nullable=False, default=0)
+    errors = Column(JSONB, nullable=True)  # [{"row": ..., "errors": [...]}], import_max_reported_errors ile sınırlı
+    errors_truncated = Column(Boolean, nullable=False, default=False)
+    error = Column(Text, nullable=True)  # işi durduran hata
+
+    # Hız/ETA hesabı için mevcut çalıştırmanın başlangıcı (devam eden işte sıfırlanır)
+    run_started_at = Column(DateTime, nullable=True)
+    run_start_offset = Column(BigInteger, nullable=False, default=0)
+    run_start_rows = Column(Integer, nullable=False, default=0)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
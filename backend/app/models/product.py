@@ -1,11 +1,19 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, Numeric, String
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy import Boolean, Column, Computed, DateTime, ForeignKey, Integer, Numeric, String, Text, event, inspect
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 
 from app.db.base_class import Base
+from app.services.fingerprint import FINGERPRINT_LENGTH, product_fingerprint
+
+SEARCH_TEXT_SQL = "yorumator_fold(brand || ' ' || model || ' ' || coalesce(sku, ''))"
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple'::regconfig, yorumator_fold(brand || ' ' || model)), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, yorumator_fold(coalesce(sku, ''))), 'B') || "
+    "setweight(to_tsvector('simple'::regconfig, yorumator_fold(coalesce(specs::text, ''))), 'C')"
+)
 
 
 class Product(Base):
@@ -21,11 +29,37 @@ class Product(Base):
     specs = Column(JSONB, nullable=True)
     is_verified = Column(Boolean, default=False)
     import_source = Column(String(120), nullable=True)
+    # Duplicate tespiti (bkz. app/services/fingerprint.py); migrasyondan önceki kopyalarda NULL kalır
+    fingerprint = Column(String(FINGERPRINT_LENGTH), nullable=True, unique=True, index=True)
     average_rating = Column(Numeric(3, 2), nullable=True)
     review_count = Column(Integer, nullable=False, default=0)
+    # Onaylı yorumlar üzerinden artımlı tutulan puan özeti (bkz. crud.product.apply_rating_delta)
+    rating_sum = Column(Integer, nullable=False, default=0)
+    rating_1_count = Column(Integer, nullable=False, default=0)
+    rating_2_count = Column(Integer, nullable=False, default=0)
+    rating_3_count = Column(Integer, nullable=False, default=0)
+    rating_4_count = Column(Integer, nullable=False, default=0)
+    rating_5_count = Column(Integer, nullable=False, default=0)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Arama kolonları veritabanında üretilir (bkz. 20251121_01); liste sorgularında yüklenmez
+    search_text = deferred(Column(Text, Computed(SEARCH_TEXT_SQL, persisted=True)))
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True)))
+
     category = relationship("Category", back_populates="products")
     reviews = relationship("Review", back_populates="product")
     media = relationship("MediaAsset", back_populates="product")
+
+
+@event.listens_for(Product, "before_insert")
+def _set_fingerprint_on_insert(mapper, connection, target):
+    target.fingerprint = product_fingerprint(target.brand, target.model, target.specs)
+
+
+@event.listens_for(Product, "before_update")
+def _set_fingerprint_on_update(mapper, connection, target):
+    # Yalnızca kimliği belirleyen alanlar değiştiğinde: NULL parmak izli eski kopyalar diğer güncellemelerde çakışmaz
+    state = inspect(target)
+    if any(state.attrs[name].history.has_changes() for name in ("brand", "model", "specs")):
+        target.fingerprint = product_fingerprint(target.brand, target.model, target.specs)
@@ -28,6 +28,9 @@ class Review(Base):
     cons = Column(ARRAY(Text), nullable=False)
     status = Column(PgEnum(ReviewStatusEnum), default=ReviewStatusEnum.pending, nullable=False)
     ai_flags = Column(JSONB, nullable=True)
+    # review_likes tablosunun denormalize sayaçları (bkz. crud.review_like.toggle_like)
+    like_count = Column(Integer, nullable=False, default=0)
+    dislike_count = Column(Integer, nullable=False, default=0)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, field_validator
@@ -47,3 +47,13 @@ class CategoryRead(CategoryBase):
 
     class Config:
         from_attributes = True
+
+
+class CategoryTreeNode(BaseModel):
+    """Kategori ağacı düğümü; path kökten bu düğüme slug yoludur (ör. elektronik/televizyon)"""
+    id: str
+    name: str
+    slug: str
+    parent_id: Optional[str] = None
+    path: str
+    children: List["CategoryTreeNode"] = []
@@ -0,0 +1,34 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class ImportRowError(BaseModel):
+    row: int
+    errors: List[str]
+
+
+class ImportJobRead(BaseModel):
+    """Toplu içe aktarım işinin durumu - sayaçlar son commit edilen gruba kadar günceldir"""
+    id: str
+    status: str
+    format: str
+    filename: Optional[str] = None
+    source: Optional[str] = None
+    total_bytes: int
+    processed_bytes: int
+    percent: float
+    total_rows: int
+    imported: int
+    updated: int = 0  # mevcut ürünle (aynı parmak izi) eşleşip güncellenen kayıtlar
+    failed: int
+    rows_per_second: Optional[float] = None
+    eta_seconds: Optional[float] = None
+    errors: List[ImportRowError] = []
+    errors_truncated: bool = False
+    error: Optional[str] = None
+    attempts: int
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
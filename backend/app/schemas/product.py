@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -50,3 +50,15 @@ class ProductDetail(ProductSummary):
     """Ürün detay bilgisi - detay sayfası için"""
     average_rating: Optional[float] = None
     review_count: int = 0
+
+
+class ProductBatch(BaseModel):
+    """Toplu ürün getirme sonucu - istenen sırayla ürünler ve bulunamayan id'ler"""
+    items: List[ProductDetail]
+    missing: List[str] = Field(default_factory=list)
+
+
+class BrandCount(BaseModel):
+    """Marka başına ürün sayısı - filtre ekranı için"""
+    brand: str
+    product_count: int
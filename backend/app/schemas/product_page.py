@@ -0,0 +1,21 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from app.schemas.product import ProductDetail
+from app.schemas.question import QuestionRead
+from app.schemas.review import ReviewPublic
+from app.schemas.review_like import ReviewLikeBatchItem
+
+
+class ProductPage(BaseModel):
+    """Ürün detay sayfasının ilk çizimi için tek istekte toplanan veriler.
+
+    ``include`` ile istenmeyen bölümler null döner; ``is_favorite`` ve kendi oy durumu yalnızca giriş
+    yapmış kullanıcılar için doldurulur.
+    """
+    product: ProductDetail
+    reviews: Optional[List[ReviewPublic]] = None
+    review_likes: Optional[List[ReviewLikeBatchItem]] = None
+    questions: Optional[List[QuestionRead]] = None
+    is_favorite: Optional[bool] = None
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -29,6 +29,10 @@ class ReviewUpdate(BaseModel):
     cons: Optional[List[str]] = None
 
 
+class ReviewStatusUpdate(BaseModel):
+    status: Literal["pending", "approved", "rejected"]
+
+
 class ReviewRead(ReviewBase):
     id: str
     user_id: str
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 
 
 class ReviewLikeCreate(BaseModel):
@@ -36,3 +36,10 @@ class ReviewLikeStats(BaseModel):
     dislike_count: int = 0
     user_like_status: Optional[bool] = None  # True=liked, False=disliked, None=no action
 
+
+class ReviewLikeBatchRequest(BaseModel):
+    review_ids: list[str] = Field(..., min_length=1, max_length=100)
+
+
+class ReviewLikeBatchItem(ReviewLikeStats):
+    review_id: str
@@ -0,0 +1,64 @@
+"""Süreç içi marka kaydı: tekil marka listesi ve kategori bazında marka başına ürün sayıları.
+
+Kayıt tek bir GROUP BY sorgusuyla kurulur ve ``VersionedValue`` ile bellekte tutulur. Sürüm, ürün
+kataloğunun (adet, en son güncelleme) çiftidir (``crud.product.get_catalog_version``); en fazla
+``brand_registry_check_seconds`` saniyede bir kontrol edilir. Ürün create/update ve içe aktarım yerel
+kopyayı hemen geçersiz kılar.
+"""
+import uuid
+from typing import Iterable
+
+from sqlalchemy.orm import Session
+
+from app.core.cache import VersionedValue
+from app.core.config import get_settings
+from app.crud import product as product_crud
+
+settings = get_settings()
+
+
+class BrandRegistry:
+    def __init__(self, rows, version):
+        self.version = version
+        totals: dict[str, int] = {}
+        self._by_category: dict[uuid.UUID, dict[str, int]] = {}
+        for category_id, brand, count in rows:
+            totals[brand] = totals.get(brand, 0) + count
+            self._by_category.setdefault(category_id, {})[brand] = count
+        # Satırlar markaya göre sıralı gelir; veritabanının sıralaması (collation) korunur
+        self.brands = list(totals)
+        self._rank = {brand: index for index, brand in enumerate(self.brands)}
+        self._counts = [{"brand": brand, "product_count": count} for brand, count in totals.items()]
+
+    def _merged(self, category_ids: Iterable[uuid.UUID]) -> list[tuple[str, int]]:
+        merged: dict[str, int] = {}
+        for category_id in category_ids:
+            for brand, count in self._by_category.get(category_id, {}).items():
+                merged[brand] = merged.get(brand, 0) + count
+        return sorted(merged.items(), key=lambda item: self._rank[item[0]])
+
+    def brand_names(self, category_ids: Iterable[uuid.UUID] | None = None) -> list[str]:
+        if category_ids is None:
+            return self.brands
+        return [brand for brand, _ in self._merged(category_ids)]
+
+    def brand_counts(self, category_ids: Iterable[uuid.UUID] | None = None) -> list[dict]:
+        if category_ids is None:
+            return self._counts
+        return [{"brand": brand, "product_count": count} for brand, count in self._merged(category_ids)]
+
+
+_cache = VersionedValue(check_interval=settings.brand_registry_check_seconds)
+
+
+def get_registry(db: Session) -> BrandRegistry:
+    registry = _cache.fresh()
+    if registry is None:
+        version = product_crud.get_catalog_version(db)
+        registry = _cache.current(version) or BrandRegistry(product_crud.get_brand_counts(db), version)
+        _cache.store(registry, version)
+    return registry
+
+
+def invalidate() -> None:
+    _cache.invalidate()
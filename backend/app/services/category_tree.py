@@ -0,0 +1,84 @@
+"""Süreç içi, sürümlü kategori ağacı önbelleği.
+
+Ağaç (çocuk listeleri, kök→düğüm slug yolu ve her düğümün alt ağaç id kümesi) bir kez kurulur ve
+bellekte tutulur. Sürüm ``crud.category.get_version`` (adet, en son güncelleme) değeridir; en fazla
+``category_tree_check_seconds`` saniyede bir kontrol edilir. Kategori create/update yerel kopyayı hemen
+geçersiz kılar, diğer worker'lar değişikliği bir sonraki sürüm kontrolünde görür.
+"""
+import uuid
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import VersionedValue
+from app.core.config import get_settings
+from app.crud import category as category_crud
+
+settings = get_settings()
+
+
+class CategoryTree:
+    def __init__(self, rows, version: tuple):
+        self.version = version
+        nodes = {row.id: row for row in rows}
+        children: dict[uuid.UUID | None, list] = {}
+        for row in rows:
+            # Üst kategorisi bulunamayan kayıtlar kök sayılır
+            parent_id = row.parent_id if row.parent_id in nodes else None
+            children.setdefault(parent_id, []).append(row)
+
+        self.paths: dict[uuid.UUID, str] = {}
+        self._subtrees: dict[uuid.UUID, frozenset[uuid.UUID]] = {}
+        self.roots = [self._build(row, "", children, set()) for row in children.get(None, [])]
+        # parent_id döngüsündeki kayıtlara kökten ulaşılamaz; döngü ilk kayıtta kırılıp kök sayılır
+        for row in rows:
+            if row.id not in self.paths:
+                self.roots.append(self._build(row, "", children, set()))
+
+    def _build(self, row, parent_path: str, children: dict, visiting: set) -> dict[str, Any]:
+        path = f"{parent_path}/{row.slug}" if parent_path else row.slug
+        self.paths[row.id] = path
+        visiting.add(row.id)
+        # Döngüden kök yapılan kayıtta sonsuz özyinelemeye girme
+        child_rows = [child for child in children.get(row.id, []) if child.id not in visiting]
+        child_nodes = [self._build(child, path, children, visiting) for child in child_rows]
+        visiting.discard(row.id)
+        self._subtrees[row.id] = frozenset({row.id}).union(*(self._subtrees[child.id] for child in child_rows))
+        return {
+            "id": str(row.id),
+            "name": row.name,
+            "slug": row.slug,
+            "parent_id": str(row.parent_id) if row.parent_id else None,
+            "path": path,
+            "children": child_nodes,
+        }
+
+    def subtree_ids(self, category_id: uuid.UUID) -> frozenset[uuid.UUID]:
+        """Kategori ve tüm alt kategorilerinin id'leri; bilinmeyen kategori için yalnızca kendisi."""
+        return self._subtrees.get(category_id, frozenset({category_id}))
+
+
+_cache = VersionedValue(check_interval=settings.category_tree_check_seconds)
+
+
+def get_tree(db: Session) -> CategoryTree:
+    tree = _cache.fresh()
+    if tree is None:
+        version = category_crud.get_version(db)
+        tree = _cache.current(version) or CategoryTree(category_crud.get_tree(db), version)
+        _cache.store(tree, version)
+    return tree
+
+
+async def get_tree_async(db: AsyncSession) -> CategoryTree:
+    tree = _cache.fresh()
+    if tree is None:
+        version = await category_crud.get_version_async(db)
+        tree = _cache.current(version) or CategoryTree(await category_crud.get_tree_async(db), version)
+        _cache.store(tree, version)
+    return tree
+
+
+def invalidate() -> None:
+    _cache.invalidate()
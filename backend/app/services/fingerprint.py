@@ -0,0 +1,39 @@
+"""Ürün parmak izi: marka + model + teknik özelliklerin normalize edilmiş özeti (duplicate tespiti).
+
+Büyük/küçük harf, Türkçe karakterler, fazla boşluklar ve ``specs`` anahtar sırası parmak izini değiştirmez;
+böylece aynı ürünü farklı biçimde gönderen partner beslemeleri tek katalog satırına düşer.
+"""
+import hashlib
+import json
+from typing import Any
+
+from app.services.search import fold
+
+FINGERPRINT_LENGTH = 40  # sha1 hex
+
+
+def _text(value: Any) -> str:
+    return " ".join(fold(str(value)).split())
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {_text(key): _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    if isinstance(value, str):
+        return _text(value)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)  # 8.0 ve 8 aynı özellik
+    return value
+
+
+def product_fingerprint(brand: str, model: str, specs: dict | None) -> str:
+    payload = json.dumps(
+        [_text(brand), _text(model), _normalize(specs or {})],
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
@@ -0,0 +1,303 @@
+"""Partner kataloglarının toplu içe aktarımı (CSV ve JSON Lines, bkz. docs/INITIAL_DATA_STRATEGY.md).
+
+Dosya hiçbir zaman tamamen belleğe alınmaz: kayıtlar satır satır okunur, ``ProductCreate`` ile doğrulanır
+ve ``import_batch_size`` kayıtlık gruplar halinde çok satırlı INSERT ile yazılır; her grup ayrı commit
+edilir. Hatalı satırlar atlanır ve satır numarasıyla raporlanır.
+
+Kayıtlar ürün parmak izi (``products.fingerprint``) üzerinden upsert edilir: aynı partner beslemesi
+tekrar yüklendiğinde yeni satır açılmaz, mevcut ürünün fiyat/SKU/kaynak bilgisi güncellenir.
+"""
+import csv
+import json
+import uuid
+from datetime import datetime
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Callable, Iterator
+
+from pydantic import ValidationError
+from sqlalchemy import literal_column, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.category import Category
+from app.models.product import Product
+from app.schemas.product import ProductCreate
+from app.services import brand_registry
+from app.services.fingerprint import product_fingerprint
+from app.services.search import fold
+
+settings = get_settings()
+
+FORMATS = ("csv", "jsonl")
+_EXTENSIONS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+CSV_REQUIRED_COLUMNS = ("brand", "model")
+_SOURCE_MAX_LENGTH = 120  # products.import_source
+
+
+@dataclass
+class RowError:
+    row: int
+    errors: list[str]
+
+
+@dataclass
+class ImportReport:
+    format: str
+    total_rows: int = 0
+    imported: int = 0
+    updated: int = 0
+    failed: int = 0
+    errors: list[RowError] = field(default_factory=list)
+    errors_truncated: bool = False
+
+    def add_error(self, row: int, errors: list[str]) -> None:
+        self.failed += 1
+        if len(self.errors) < settings.import_max_reported_errors:
+            self.errors.append(RowError(row, errors))
+        else:
+            self.errors_truncated = True
+
+
+def detect_format(filename: str | None, requested: str | None = None) -> str:
+    """Açıkça istenen format, yoksa dosya uzantısı (.csv, .jsonl, .ndjson)."""
+    if requested:
+        if requested not in FORMATS:
+            raise ValueError(f"Unsupported format: {requested}. Supported: {', '.join(FORMATS)}")
+        return requested
+    name = (filename or "").lower()
+    for extension, fmt in _EXTENSIONS.items():
+        if name.endswith(extension):
+            return fmt
+    raise ValueError("Cannot detect file format; pass format=csv or format=jsonl")
+
+
+@dataclass
+class Checkpoint:
+    """Son commit edilen grubun ardındaki konum: dosyadaki bayt ofseti ve o noktaya kadar okunan satır."""
+
+    offset: int = 0
+    line: int = 0
+
+
+class _TrackedLines:
+    """İkili akıştan satır satır okur; tüketilen bayt ofsetini ve fiziksel satır numarasını izler."""
+
+    def __init__(self, stream: BinaryIO, start: Checkpoint):
+        stream.seek(start.offset)
+        self._stream = stream
+        self.offset = start.offset
+        self.line = start.line
+
+    def checkpoint(self) -> Checkpoint:
+        return Checkpoint(self.offset, self.line)
+
+    def __iter__(self) -> Iterator[str]:
+        for raw in self._stream:
+            try:
+                text = raw.decode("utf-8-sig" if self.offset == 0 else "utf-8")
+            except UnicodeDecodeError as exc:
+                raise ValueError(f"line {self.line + 1}: invalid UTF-8 ({exc.reason})") from exc
+            self.offset += len(raw)
+            self.line += 1
+            yield text
+
+
+def _csv_records(stream: BinaryIO, start: Checkpoint) -> Iterator[tuple[_TrackedLines, dict | ValueError]]:
+    header_lines = _TrackedLines(stream, Checkpoint())
+    columns = next(csv.reader(header_lines), [])
+    missing = [name for name in CSV_REQUIRED_COLUMNS if name not in columns]
+    if not set(columns) & {"category", "category_id"}:
+        missing.append("category")
+    if missing:
+        raise ValueError(f"CSV is missing required columns: {', '.join(missing)}")
+
+    # Devam ederken başlık baştan okunur, kayıtlar checkpoint ofsetinden
+    lines = _TrackedLines(stream, start) if start.offset > header_lines.offset else header_lines
+    for row in csv.reader(lines):
+        if not any(value.strip() for value in row):
+            continue
+        # Satır numarası, çok satırlı tırnaklı alanlarda kaydın son satırını gösterir
+        values = {key: value.strip() for key, value in zip(columns, row) if key and value.strip()}
+        try:
+            if "specs_json" in values:
+                values["specs"] = json.loads(values.pop("specs_json"))
+        except json.JSONDecodeError as exc:
+            yield lines, ValueError(f"specs_json: invalid JSON ({exc.msg})")
+            continue
+        yield lines, values
+
+
+def _jsonl_records(stream: BinaryIO, start: Checkpoint) -> Iterator[tuple[_TrackedLines, dict | ValueError]]:
+    lines = _TrackedLines(stream, start)
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield lines, ValueError(f"invalid JSON: {exc}")
+            continue
+        if not isinstance(record, dict):
+            yield lines, ValueError("each line must be a JSON object")
+            continue
+        # {"product": {...}, "source": ...} veya düz ürün nesnesi; reviews/media içe aktarılmaz
+        product = record.get("product", record)
+        if not isinstance(product, dict):
+            yield lines, ValueError("product must be a JSON object")
+            continue
+        values = dict(product)
+        source = record.get("source")
+        if isinstance(source, dict):
+            source = source.get("name")
+        if source and "source" not in values:
+            values["source"] = source
+        yield lines, values
+
+
+class _CategoryResolver:
+    """Kategori sütununu (UUID, slug veya ad) içe aktarım başında tek sorguyla yüklenen eşlemeden çözer."""
+
+    def __init__(self, db: Session):
+        self._by_key: dict[str, uuid.UUID] = {}
+        for category_id, slug, name in db.execute(select(Category.id, Category.slug, Category.name)):
+            self._by_key[str(category_id)] = category_id
+            self._by_key[slug.lower()] = category_id
+            self._by_key.setdefault(fold(name), category_id)
+
+    def resolve(self, value: Any) -> uuid.UUID | None:
+        key = str(value).strip()
+        return self._by_key.get(key.lower()) or self._by_key.get(fold(key))
+
+
+def _validation_messages(exc: ValidationError) -> list[str]:
+    return [f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in exc.errors()]
+
+
+def _to_row(values: dict, categories: _CategoryResolver, default_source: str | None) -> dict:
+    """Ham kaydı doğrulayıp products tablosu satırına çevir; hata varsa ValueError (mesaj listesiyle)."""
+    category = values.get("category_id") or values.get("category")
+    if not category:
+        raise ValueError(["category: field required"])
+    category_id = categories.resolve(category)
+    if category_id is None:
+        raise ValueError([f"category: unknown category {category!r}"])
+    try:
+        product = ProductCreate(**{**values, "category_id": str(category_id)})
+    except ValidationError as exc:
+        raise ValueError(_validation_messages(exc))
+
+    row = product.model_dump(exclude={"category_id"})
+    row["category_id"] = category_id
+    row["is_verified"] = False  # dış kaynaklı kayıtlar yönetici onayı bekler
+    source = values.get("source") or default_source
+    row["import_source"] = str(source)[:_SOURCE_MAX_LENGTH] if source else None
+    row["fingerprint"] = product_fingerprint(row["brand"], row["model"], row.get("specs"))
+    return row
+
+
+# Parmak izi çakışmasında yalnızca beslemeye bağlı alanlar yenilenir; onay durumu ve puanlar korunur
+_UPSERT_COLUMNS = ("sku", "price", "currency", "import_source")
+
+
+def _upsert_statement():
+    stmt = insert(Product)
+    return stmt.on_conflict_do_update(
+        index_elements=[Product.fingerprint],
+        set_={**{name: stmt.excluded[name] for name in _UPSERT_COLUMNS}, "updated_at": datetime.utcnow()},
+    ).returning(literal_column("xmax = 0").label("inserted"))
+
+
+def _upsert(db: Session, rows: list[dict], report: ImportReport) -> None:
+    result = db.execute(_upsert_statement(), rows)
+    inserted = sum(1 for (was_inserted,) in result if was_inserted)
+    report.imported += inserted
+    report.updated += len(rows) - inserted
+
+
+def _dedupe(batch: list[tuple[int, dict]], report: ImportReport) -> list[tuple[int, dict]]:
+    """Aynı grupta tekrar eden parmak izlerinden sonuncusu kalır (ON CONFLICT bir satırı iki kez güncelleyemez)."""
+    latest = {row["fingerprint"]: (row_number, row) for row_number, row in batch}
+    report.updated += len(batch) - len(latest)
+    return list(latest.values())
+
+
+def _write_batch(
+    db: Session,
+    batch: list[tuple[int, dict]],
+    report: ImportReport,
+    checkpoint: Checkpoint,
+    on_checkpoint: Callable[[ImportReport, Checkpoint], None] | None,
+) -> None:
+    """Grubu yaz ve commit et; ``on_checkpoint`` aynı transaction içinde çağrılır (ilerleme kaydı atomik kalır)."""
+    batch = _dedupe(batch, report)
+    counters = (report.imported, report.updated)
+    try:
+        _upsert(db, [row for _, row in batch], report)
+        if on_checkpoint:
+            on_checkpoint(report, checkpoint)
+        db.commit()
+        brand_registry.invalidate()
+        return
+    except DBAPIError:
+        db.rollback()
+        report.imported, report.updated = counters
+    # Grup reddedildi: hatalı satırları bulmak için satır satır (savepoint ile) yeniden dene
+    for row_number, row in batch:
+        try:
+            with db.begin_nested():
+                _upsert(db, [row], report)
+        except DBAPIError as exc:
+            report.add_error(row_number, [f"database: {str(exc.orig).splitlines()[0]}"])
+    if on_checkpoint:
+        on_checkpoint(report, checkpoint)
+    db.commit()
+    brand_registry.invalidate()
+
+
+def import_products(
+    db: Session,
+    stream: BinaryIO,
+    fmt: str,
+    *,
+    default_source: str | None = None,
+    batch_size: int | None = None,
+    report: ImportReport | None = None,
+    resume_from: Checkpoint | None = None,
+    on_checkpoint: Callable[[ImportReport, Checkpoint], None] | None = None,
+) -> ImportReport:
+    """Akıştaki ürünleri içe aktar. Başlık/format hatalarında ValueError; satır hataları rapora yazılır.
+
+    Yarıda kalmış bir içe aktarım, kayıtlı ``report`` ve ``resume_from`` ile son commit edilen gruptan
+    devam eder; ``on_checkpoint`` her grubun commit'inden hemen önce çağrılır.
+    """
+    batch_size = batch_size or settings.import_batch_size
+    start = resume_from or Checkpoint()
+    records = _csv_records(stream, start) if fmt == "csv" else _jsonl_records(stream, start)
+    categories = _CategoryResolver(db)
+    report = report or ImportReport(format=fmt)
+    batch: list[tuple[int, dict]] = []
+    lines = None
+
+    for lines, values in records:
+        report.total_rows += 1
+        if isinstance(values, ValueError):
+            report.add_error(lines.line, [str(values)])
+            continue
+        try:
+            batch.append((lines.line, _to_row(values, categories, default_source)))
+        except ValueError as exc:
+            report.add_error(lines.line, exc.args[0])
+            continue
+        if len(batch) >= batch_size:
+            _write_batch(db, batch, report, lines.checkpoint(), on_checkpoint)
+            batch = []
+    # Son grup (boş olsa da): hatalı kuyruk satırlarının sayaçları ve dosya sonu checkpoint'i kaydedilir
+    final = lines.checkpoint() if lines is not None else start
+    if batch:
+        _write_batch(db, batch, report, final, on_checkpoint)
+    elif on_checkpoint:
+        on_checkpoint(report, final)
+        db.commit()
+    return report
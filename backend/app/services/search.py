@@ -0,0 +1,22 @@
+import re
+
+# Postgres tarafındaki yorumator_fold() fonksiyonu ile aynı eşleme (bkz. 20251121_01 migrasyonu)
+TURKISH_FOLD_FROM = "ıİşŞğĞçÇöÖüÜ"
+TURKISH_FOLD_TO = "iIsSgGcCoOuU"
+
+_TURKISH_FOLD = str.maketrans(TURKISH_FOLD_FROM, TURKISH_FOLD_TO)
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def fold(text: str) -> str:
+    """Türkçe karakterleri ASCII karşılıklarına indirip küçük harfe çevir ("Arçelik" -> "arcelik")."""
+    # translate önce çalışmalı: "İ".lower() birleşik nokta (U+0307) üretir
+    return text.translate(_TURKISH_FOLD).lower()
+
+
+def to_prefix_tsquery(text: str) -> str | None:
+    """Kullanıcı girdisini önek eşleşmeli bir to_tsquery ifadesine çevir ("galaxy s2" -> "galaxy:* & s2:*")."""
+    tokens = _TOKEN_RE.findall(fold(text))
+    if not tokens:
+        return None
+    return " & ".join(f"{token}:*" for token in tokens)
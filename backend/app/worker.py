@@ -0,0 +1,112 @@
+"""Arka plan işleri.
+
+``IMPORT_QUEUE=celery`` ile işler Redis üzerinden Celery worker'larına gider:
+
+    celery -A app.worker.celery_app worker --concurrency 2
+
+Varsayılan ``local`` modda aynı süreçteki küçük bir thread havuzu kullanılır (geliştirme ve testler için).
+Her iki durumda da iş, son commit edilen gruptan devam edebilir: Celery görevleri ``acks_late`` ile çöken
+worker'dan sonra yeniden teslim edilir; yerel modda yarıda kalan işler uygulama açılışında kuyruğa alınır.
+"""
+import logging
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from celery import Celery
+from sqlalchemy import func, select
+
+from app.core.config import get_settings
+from app.crud import import_job as import_job_crud
+from app.db.session import SessionLocal, engine
+from app.services import importer
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+celery_app = Celery("yorumator", broker=settings.redis_url)
+celery_app.conf.update(
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    worker_prefetch_multiplier=1,
+)
+
+_local_executor = ThreadPoolExecutor(max_workers=settings.import_local_workers, thread_name_prefix="import-job")
+
+
+def _lock_key(job_id: str) -> int:
+    return uuid.UUID(job_id).int & 0x7FFF_FFFF_FFFF_FFFF
+
+
+def run_import_job(job_id: str) -> None:
+    """İşi checkpoint'inden itibaren çalıştır. Aynı iş iki kez teslim edilirse advisory lock ikincisini durdurur."""
+    # Kilit ayrı bir bağlantıda tutulur: oturum her grup commit'inde bağlantısını havuza bırakır
+    with engine.connect() as lock_conn:
+        if not lock_conn.scalar(select(func.pg_try_advisory_lock(_lock_key(job_id)))):
+            logger.info("Import job %s is already running elsewhere", job_id)
+            return
+        try:
+            _run_locked(job_id)
+        finally:
+            lock_conn.scalar(select(func.pg_advisory_unlock(_lock_key(job_id))))
+
+
+def _run_locked(job_id: str) -> None:
+    db = SessionLocal()
+    try:
+        job = import_job_crud.get(db, job_id)
+        if job is None or job.status not in import_job_crud.UNFINISHED_STATUSES:
+            return
+        import_job_crud.start_run(db, job)
+        try:
+            with open(job.file_path, "rb") as stream:
+                importer.import_products(
+                    db,
+                    stream,
+                    job.format,
+                    default_source=job.source or job.filename,
+                    report=import_job_crud.report_from(job),
+                    resume_from=import_job_crud.checkpoint_from(job),
+                    on_checkpoint=lambda report, checkpoint: import_job_crud.record_checkpoint(
+                        db, job, report, checkpoint
+                    ),
+                )
+        except Exception as exc:
+            logger.exception("Import job %s failed", job_id)
+            db.rollback()
+            import_job_crud.finish(db, job, error=str(exc))
+            return
+        import_job_crud.finish(db, job)
+        try:
+            os.remove(job.file_path)
+        except OSError:
+            logger.warning("Could not remove import file %s", job.file_path)
+    finally:
+        db.close()
+
+
+@celery_app.task(name="imports.run")
+def run_import_job_task(job_id: str) -> None:
+    run_import_job(job_id)
+
+
+def enqueue_import(job_id) -> None:
+    if settings.import_queue == "celery":
+        run_import_job_task.delay(str(job_id))
+    else:
+        _local_executor.submit(run_import_job, str(job_id))
+
+
+def resume_unfinished_imports() -> int:
+    """Yerel kuyrukta süreçle birlikte kaybolan (queued/running) işleri yeniden kuyruğa al."""
+    if settings.import_queue == "celery":
+        return 0  # broker, onaylanmamış görevleri kendisi yeniden teslim eder
+    db = SessionLocal()
+    try:
+        jobs = import_job_crud.get_unfinished(db)
+    finally:
+        db.close()
+    for job in jobs:
+        logger.info("Resuming import job %s from offset %s", job.id, job.checkpoint_offset)
+        enqueue_import(job.id)
+    return len(jobs)
@@ -0,0 +1,71 @@
+"""Compare sync-in-threadpool and async execution of the hot product read path.
+
+Runs the same product list query `--requests` times with `--concurrency` in flight, once the
+way a sync route does (SessionLocal inside the worker threadpool, capped at `--threads`
+like Starlette's default limiter) and once through AsyncSessionLocal on the event loop:
+
+    python -m scripts.bench_async_reads --requests 2000 --concurrency 100
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+import anyio
+import anyio.to_thread
+
+from app.crud import product as product_crud
+from app.db.session import AsyncSessionLocal, SessionLocal, async_engine, engine
+from scripts.bench_login import report
+
+
+def _sync_list() -> None:
+    with SessionLocal() as db:
+        product_crud.get_multi(db, limit=20, sort_by="rating_desc")
+
+
+async def _async_list() -> None:
+    async with AsyncSessionLocal() as db:
+        await product_crud.get_multi_async(db, limit=20, sort_by="rating_desc")
+
+
+async def _drive(name: str, call, requests: int, concurrency: int) -> None:
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await call()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    await call()  # bağlantı havuzunu ısıt
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+    print(f"{name:<8}{requests / elapsed:>8.1f} req/s")
+    report(name, latencies)
+
+
+async def run(requests: int, concurrency: int, threads: int) -> None:
+    limiter = anyio.CapacityLimiter(threads)
+
+    async def sync_call() -> None:
+        await anyio.to_thread.run_sync(_sync_list, limiter=limiter)
+
+    try:
+        await _drive("sync", sync_call, requests, concurrency)
+        await _drive("async", _async_list, requests, concurrency)
+    finally:
+        await async_engine.dispose()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--threads", type=int, default=40, help="sync yol için threadpool boyutu")
+    args = parser.parse_args()
+    asyncio.run(run(args.requests, args.concurrency, args.threads))
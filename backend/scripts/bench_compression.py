@@ -0,0 +1,72 @@
+"""Compare CPU cost against bytes saved for gzip/brotli on API payloads.
+
+By default compresses synthetic 100-item product and review pages (same generators as
+bench_serialization). Pass --url to measure real responses from a running API instead:
+
+    python -m scripts.bench_compression
+    python -m scripts.bench_compression --url "http://localhost:8000/api/v1/products/?limit=100"
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+import zlib
+
+import httpx
+
+from app.core.compression import brotli
+from app.core.responses import FastJSONResponse
+from scripts.bench_serialization import product_page, review_page
+
+
+def _codecs():
+    codecs = [(f"gzip-{level}", lambda data, level=level: zlib.compress(data, level, wbits=31)) for level in (1, 6, 9)]
+    if brotli is not None:
+        codecs += [
+            (f"br-{quality}", lambda data, quality=quality: brotli.compress(data, quality=quality, mode=brotli.MODE_TEXT))
+            for quality in (1, 4, 11)
+        ]
+    return codecs
+
+
+def _payloads(urls: list[str], items: int) -> dict[str, bytes]:
+    if urls:
+        with httpx.Client(timeout=30, headers={"Accept-Encoding": "identity"}) as client:
+            return {url: client.get(url).raise_for_status().content for url in urls}
+    render = FastJSONResponse(None).render
+    return {
+        f"products x{items}": render(product_page(items)),
+        f"reviews x{items}": render(review_page(items)),
+        "count": render({"count": 7}),
+    }
+
+
+def run(urls: list[str], items: int, repeats: int) -> None:
+    if brotli is None:
+        print("brotli kurulu değil; yalnızca gzip ölçülüyor (pip install \".[compression]\")")
+    print(f"{'payload':<24}{'codec':<9}{'bytes':>9}{'saved':>9}{'ratio':>8}{'cpu us':>10}{'us/KB saved':>13}")
+    for name, data in _payloads(urls, items).items():
+        print(f"{name[:23]:<24}{'raw':<9}{len(data):>9}")
+        for codec, compress in _codecs():
+            timings = []
+            for _ in range(repeats):
+                started = time.perf_counter()
+                compressed = compress(data)
+                timings.append((time.perf_counter() - started) * 1_000_000)
+            cpu_us = statistics.median(timings)
+            saved = len(data) - len(compressed)
+            per_kb = f"{cpu_us / (saved / 1024):>13.1f}" if saved > 0 else f"{'-':>13}"
+            print(
+                f"{'':<24}{codec:<9}{len(compressed):>9}{saved:>9}"
+                f"{len(compressed) / len(data):>8.2f}{cpu_us:>10.1f}{per_kb}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", action="append", default=[], help="ölçülecek gerçek endpoint (tekrarlanabilir)")
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--repeats", type=int, default=50)
+    args = parser.parse_args()
+    run(args.url, args.items, args.repeats)
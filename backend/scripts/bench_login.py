@@ -0,0 +1,92 @@
+"""Measure /auth/login latency under concurrent load against a running API.
+
+Fires `--requests` logins with `--concurrency` in flight while a side loop keeps polling
+/health, so the report shows both login percentiles and how much unrelated requests suffer:
+
+    uvicorn app.main:app --workers 1 &
+    python -m scripts.bench_login --base-url http://localhost:8000 --concurrency 64
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+
+import httpx
+
+EMAIL = "bench-login@yorumator.local"
+PASSWORD = "bench-login-password"
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def report(name: str, samples: list[float]) -> None:
+    if not samples:
+        print(f"{name:<8}no samples")
+        return
+    print(
+        f"{name:<8}n={len(samples):<6}"
+        f"p50={percentile(samples, 50):>8.1f}ms  p95={percentile(samples, 95):>8.1f}ms  "
+        f"p99={percentile(samples, 99):>8.1f}ms  mean={statistics.fmean(samples):>8.1f}ms"
+    )
+
+
+async def _login(client: httpx.AsyncClient, api: str, latencies: list[float], statuses: Counter) -> None:
+    started = time.perf_counter()
+    response = await client.post(f"{api}/auth/login", data={"username": EMAIL, "password": PASSWORD})
+    latencies.append((time.perf_counter() - started) * 1000)
+    statuses[response.status_code] += 1
+
+
+async def _poll_health(client: httpx.AsyncClient, base_url: str, latencies: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await client.get(f"{base_url}/health")
+        latencies.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(0.05)
+
+
+async def run(base_url: str, api_prefix: str, requests: int, concurrency: int) -> None:
+    api = f"{base_url}{api_prefix}"
+    limits = httpx.Limits(max_connections=concurrency + 1)
+    async with httpx.AsyncClient(timeout=60, limits=limits) as client:
+        # Kayıt zaten varsa 400 döner, sorun değil
+        await client.post(f"{api}/auth/register", json={"email": EMAIL, "password": PASSWORD})
+
+        login_ms: list[float] = []
+        health_ms: list[float] = []
+        statuses: Counter = Counter()
+        semaphore = asyncio.Semaphore(concurrency)
+        stop = asyncio.Event()
+
+        async def bounded_login() -> None:
+            async with semaphore:
+                await _login(client, api, login_ms, statuses)
+
+        health_task = asyncio.create_task(_poll_health(client, base_url, health_ms, stop))
+        started = time.perf_counter()
+        await asyncio.gather(*(bounded_login() for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await health_task
+
+    print(f"{requests} logins, concurrency {concurrency}, {elapsed:.1f}s ({requests / elapsed:.1f} req/s)")
+    print("status  " + ", ".join(f"{code}: {count}" for code, count in sorted(statuses.items())))
+    report("login", login_ms)
+    report("health", health_ms)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--api-prefix", default="/api/v1")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+    asyncio.run(run(args.base_url, args.api_prefix, args.requests, args.concurrency))
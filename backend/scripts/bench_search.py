@@ -0,0 +1,93 @@
+"""Benchmark legacy ILIKE product search against the indexed search columns.
+
+Builds a scratch copy of the products table (generated columns and indexes included),
+fills it with a synthetic catalog and compares EXPLAIN ANALYZE execution times:
+
+    python -m scripts.bench_search --rows 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+
+from sqlalchemy import text
+
+from app.db.session import engine
+from app.services.search import fold, to_prefix_tsquery
+
+TABLE = "bench_products"
+TERMS = ["samsung", "arçelik", "ÇAMAŞIR", "galaxy s2", "oled 65", "9153"]
+
+LEGACY_SQL = f"""
+SELECT id FROM {TABLE}
+WHERE brand ILIKE :like OR model ILIKE :like
+ORDER BY created_at DESC, id DESC
+LIMIT 20
+"""
+
+INDEXED_SQL = f"""
+SELECT id FROM {TABLE}
+WHERE search_vector @@ to_tsquery('simple'::regconfig, :tsquery)
+   OR search_text LIKE '%' || :term || '%'
+ORDER BY ts_rank_cd(search_vector, to_tsquery('simple'::regconfig, :tsquery))
+         + similarity(search_text, :term) DESC, id DESC
+LIMIT 20
+"""
+
+FILL_SQL = f"""
+INSERT INTO {TABLE} (id, category_id, brand, model, sku, price, currency, specs, is_verified, review_count, created_at, updated_at)
+SELECT
+    gen_random_uuid(),
+    gen_random_uuid(),
+    (ARRAY['Samsung', 'Arçelik', 'Beko', 'Vestel', 'LG', 'Sony', 'Bosch', 'Xiaomi', 'Apple', 'Siemens'])[1 + i % 10],
+    (ARRAY['Galaxy S', 'Çamaşır Makinesi ', 'OLED ', 'Buzdolabı NF', 'Robot Süpürge ', 'Bulaşık '])[1 + i % 6] || i,
+    'SKU-' || i,
+    (random() * 100000)::numeric(10, 2),
+    'TRY',
+    jsonb_build_object('renk', (ARRAY['siyah', 'gümüş', 'beyaz'])[1 + i % 3], 'inch', 40 + i % 40),
+    false,
+    0,
+    now() - (i || ' seconds')::interval,
+    now()
+FROM generate_series(1, :rows) AS i
+"""
+
+
+def _execution_ms(conn, sql: str, params: dict) -> float:
+    plan = conn.execute(text(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}"), params).scalar_one()
+    return float(plan[0]["Execution Time"])
+
+
+def run(rows: int, repeats: int, keep: bool) -> None:
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+        conn.execute(
+            text(f"CREATE TABLE {TABLE} (LIKE products INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING INDEXES)")
+        )
+        conn.execute(text(FILL_SQL), {"rows": rows})
+        conn.execute(text(f"ANALYZE {TABLE}"))
+
+    try:
+        with engine.connect() as conn:
+            print(f"{'term':<16}{'legacy ms':>12}{'indexed ms':>12}{'speedup':>10}")
+            for term in TERMS:
+                legacy = [_execution_ms(conn, LEGACY_SQL, {"like": f"%{term}%"}) for _ in range(repeats)]
+                indexed = [
+                    _execution_ms(conn, INDEXED_SQL, {"tsquery": to_prefix_tsquery(term), "term": fold(term)})
+                    for _ in range(repeats)
+                ]
+                legacy_ms, indexed_ms = statistics.median(legacy), statistics.median(indexed)
+                print(f"{term:<16}{legacy_ms:>12.2f}{indexed_ms:>12.2f}{legacy_ms / indexed_ms:>9.1f}x")
+    finally:
+        if not keep:
+            with engine.begin() as conn:
+                conn.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--keep", action="store_true", help="scratch tabloyu silme")
+    args = parser.parse_args()
+    run(args.rows, args.repeats, args.keep)
@@ -0,0 +1,108 @@
+"""Compare response pipelines on 100-item product and review pages.
+
+Serves the same synthetic pages through three in-process route variants and times full
+requests through the ASGI stack (no database involved):
+
+    stdlib   JSONResponse + response_model validation (FastAPI default)
+    orjson   FastJSONResponse as default_response_class + response_model validation
+    trusted  FastJSONResponse returned directly, skipping response_model re-validation
+
+    python -m scripts.bench_serialization --items 100 --requests 2000
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from app.core.responses import FastJSONResponse
+from app.schemas.product import ProductSummary
+from app.schemas.review import ReviewPublic
+
+
+def product_page(count: int) -> list[dict]:
+    return [
+        {
+            "id": uuid.uuid4(),
+            "category_id": uuid.uuid4(),
+            "brand": "Arçelik",
+            "model": f"Çamaşır Makinesi {i}",
+            "sku": f"SKU-{i}",
+            "price": 12999.9 + i,
+            "currency": "TRY",
+            "specs": {"renk": "beyaz", "kapasite_kg": 9, "enerji": "A+++", "devir": 1400},
+            "is_verified": i % 2 == 0,
+            "average_rating": 4.25,
+            "review_count": 120 + i,
+        }
+        for i in range(count)
+    ]
+
+
+def review_page(count: int) -> list[dict]:
+    now = datetime.utcnow()
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "product_id": str(uuid.uuid4()),
+            "rating": 1 + i % 5,
+            "title": f"Yorum - kullanıcı {i}",
+            "body": "Sessiz çalışıyor, su tüketimi düşük. Kurulum biraz uzun sürdü. " * 4,
+            "pros": ["sessiz", "tasarruflu"],
+            "cons": ["kurulum"],
+            "created_at": now - timedelta(minutes=i),
+            "author_alias": f"Anonim Kullanıcı {i:06X}",
+        }
+        for i in range(count)
+    ]
+
+
+def _build_app(variant: str, products: list[dict], reviews: list[dict]) -> FastAPI:
+    response_class = JSONResponse if variant == "stdlib" else FastJSONResponse
+    app = FastAPI(default_response_class=response_class)
+
+    @app.get("/products", response_model=list[ProductSummary])
+    def product_page():
+        page = [ProductSummary.model_validate(item) for item in products]
+        return FastJSONResponse(page) if variant == "trusted" else page
+
+    @app.get("/reviews", response_model=list[ReviewPublic])
+    def review_page():
+        page = [ReviewPublic(**item) for item in reviews]
+        return FastJSONResponse(page) if variant == "trusted" else page
+
+    return app
+
+
+def run(items: int, requests: int) -> None:
+    products, reviews = product_page(items), review_page(items)
+    print(f"{'variant':<10}{'page':<10}{'median ms':>12}{'p99 ms':>10}{'req/s':>10}")
+    for variant in ("stdlib", "orjson", "trusted"):
+        client = TestClient(_build_app(variant, products, reviews))
+        for path in ("/products", "/reviews"):
+            client.get(path).raise_for_status()  # ısınma
+            samples = []
+            for _ in range(requests):
+                started = time.perf_counter()
+                client.get(path)
+                samples.append((time.perf_counter() - started) * 1000)
+            samples.sort()
+            p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+            print(
+                f"{variant:<10}{path:<10}{statistics.median(samples):>12.3f}{p99:>10.3f}"
+                f"{1000 / statistics.fmean(samples):>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    run(args.items, args.requests)
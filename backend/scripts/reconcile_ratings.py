@@ -0,0 +1,41 @@
+"""Reconcile incrementally maintained product rating aggregates with the review table.
+
+Run periodically (cron, systemd timer) to repair any drift:
+
+    python -m scripts.reconcile_ratings
+    python -m scripts.reconcile_ratings --interval 3600   # run forever, once an hour
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+
+from app.crud import product as product_crud
+from app.db.session import SessionLocal
+
+logger = logging.getLogger("yorumator.reconcile_ratings")
+
+
+def run() -> int:
+    session = SessionLocal()
+    try:
+        fixed = product_crud.reconcile_rating_aggregates(session)
+    finally:
+        session.close()
+    if fixed:
+        logger.warning("Rating aggregates drifted for %s products; reconciled", fixed)
+    return fixed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--interval", type=int, default=None, help="saniye cinsinden tekrar aralığı")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    while True:
+        print(f"Reconciled {run()} products.")
+        if not args.interval:
+            break
+        time.sleep(args.interval)
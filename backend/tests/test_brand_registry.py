@@ -0,0 +1,38 @@
+"""Marka kaydı katalog sürümü (adet, max(updated_at)) değişince yeniden kurulur."""
+import uuid
+
+import pytest
+
+from app.models.category import Category
+from app.models.product import Product
+from app.services import brand_registry
+
+
+@pytest.fixture
+def catalog(db, monkeypatch):
+    monkeypatch.setattr(brand_registry._cache, "check_interval", 0.0)
+    brand_registry.invalidate()
+    category = Category(name="Telefon", slug=f"telefon-{uuid.uuid4().hex[:8]}")
+    db.add(category)
+    db.flush()
+    products = [
+        Product(category_id=category.id, brand=brand, model=f"Model {uuid.uuid4().hex[:8]}")
+        for brand in ("Apple", "Apple", "Samsung")
+    ]
+    db.add_all(products)
+    db.commit()
+    yield products
+    brand_registry.invalidate()
+
+
+def _counts(db) -> dict[str, int]:
+    return {item["brand"]: item["product_count"] for item in brand_registry.get_registry(db).brand_counts()}
+
+
+def test_deleting_a_product_refreshes_brand_counts(db, catalog):
+    assert _counts(db) == {"Apple": 2, "Samsung": 1}
+
+    # En eski ürünün silinmesi max(updated_at)'i değiştirmez; sürümdeki adet değişir
+    db.delete(catalog[0])
+    db.commit()
+    assert _counts(db) == {"Apple": 1, "Samsung": 1}
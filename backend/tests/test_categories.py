@@ -0,0 +1,30 @@
+"""Kategori listesinin doğrulayıcıları sayfaya (skip/limit) özgüdür."""
+import uuid
+
+from app.models.category import Category
+
+
+def test_category_pages_have_distinct_etags(db, client):
+    db.add_all(Category(name=f"Kategori {i}", slug=f"kategori-{uuid.uuid4().hex[:8]}") for i in range(2))
+    db.commit()
+
+    first = client.get("/api/v1/categories/", params={"skip": 0, "limit": 1})
+    second = client.get("/api/v1/categories/", params={"skip": 1, "limit": 1})
+    assert first.status_code == second.status_code == 200
+    assert first.headers["etag"] != second.headers["etag"]
+
+    # Bir sayfanın ETag'i başka bir sayfa için 304 döndürmemeli
+    cross = client.get(
+        "/api/v1/categories/",
+        params={"skip": 1, "limit": 1},
+        headers={"If-None-Match": first.headers["etag"]},
+    )
+    assert cross.status_code == 200
+    assert cross.json() == second.json()
+
+    same = client.get(
+        "/api/v1/categories/",
+        params={"skip": 0, "limit": 1},
+        headers={"If-None-Match": first.headers["etag"]},
+    )
+    assert same.status_code == 304
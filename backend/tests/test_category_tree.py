@@ -0,0 +1,108 @@
+"""Kategori ağacı: alt ağaç id'leri, slug yolları, bozuk veri (döngü, yetim kayıt) ve sürüm yenilemesi."""
+import uuid
+from collections import namedtuple
+
+import pytest
+
+from app.models.category import Category
+from app.services import category_tree
+from app.services.category_tree import CategoryTree
+
+Row = namedtuple("Row", "id parent_id name slug")
+
+
+def _row(slug: str, parent: Row | None = None, parent_id: uuid.UUID | None = None) -> Row:
+    return Row(uuid.uuid4(), parent.id if parent else parent_id, slug.title(), slug)
+
+
+@pytest.fixture
+def rows():
+    elektronik = _row("elektronik")
+    telefon = _row("telefon", elektronik)
+    akilli = _row("akilli-telefon", telefon)
+    kilif = _row("kilif", telefon)
+    bilgisayar = _row("bilgisayar", elektronik)
+    kitap = _row("kitap")
+    return {row.slug: row for row in (elektronik, telefon, akilli, kilif, bilgisayar, kitap)}
+
+
+def test_subtree_ids_include_all_descendants(rows):
+    tree = CategoryTree(list(rows.values()), (6, None))
+    ids = {slug: row.id for slug, row in rows.items()}
+
+    assert tree.subtree_ids(ids["elektronik"]) == {
+        ids["elektronik"], ids["telefon"], ids["akilli-telefon"], ids["kilif"], ids["bilgisayar"]
+    }
+    assert tree.subtree_ids(ids["telefon"]) == {ids["telefon"], ids["akilli-telefon"], ids["kilif"]}
+    assert tree.subtree_ids(ids["kilif"]) == {ids["kilif"]}
+    unknown = uuid.uuid4()
+    assert tree.subtree_ids(unknown) == {unknown}
+
+
+def test_paths_and_nested_nodes(rows):
+    tree = CategoryTree(list(rows.values()), (6, None))
+
+    assert tree.paths[rows["akilli-telefon"].id] == "elektronik/telefon/akilli-telefon"
+    assert tree.paths[rows["kitap"].id] == "kitap"
+    assert [root["slug"] for root in tree.roots] == ["elektronik", "kitap"]
+    telefon = tree.roots[0]["children"][0]
+    assert telefon["path"] == "elektronik/telefon"
+    assert telefon["parent_id"] == str(rows["elektronik"].id)
+    assert [child["slug"] for child in telefon["children"]] == ["akilli-telefon", "kilif"]
+
+
+def test_orphan_becomes_root_with_its_subtree():
+    orphan = _row("yetim", parent_id=uuid.uuid4())  # üst kategorisi silinmiş
+    child = _row("alt", orphan)
+    tree = CategoryTree([orphan, child], (2, None))
+
+    assert [root["slug"] for root in tree.roots] == ["yetim"]
+    assert tree.paths[child.id] == "yetim/alt"
+    assert tree.subtree_ids(orphan.id) == {orphan.id, child.id}
+
+
+def test_parent_cycle_is_broken_instead_of_dropped():
+    root = _row("kok")
+    a_id, b_id = uuid.uuid4(), uuid.uuid4()
+    a = Row(a_id, b_id, "A", "a")
+    b = Row(b_id, a_id, "B", "b")
+    tree = CategoryTree([root, a, b], (3, None))
+
+    # Döngü ilk kayıtta (a) kırılır; iki kayıt da ağaçta kalır
+    assert [node["slug"] for node in tree.roots] == ["kok", "a"]
+    assert tree.paths[b_id] == "a/b"
+    assert tree.subtree_ids(a_id) == {a_id, b_id}
+    assert tree.subtree_ids(b_id) == {b_id}
+
+
+def test_self_parent_is_a_root():
+    row = _row("kendi")
+    looped = row._replace(parent_id=row.id)
+    tree = CategoryTree([looped], (1, None))
+    assert tree.paths[row.id] == "kendi"
+    assert tree.subtree_ids(row.id) == {row.id}
+
+
+@pytest.fixture
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(category_tree._cache, "check_interval", 0.0)
+    category_tree.invalidate()
+    yield
+    category_tree.invalidate()
+
+
+def test_tree_rebuilds_when_version_changes(db, fresh_cache):
+    parent = Category(name="Ev", slug=f"ev-{uuid.uuid4().hex[:8]}")
+    db.add(parent)
+    db.commit()
+    tree = category_tree.get_tree(db)
+    assert tree.subtree_ids(parent.id) == {parent.id}
+    assert category_tree.get_tree(db) is tree
+
+    child = Category(name="Mutfak", slug=f"mutfak-{uuid.uuid4().hex[:8]}", parent_id=parent.id)
+    db.add(child)
+    db.commit()
+    rebuilt = category_tree.get_tree(db)
+    assert rebuilt is not tree
+    assert rebuilt.subtree_ids(parent.id) == {parent.id, child.id}
+    assert rebuilt.paths[child.id] == f"{parent.slug}/{child.slug}"
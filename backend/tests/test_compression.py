@@ -0,0 +1,41 @@
+"""Sıkıştırma katmanı uygulamanın Vary başlığını korur."""
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, add_vary
+
+
+def test_add_vary_merges_into_existing_header():
+    headers = [(b"content-type", b"application/json"), (b"vary", b"Authorization")]
+    add_vary(headers, b"Accept-Encoding")
+    assert headers == [(b"content-type", b"application/json"), (b"vary", b"Authorization, Accept-Encoding")]
+
+    add_vary(headers, b"accept-encoding")
+    assert headers[1] == (b"vary", b"Authorization, Accept-Encoding")
+
+
+def test_add_vary_keeps_wildcard_and_creates_missing_header():
+    wildcard = [(b"vary", b"*")]
+    add_vary(wildcard, b"Accept-Encoding")
+    assert wildcard == [(b"vary", b"*")]
+
+    empty: list[tuple[bytes, bytes]] = []
+    add_vary(empty, b"Accept-Encoding")
+    assert empty == [(b"vary", b"Accept-Encoding")]
+
+
+def _client(body_size: int) -> TestClient:
+    async def endpoint(request):
+        return JSONResponse({"data": "x" * body_size}, headers={"Vary": "Authorization"})
+
+    app = Starlette(routes=[Route("/", endpoint)])
+    return TestClient(CompressionMiddleware(app, minimum_size=1024))
+
+
+def test_single_vary_header_on_compressed_and_small_responses():
+    for body_size in (10, 4096):
+        response = _client(body_size).get("/", headers={"Accept-Encoding": "gzip"})
+        vary = [value for key, value in response.headers.raw if key.lower() == b"vary"]
+        assert vary == [b"Authorization, Accept-Encoding"]
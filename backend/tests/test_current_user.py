@@ -0,0 +1,31 @@
+"""get_current_user önbelleği yalnızca kimlik alanlarını tutar; profil her istekte güncel satırdan gelir."""
+import uuid
+
+from app.api import deps
+from app.core.security import create_access_token
+from app.models.user import User
+
+
+def test_cached_identity_does_not_serve_stale_profile(client, db):
+    user = User(email=f"{uuid.uuid4().hex}@example.com", password_hash="x", full_name="Eski Ad")
+    db.add(user)
+    db.commit()
+    headers = {"Authorization": f"Bearer {create_access_token(str(user.id))}"}
+
+    assert client.get("/api/v1/users/me", headers=headers).json()["full_name"] == "Eski Ad"
+    assert deps.user_cache.get(str(user.id)) is not None
+
+    # invalidate_cached_user çağrılmadan yapılan profil değişikliği de hemen görünür
+    user.full_name = "Yeni Ad"
+    db.commit()
+    assert client.get("/api/v1/users/me", headers=headers).json()["full_name"] == "Yeni Ad"
+
+
+def test_cached_identity_holds_only_auth_fields():
+    assert set(deps.CurrentUser.__dataclass_fields__) == {
+        "id",
+        "is_active",
+        "is_superuser",
+        "two_factor_enabled",
+        "deleted_at",
+    }
@@ -0,0 +1,84 @@
+"""GET /users/me/favorites sorgu sayısı: favori sayısından bağımsız, sayfa başına tek SELECT."""
+import uuid
+
+import pytest
+
+from app.api import deps
+from app.core import querylog
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.main import app
+from app.models.category import Category
+from app.models.favorite import FavoriteProduct
+from app.models.product import Product
+from app.models.user import User
+
+
+def _user(db) -> User:
+    user = User(email=f"{uuid.uuid4().hex}@example.com", password_hash="x")
+    db.add(user)
+    db.flush()
+    return user
+
+
+def _favorites(db, user: User, count: int) -> None:
+    category = Category(name="Telefon", slug=f"telefon-{uuid.uuid4().hex[:8]}")
+    db.add(category)
+    db.flush()
+    for _ in range(count):
+        product = Product(category_id=category.id, brand="Marka", model=f"Model {uuid.uuid4().hex[:8]}")
+        db.add(product)
+        db.flush()
+        db.add(FavoriteProduct(user_id=user.id, product_id=product.id))
+    db.commit()
+
+
+@pytest.fixture
+def as_user(db):
+    user = _user(db)
+    current_user = deps.CurrentUser.from_model(user)
+    app.dependency_overrides[deps.get_current_user] = lambda: current_user
+    return user
+
+
+def _selects(log: querylog.QueryLog) -> int:
+    return sum(1 for record in log.records if record.fingerprint.upper().startswith("SELECT"))
+
+
+def _page_queries(client, **params) -> tuple[int, int, object]:
+    with querylog.capture() as log:
+        response = client.get("/api/v1/users/me/favorites", params=params)
+    assert response.status_code == 200, response.text
+    return log.query_count, _selects(log), response
+
+
+@pytest.mark.parametrize("count", [1, 25])
+def test_favorites_page_is_one_select(client, db, as_user, query_budget, count):
+    _favorites(db, as_user, count)
+    with query_budget(max_queries=3, repeat_threshold=2):
+        response = client.get("/api/v1/users/me/favorites")
+    assert len(response.json()) == count
+    assert all(item["product"]["model"].startswith("Model") for item in response.json())
+
+
+def test_favorites_query_count_does_not_grow_with_favorites(client, db, as_user):
+    _favorites(db, as_user, 1)
+    one = _page_queries(client)
+    _favorites(db, as_user, 30)
+    many = _page_queries(client)
+
+    assert len(many[2].json()) == 31
+    assert one[:2] == many[:2]
+    assert many[1] == 1
+
+
+def test_favorites_cursor_page_is_one_select(client, db, as_user):
+    _favorites(db, as_user, 12)
+    first_total, first_selects, first = _page_queries(client, limit=5)
+    cursor = first.headers[NEXT_CURSOR_HEADER]
+    next_total, next_selects, following = _page_queries(client, limit=5, cursor=cursor)
+
+    assert first_selects == next_selects == 1
+    assert first_total == next_total
+    first_ids = {item["id"] for item in first.json()}
+    assert len(following.json()) == 5
+    assert first_ids.isdisjoint(item["id"] for item in following.json())
@@ -0,0 +1,246 @@
+"""İçe aktarım checkpoint'leri ve kaldığı yerden devam; veritabanı gerektirmez."""
+import copy
+import io
+import json
+import uuid
+from datetime import datetime
+
+import pytest
+
+from app.crud import import_job as import_job_crud
+from app.models.import_job import ImportJob, ImportJobStatusEnum
+from app.services import importer
+from app.services.importer import Checkpoint
+
+CATEGORY_ID = uuid.uuid4()
+
+CSV_HEADER = "brand,model,category,specs_json\n"
+CSV_ROWS = [
+    'Apple,iPhone 15,telefon,"{""renk"": ""siyah""}"\n',
+    'Samsung,"Galaxy\nS24",telefon,\n',  # tırnak içinde satır sonu: tek kayıt, iki fiziksel satır
+    "Xiaomi,Redmi Note 13,telefon,\n",
+    "Nokia,\"3310\n(2017)\",telefon,\n",
+    "Oppo,Reno 11,telefon,\n",
+]
+
+
+def _csv_bytes(bom: bool = True) -> bytes:
+    return ("﻿" if bom else "").encode("utf-8") + (CSV_HEADER + "".join(CSV_ROWS)).encode("utf-8")
+
+
+def _jsonl_bytes() -> bytes:
+    lines = [
+        json.dumps({"brand": "Apple", "model": "iPhone 15", "category": "telefon"}, ensure_ascii=False),
+        "",
+        json.dumps({"product": {"brand": "Şahin", "model": "Çağ 1", "category": "telefon"}, "source": "x"}),
+        json.dumps({"brand": "Oppo", "model": "Reno 11", "category": "telefon"}),
+    ]
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _record_offsets(records) -> list[tuple[int, int]]:
+    # _TrackedLines paylaşılır; konum kayıt verildiği anda okunmalı
+    return [(lines.offset, lines.line) for lines, _ in records]
+
+
+def _records(records) -> list[tuple[Checkpoint, dict]]:
+    return [(lines.checkpoint(), values) for lines, values in records]
+
+
+def _expected_offsets(data: bytes, record_ends: list[bytes]) -> list[int]:
+    """Her kaydın son baytından hemen sonraki ofset."""
+    offsets, position = [], 0
+    for end in record_ends:
+        position = data.index(end, position) + len(end)
+        offsets.append(position)
+    return offsets
+
+
+def test_csv_checkpoints_follow_record_ends_with_bom_and_multiline_fields():
+    data = _csv_bytes()
+    offsets = _record_offsets(importer._csv_records(io.BytesIO(data), Checkpoint()))
+    assert [offset for offset, _ in offsets] == _expected_offsets(data, [row.encode() for row in CSV_ROWS])
+    # Fiziksel satır numaraları: başlık 1, çok satırlı kayıtlar iki satır tüketir
+    assert [line for _, line in offsets] == [2, 4, 5, 7, 8]
+    assert offsets[-1][0] == len(data)
+
+
+def test_csv_bom_is_stripped_from_header():
+    records = _records(importer._csv_records(io.BytesIO(_csv_bytes()), Checkpoint()))
+    assert records[0][1]["brand"] == "Apple"
+    assert records[0][1]["specs"] == {"renk": "siyah"}
+    assert records[1][1]["model"] == "Galaxy\nS24"
+
+
+def test_csv_resume_reads_header_then_continues_from_checkpoint():
+    data = _csv_bytes()
+    offset, line = _record_offsets(importer._csv_records(io.BytesIO(data), Checkpoint()))[1]
+    resumed = _records(importer._csv_records(io.BytesIO(data), Checkpoint(offset, line)))
+    assert [values["brand"] for _, values in resumed] == ["Xiaomi", "Nokia", "Oppo"]
+    assert resumed[0][0].line == 5
+    assert resumed[-1][0] == Checkpoint(len(data), 8)
+
+
+def test_jsonl_checkpoints_skip_blank_lines_and_count_utf8_bytes():
+    data = _jsonl_bytes()
+    records = _records(importer._jsonl_records(io.BytesIO(data), Checkpoint()))
+    ends = [line.encode("utf-8") + b"\n" for line in data.decode("utf-8").split("\n") if line]
+    assert [checkpoint.offset for checkpoint, _ in records] == _expected_offsets(data, ends)
+    assert [checkpoint.line for checkpoint, _ in records] == [1, 3, 4]
+    assert records[1][1] == {"brand": "Şahin", "model": "Çağ 1", "category": "telefon", "source": "x"}
+
+    resumed = _records(importer._jsonl_records(io.BytesIO(data), records[0][0]))
+    assert [values["brand"] for _, values in resumed] == ["Şahin", "Oppo"]
+
+
+class _CrashingSession:
+    """Yalnızca importer'ın kullandığı kadarı: kategori sorgusu, upsert, commit/rollback.
+
+    Yazılan satırlar commit'e kadar bekletilir; ``crash_on_commit``'inci commit çökmeyi taklit eder.
+    """
+
+    def __init__(self, committed: list[dict], crash_on_commit: int | None = None):
+        self.committed = committed
+        self.pending: list[dict] = []
+        self.commits = 0
+        self.crash_on_commit = crash_on_commit
+
+    def execute(self, statement, rows=None):
+        if rows is None:
+            return [(CATEGORY_ID, "telefon", "Telefon")]
+        self.pending.extend(rows)
+        return [(True,) for _ in rows]
+
+    def commit(self):
+        self.commits += 1
+        if self.commits == self.crash_on_commit:
+            raise RuntimeError("worker crashed")
+        self.committed.extend(self.pending)
+        self.pending = []
+
+    def rollback(self):
+        self.pending = []
+
+
+class _Job:
+    """Checkpoint ve rapor, yalnızca içinde bulundukları commit başarılı olursa kalıcı olur."""
+
+    def __init__(self):
+        self.saved = (importer.ImportReport(format="csv"), Checkpoint())
+        self._staged = None
+
+    def on_checkpoint(self, report, checkpoint):
+        self._staged = (copy.deepcopy(report), checkpoint)
+
+    def bind(self, db: _CrashingSession) -> _CrashingSession:
+        commit = db.commit
+
+        def committing():
+            commit()
+            self.saved = self._staged
+
+        db.commit = committing
+        return db
+
+
+@pytest.mark.parametrize(
+    "fmt, data", [("csv", _csv_bytes()), ("jsonl", _jsonl_bytes())], ids=["csv", "jsonl"]
+)
+def test_resume_after_crash_imports_every_row_exactly_once(fmt, data):
+    committed: list[dict] = []
+    job = _Job()
+    with pytest.raises(RuntimeError):
+        importer.import_products(
+            job.bind(_CrashingSession(committed, crash_on_commit=2)),
+            io.BytesIO(data),
+            fmt,
+            batch_size=1,
+            on_checkpoint=job.on_checkpoint,
+        )
+    assert len(committed) == 1  # yalnızca ilk grup kalıcı
+    report, checkpoint = job.saved
+    assert checkpoint.offset > 0
+
+    report = importer.import_products(
+        job.bind(_CrashingSession(committed)),
+        io.BytesIO(data),
+        fmt,
+        batch_size=1,
+        report=copy.deepcopy(report),
+        resume_from=checkpoint,
+        on_checkpoint=job.on_checkpoint,
+    )
+    models = [row["model"] for row in committed]
+    assert len(models) == len(set(models))
+    assert report.total_rows == report.imported == len(models)
+    assert job.saved[1].offset == len(data)
+
+
+def test_record_checkpoint_roundtrips_through_job():
+    class _Db:
+        def add(self, obj):
+            self.added = obj
+
+    job = ImportJob(format="csv", file_path="/tmp/x.csv", total_bytes=100)
+    report = importer.ImportReport(format="csv", total_rows=3, imported=2, failed=1)
+    report.errors.append(importer.RowError(row=3, errors=["brand: field required"]))
+    import_job_crud.record_checkpoint(_Db(), job, report, Checkpoint(offset=60, line=4))
+
+    assert import_job_crud.checkpoint_from(job) == Checkpoint(offset=60, line=4)
+    assert import_job_crud.report_from(job) == report
+
+
+def _running_job(**overrides) -> ImportJob:
+    values = dict(
+        format="csv",
+        file_path="/tmp/x.csv",
+        status=ImportJobStatusEnum.running,
+        total_bytes=1000,
+        checkpoint_offset=600,
+        total_rows=500,
+        run_started_at=datetime(2025, 1, 1, 12, 0, 0),
+        run_start_offset=200,
+        run_start_rows=100,
+        finished_at=None,
+    )
+    values.update(overrides)
+    return ImportJob(**values)
+
+
+def test_progress_uses_this_runs_rate():
+    now = datetime(2025, 1, 1, 12, 0, 10)
+    # Bu çalıştırmada 10 sn'de 400 satır ve 400 bayt; kalan 400 bayt 10 sn sürer
+    assert import_job_crud.progress(_running_job(), now) == {
+        "percent": 60.0,
+        "rows_per_second": 40.0,
+        "eta_seconds": 10.0,
+    }
+
+
+def test_progress_without_eta():
+    now = datetime(2025, 1, 1, 12, 0, 10)
+    finished = _running_job(
+        status=ImportJobStatusEnum.completed,
+        checkpoint_offset=1000,
+        finished_at=datetime(2025, 1, 1, 12, 0, 20),
+    )
+    assert import_job_crud.progress(finished, now) == {
+        "percent": 100.0,
+        "rows_per_second": 20.0,
+        "eta_seconds": None,
+    }
+
+    queued = _running_job(status=ImportJobStatusEnum.queued, run_started_at=None, checkpoint_offset=0)
+    assert import_job_crud.progress(queued, now) == {
+        "percent": 0.0,
+        "rows_per_second": None,
+        "eta_seconds": None,
+    }
+
+    # Boş dosya tamamlanmış sayılır; sıfır süreden hız hesaplanmaz
+    empty = _running_job(total_bytes=0, checkpoint_offset=0, run_started_at=now)
+    assert import_job_crud.progress(empty, now) == {
+        "percent": 100.0,
+        "rows_per_second": None,
+        "eta_seconds": None,
+    }
@@ -0,0 +1,30 @@
+"""Havuz anlık görüntüsü yalnızca QueuePool'un herkese açık API'sini ve havuzun kendi ayarlarını kullanır."""
+import sqlite3
+
+from app.db import pool_metrics
+
+
+def test_snapshot_reports_overflow_and_pool_max_overflow():
+    pool = pool_metrics.InstrumentedQueuePool(
+        lambda: sqlite3.connect(":memory:", check_same_thread=False),
+        pool_size=1,
+        max_overflow=3,
+        logging_name="test-snapshot",
+    )
+    first, second = pool.connect(), pool.connect()
+    try:
+        stats = pool_metrics.snapshot()["test-snapshot"]
+        assert stats["in_use"] == 2
+        assert stats["overflow"] == 1
+        assert stats["max_overflow"] == 3
+        assert stats["checkouts"] == 2
+
+        # engine.dispose() havuzu aynı ayarlarla yeniden kurar
+        assert pool.recreate().configured_max_overflow == 3
+    finally:
+        first.close()
+        second.close()
+        pool.dispose()
+        with pool_metrics._registry_lock:
+            pool_metrics._pools.pop("test-snapshot", None)
+            pool_metrics._stats.pop("test-snapshot", None)
@@ -0,0 +1,93 @@
+"""Ürün sayfası: önce ürün yüklenir, bölümler en fazla iki okuma oturumuna dağıtılır."""
+import uuid
+
+import pytest
+
+from app.api import deps
+from app.core import querylog
+from app.db import replicas
+from app.main import app
+from app.models.category import Category
+from app.models.favorite import FavoriteProduct
+from app.models.product import Product
+from app.models.question import Question
+from app.models.review import Review, ReviewStatusEnum
+from app.models.user import User
+
+
+@pytest.fixture
+def page_data(committed_db):
+    suffix = uuid.uuid4().hex[:8]
+    user = User(email=f"sayfa-{suffix}@example.com", password_hash="x", full_name="Ali Kaya")
+    category = Category(name="Telefon", slug=f"telefon-{suffix}")
+    committed_db.add_all([user, category])
+    committed_db.flush()
+    product = Product(category_id=category.id, brand="Apple", model=f"Model {suffix}")
+    committed_db.add(product)
+    committed_db.flush()
+    committed_db.add(
+        Review(
+            product_id=product.id,
+            user_id=user.id,
+            rating=5,
+            title="Güzel",
+            body="İyi",
+            pros=[],
+            cons=[],
+            status=ReviewStatusEnum.approved,
+        )
+    )
+    committed_db.add(Question(product_id=product.id, user_id=user.id, question_text="Şarj süresi?"))
+    committed_db.commit()
+    return product, user
+
+
+@pytest.fixture
+def opened_sessions(async_client, monkeypatch):
+    opened = []
+    read_session = replicas.async_read_session
+
+    async def counting(pinned_to_primary: bool):
+        opened.append(pinned_to_primary)
+        return await read_session(pinned_to_primary)
+
+    monkeypatch.setattr(replicas, "async_read_session", counting)
+    return opened
+
+
+def test_page_uses_two_read_sessions(async_client, opened_sessions, page_data):
+    product, _ = page_data
+    response = async_client.get(f"/api/v1/products/{product.id}/page")
+    assert response.status_code == 200
+    page = response.json()
+    assert page["product"]["id"] == str(product.id)
+    assert [review["title"] for review in page["reviews"]] == ["Güzel"]
+    assert len(page["review_likes"]) == 1
+    assert [question["question_text"] for question in page["questions"]] == ["Şarj süresi?"]
+    assert page["is_favorite"] is None  # anonim ziyaretçi
+    assert len(opened_sessions) == 2
+
+
+def test_unknown_product_is_404_before_sections(async_client, opened_sessions, migrated_engine):
+    with querylog.capture() as log:
+        response = async_client.get(f"/api/v1/products/{uuid.uuid4()}/page")
+    assert response.status_code == 404
+    assert log.query_count == 1
+    assert len(opened_sessions) == 1
+
+
+def test_signed_in_page_includes_favorite(async_client, opened_sessions, page_data, committed_db):
+    product, user = page_data
+    committed_db.add(FavoriteProduct(user_id=user.id, product_id=product.id))
+    committed_db.commit()
+    current_user = deps.CurrentUser.from_model(user)
+    app.dependency_overrides[deps.get_current_user_optional_async] = lambda: current_user
+    try:
+        with querylog.capture() as log:
+            page = async_client.get(f"/api/v1/products/{product.id}/page").json()
+    finally:
+        app.dependency_overrides.clear()
+    assert page["is_favorite"] is True
+    assert page["review_likes"][0]["user_like_status"] is None
+    assert log.query_count <= 6
+    assert len(opened_sessions) == 2
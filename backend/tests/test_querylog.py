@@ -0,0 +1,36 @@
+"""Sorgu logu, async oturumlarda da sorguyu tetikleyen app/ satırını gösterir."""
+import asyncio
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core import querylog
+from app.crud import product as product_crud
+from app.db.session import DATABASE_URL
+
+
+def test_fingerprint_strips_literals_and_in_lists():
+    shape = querylog.fingerprint("SELECT * FROM p WHERE id IN (%(id_1)s, %(id_2)s) AND name = 'x' LIMIT 10")
+    assert shape == "SELECT * FROM p WHERE id IN (?...) AND name = ? LIMIT ?"
+
+
+def test_sync_query_call_site(db):
+    with querylog.capture() as log:
+        product_crud.get(db, str(uuid.uuid4()))
+    assert log.records[0].call_site.startswith("crud/product.py:")
+
+
+def test_async_query_call_site(migrated_engine):
+    async def run():
+        engine = create_async_engine(DATABASE_URL, poolclass=NullPool)
+        try:
+            async with AsyncSession(engine) as session:
+                with querylog.capture() as log:
+                    await product_crud.get_async(session, str(uuid.uuid4()))
+        finally:
+            await engine.dispose()
+        return log
+
+    log = asyncio.run(run())
+    assert [record.call_site.split(":")[0] for record in log.records] == ["crud/product.py"]
@@ -0,0 +1,181 @@
+"""Okuma replikası seçimi: round-robin, gecikmeye göre rotasyondan çıkarma/geri alma, primary'ye düşüş."""
+import itertools
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from app.core.security import create_access_token
+from app.db import replicas
+
+
+class _FakeEngine:
+    """LAG_SQL'e ``lag`` ile yanıt veren (veya ``fail`` ise bağlantı hatası veren) replika motoru."""
+
+    def __init__(self):
+        self.lag = 0.0
+        self.fail = False
+        self.checks = 0
+
+    def _result(self):
+        self.checks += 1
+        if self.fail:
+            raise ConnectionError("replica unreachable")
+        return SimpleNamespace(scalar_one=lambda: self.lag)
+
+    def connect(self):
+        engine = self
+
+        class _Connection:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def execute(self, statement):
+                return engine._result()
+
+        return _Connection()
+
+
+class _FakeAsyncEngine(_FakeEngine):
+    def connect(self):
+        connection = super().connect()
+        sync_execute = connection.execute
+
+        async def execute(statement):
+            return sync_execute(statement)
+
+        connection.execute = execute
+        return connection
+
+
+def _replica(name: str) -> replicas.Replica:
+    return replicas.Replica(
+        name=name,
+        engine=_FakeEngine(),
+        async_engine=_FakeAsyncEngine(),
+        session_factory=lambda: f"session:{name}",
+        async_session_factory=lambda: f"async-session:{name}",
+    )
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    stubs = [_replica(f"replica-{index}") for index in range(3)]
+    monkeypatch.setattr(replicas, "replicas", stubs)
+    monkeypatch.setattr(replicas, "_round_robin", itertools.cycle(stubs))
+    monkeypatch.setattr(replicas, "SessionLocal", lambda: "session:primary")
+    monkeypatch.setattr(replicas, "AsyncSessionLocal", lambda: "async-session:primary")
+    monkeypatch.setattr(replicas.settings, "db_replica_max_lag_seconds", 5.0)
+    # Her seçimde gecikme yeniden ölçülür
+    monkeypatch.setattr(replicas.settings, "db_replica_lag_check_interval_seconds", 0.0)
+    return stubs
+
+
+def _picks(count: int) -> list[str]:
+    return [replicas.read_session(False) for _ in range(count)]
+
+
+def test_reads_rotate_round_robin(pool):
+    assert _picks(4) == ["session:replica-0", "session:replica-1", "session:replica-2", "session:replica-0"]
+
+
+def test_lagging_replica_leaves_and_rejoins_rotation(pool):
+    pool[1].engine.lag = 30.0
+    assert _picks(4) == ["session:replica-0", "session:replica-2", "session:replica-0", "session:replica-2"]
+    assert pool[1].healthy is False
+    assert replicas.status()[1]["lag_seconds"] == 30.0
+
+    pool[1].engine.lag = 0.5
+    assert "session:replica-1" in _picks(3)
+    assert pool[1].healthy is True
+
+
+def test_unreachable_replica_is_evicted(pool):
+    pool[0].engine.fail = True
+    assert _picks(2) == ["session:replica-1", "session:replica-2"]
+    assert pool[0].healthy is False
+    assert pool[0].lag_seconds is None
+
+
+def test_falls_back_to_primary_when_no_replica_is_healthy(pool):
+    for replica in pool:
+        replica.engine.lag = 60.0
+    assert _picks(2) == ["session:primary", "session:primary"]
+
+
+def test_pinned_reads_go_to_primary_without_lag_checks(pool):
+    assert replicas.read_session(True) == "session:primary"
+    assert all(replica.engine.checks == 0 for replica in pool)
+
+
+def test_lag_is_checked_at_most_once_per_interval(pool, monkeypatch):
+    monkeypatch.setattr(replicas.settings, "db_replica_lag_check_interval_seconds", 60.0)
+    _picks(6)
+    assert [replica.engine.checks for replica in pool] == [1, 1, 1]
+
+
+def test_async_reads_use_the_same_rotation(pool):
+    import asyncio
+
+    pool[0].async_engine.lag = 30.0
+
+    async def picks():
+        return [await replicas.async_read_session(False) for _ in range(2)]
+
+    assert asyncio.run(picks()) == ["async-session:replica-1", "async-session:replica-2"]
+
+
+def _request(headers: dict[str, str] | None = None) -> Request:
+    raw = [(key.lower().encode("latin-1"), value.encode("latin-1")) for key, value in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+@pytest.fixture
+def writes_client():
+    app = FastAPI()
+    app.add_middleware(replicas.ReadYourWritesMiddleware)
+
+    @app.post("/write")
+    def write():
+        return {"ok": True}
+
+    @app.post("/reject")
+    def reject():
+        from fastapi import HTTPException
+
+        raise HTTPException(status_code=400)
+
+    return TestClient(app)
+
+
+def test_successful_write_pins_bearer_user_and_sets_cookie(writes_client):
+    token = create_access_token(str(uuid.uuid4()))
+    auth = {"Authorization": f"Bearer {token}"}
+    assert not replicas.is_pinned(_request(auth))
+
+    response = writes_client.post("/write", headers=auth)
+    assert replicas.PRIMARY_PIN_COOKIE in response.cookies
+    # Çerezi saklamayan istemci de token'ıyla primary'ye sabitlenir
+    assert replicas.is_pinned(_request(auth))
+    assert replicas.is_pinned(_request({"Cookie": f"{replicas.PRIMARY_PIN_COOKIE}=1"}))
+    assert not replicas.is_pinned(_request({"Authorization": f"Bearer {create_access_token(str(uuid.uuid4()))}"}))
+
+
+def test_failed_write_does_not_pin(writes_client):
+    auth = {"Authorization": f"Bearer {create_access_token(str(uuid.uuid4()))}"}
+    response = writes_client.post("/reject", headers=auth)
+    assert response.status_code == 400
+    assert replicas.PRIMARY_PIN_COOKIE not in response.cookies
+    assert not replicas.is_pinned(_request(auth))
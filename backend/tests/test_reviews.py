@@ -0,0 +1,66 @@
+"""Ürün yorumları listesinin doğrulayıcıları sayfaya (skip/limit) ve alan seçimine (fields) özgüdür."""
+import uuid
+
+import pytest
+
+from app.models.category import Category
+from app.models.product import Product
+from app.models.review import Review, ReviewStatusEnum
+from app.models.user import User
+
+
+@pytest.fixture
+def product(committed_db):
+    suffix = uuid.uuid4().hex[:8]
+    user = User(email=f"yorumcu-{suffix}@example.com", password_hash="x", full_name="Ayşe Yılmaz")
+    category = Category(name="Telefon", slug=f"telefon-{suffix}")
+    committed_db.add_all([user, category])
+    committed_db.flush()
+    product = Product(category_id=category.id, brand="Apple", model=f"Model {suffix}")
+    committed_db.add(product)
+    committed_db.flush()
+    committed_db.add_all(
+        Review(
+            product_id=product.id,
+            user_id=user.id,
+            rating=5 - i,
+            title=f"Yorum {i}",
+            body="İyi",
+            pros=[],
+            cons=[],
+            status=ReviewStatusEnum.approved,
+        )
+        for i in range(2)
+    )
+    committed_db.commit()
+    return product
+
+
+def _get(client, product, etag=None, **params):
+    headers = {"If-None-Match": etag} if etag else {}
+    return client.get(f"/api/v1/products/{product.id}/reviews", params=params, headers=headers)
+
+
+def test_review_pages_have_distinct_etags(async_client, product):
+    first = _get(async_client, product, skip=0, limit=1)
+    second = _get(async_client, product, skip=1, limit=1)
+    assert first.status_code == second.status_code == 200
+    assert first.headers["etag"] != second.headers["etag"]
+
+    # Bir sayfanın ETag'i başka bir sayfa için 304 döndürmemeli
+    cross = _get(async_client, product, first.headers["etag"], skip=1, limit=1)
+    assert cross.status_code == 200
+    assert cross.json() == second.json()
+
+    assert _get(async_client, product, first.headers["etag"], skip=0, limit=1).status_code == 304
+
+
+def test_field_selection_has_its_own_etag(async_client, product):
+    full = _get(async_client, product)
+    partial = _get(async_client, product, fields="rating")
+    assert full.headers["etag"] != partial.headers["etag"]
+    assert set(partial.json()[0]) == {"id", "rating"}
+
+    # Kısmi gövdenin ETag'i tam gövdeyi doğrulamamalı
+    assert _get(async_client, product, partial.headers["etag"]).status_code == 200
+    assert _get(async_client, product, partial.headers["etag"], fields="rating").status_code == 304
@@ -0,0 +1,39 @@
+"""Parola havuzu geri basıncı: kuyruk doluyken PasswordHashingBusy, event loop bloklanmaz."""
+import asyncio
+import time
+
+from app.core import security
+
+
+def _slow_verify(*_):
+    time.sleep(0.8)
+    return True
+
+
+def test_password_pool_rejects_when_queue_is_full(monkeypatch):
+    monkeypatch.setattr(security.pwd_context, "verify", _slow_verify)
+    monkeypatch.setattr(security.settings, "password_hash_queue_size", 0)
+    monkeypatch.setattr(security.settings, "password_hash_queue_timeout_seconds", 0.2)
+    slots = security.settings.password_hash_workers
+
+    async def burst():
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.05)
+                ticks += 1
+
+        beat = asyncio.create_task(heartbeat())
+        results = await asyncio.gather(
+            *(security.verify_password_async("secret", "hash") for _ in range(slots + 2)),
+            return_exceptions=True,
+        )
+        beat.cancel()
+        return results, ticks
+
+    results, ticks = asyncio.run(burst())
+    assert results.count(True) == slots
+    assert sum(isinstance(result, security.PasswordHashingBusy) for result in results) == 2
+    assert ticks >= 10  # Argon2 çalışırken loop diğer işleri yürütmeye devam etti